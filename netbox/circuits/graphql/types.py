@@ -6,6 +6,7 @@ import strawberry_django
 from circuits import models
 from dcim.graphql.mixins import CabledObjectMixin
 from extras.graphql.mixins import ContactsMixin, CustomFieldsMixin, TagsMixin
+from netbox.graphql.optimizer import prefetch_generic_foreign_key
 from netbox.graphql.types import BaseObjectType, NetBoxObjectType, ObjectType, OrganizationalObjectType
 from tenancy.graphql.types import TenantType
 from .filters import *
@@ -68,7 +69,10 @@ class ProviderNetworkType(NetBoxObjectType):
 class CircuitTerminationType(CustomFieldsMixin, TagsMixin, CabledObjectMixin, ObjectType):
     circuit: Annotated["CircuitType", strawberry.lazy('circuits.graphql.types')]
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['termination_type', 'termination_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.CircuitTermination, 'termination')]
+    )
     def termination(self) -> Annotated[Union[
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RegionType", strawberry.lazy('dcim.graphql.types')],
@@ -123,7 +127,10 @@ class CircuitGroupType(OrganizationalObjectType):
 class CircuitGroupAssignmentType(TagsMixin, BaseObjectType):
     group: Annotated["CircuitGroupType", strawberry.lazy('circuits.graphql.types')]
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['member_type', 'member_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.CircuitGroupAssignment, 'member')]
+    )
     def member(self) -> Annotated[Union[
         Annotated["CircuitType", strawberry.lazy('circuits.graphql.types')],
         Annotated["VirtualCircuitType", strawberry.lazy('circuits.graphql.types')],
@@ -1,16 +1,79 @@
+import json
 import logging
 import requests
 import sys
+import time
+from contextlib import ExitStack
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
 from netbox.jobs import JobRunner, system_job
+from netbox.registry import registry
 from netbox.search.backends import search_backend
+from utilities.deletion import bulk_delete
+from utilities.exceptions import AbortRequest, AbortTransaction, PermissionsViolation
+from utilities.forms.bulk_import import BulkImportForm
+from utilities.views import get_viewname
 from .choices import DataSourceStatusChoices, JobIntervalChoices
 from .exceptions import SyncError
-from .models import DataSource
+from .models import DataSource, Job
+from .signals import clear_events
 
 logger = logging.getLogger(__name__)
 
+# The minimum number of seconds between updates to a running job's progress
+JOB_PROGRESS_INTERVAL = 5
+
+
+def update_job_progress(job, processed, total, connection):
+    """
+    Record the progress of a running Job in its data. The Job is updated using the given database connection (which
+    should be separate from the job's own), so that its progress is visible while the job's transaction remains open.
+    """
+    job.data = {**(job.data or {}), 'processed': processed, 'total': total}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE {connection.ops.quote_name(Job._meta.db_table)} SET data = %s::jsonb WHERE id = %s',
+            [json.dumps(job.data), job.pk]
+        )
+
+
+class JobProgress:
+    """
+    Report the progress of a running Job. Updates are written at most once every `interval` seconds (with the
+    exception of the first and final updates) using a single dedicated database connection, which is closed on exit.
+
+    Args:
+        job: The Job being run
+        interval: The minimum number of seconds between updates
+    """
+    def __init__(self, job, interval=JOB_PROGRESS_INTERVAL):
+        self.job = job
+        self.interval = interval
+        self.connection = None
+        self.last_updated = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def update(self, processed, total):
+        now = time.monotonic()
+        if processed < total and self.last_updated is not None and now - self.last_updated < self.interval:
+            return
+        if self.connection is None:
+            self.connection = connections.create_connection(self.job._state.db or DEFAULT_DB_ALIAS)
+        update_job_progress(self.job, processed, total, self.connection)
+        self.last_updated = now
+
 
 class SyncDataSourceJob(JobRunner):
     """
@@ -36,6 +99,94 @@ class SyncDataSourceJob(JobRunner):
             raise e
 
 
+class BulkImportJob(JobRunner):
+    """
+    Import objects in bulk using a BulkImportView. While the job is running, its data records the number of records
+    processed; upon completion, it records the number of objects imported or, should the import fail, the errors
+    reported.
+    """
+
+    class Meta:
+        name = 'Bulk Import'
+
+    def run(self, view, data, request, *args, **kwargs):
+        """
+        Args:
+            view: The dotted path to the BulkImportView subclass
+            data: The bound data for a BulkImportForm
+            request: A copy of the request from which the job was enqueued
+        """
+        view = import_string(view)()
+        view.setup(request)
+        view.queryset = view.get_queryset(request).restrict(request.user, 'add')
+        model = view.queryset.model
+
+        form = BulkImportForm(data)
+        if not form.is_valid():
+            self.job.data = {'errors': self._get_errors(form)}
+            raise ValidationError(self.job.data['errors'])
+
+        logger.info(f"Importing {len(form.cleaned_data['data'])} {model._meta.verbose_name_plural}")
+        with ExitStack() as stack:
+            for request_processor in registry['request_processors']:
+                stack.enter_context(request_processor(request))
+            progress = stack.enter_context(JobProgress(self.job))
+            view.progress_callback = progress.update
+            try:
+                new_objs = view.import_objects(form, request)
+            except (AbortTransaction, AbortRequest, PermissionsViolation, ValidationError) as e:
+                if isinstance(e, (AbortRequest, PermissionsViolation)):
+                    form.add_error(None, e.message)
+                self.job.data = {'errors': self._get_errors(form)}
+                clear_events.send(sender=self)
+                raise
+
+        logger.info(f"Imported {len(new_objs)} {model._meta.verbose_name_plural}")
+        self.job.data = {
+            'imported': len(new_objs),
+            'results_url': f"{reverse(get_viewname(model, action='list'))}?modified_by_request={request.id}",
+        }
+
+    @staticmethod
+    def _get_errors(form):
+        return [str(error) for errors in form.errors.values() for error in errors if error]
+
+
+class BulkDeleteJob(JobRunner):
+    """
+    Delete objects in bulk using a BulkDeleteView. While the job is running, its data records the number of objects
+    deleted thus far; upon completion, it records the total number of objects deleted.
+    """
+
+    class Meta:
+        name = 'Bulk Delete'
+
+    def run(self, view, pk_list, request, *args, **kwargs):
+        """
+        Args:
+            view: The dotted path to the BulkDeleteView subclass
+            pk_list: The primary keys of the objects to be deleted
+            request: A copy of the request from which the job was enqueued
+        """
+        view = import_string(view)()
+        view.setup(request)
+        queryset = view.get_queryset(request).restrict(request.user, 'delete').filter(pk__in=pk_list)
+
+        with ExitStack() as stack:
+            for request_processor in registry['request_processors']:
+                stack.enter_context(request_processor(request))
+            progress = stack.enter_context(JobProgress(self.job))
+            try:
+                deleted_count = bulk_delete(queryset, progress_callback=progress.update)
+            except Exception:
+                clear_events.send(sender=self)
+                raise
+
+        self.job.data = {
+            'deleted': deleted_count,
+        }
+
+
 @system_job(interval=JobIntervalChoices.INTERVAL_DAILY)
 class SystemHousekeepingJob(JobRunner):
     """
@@ -55,10 +55,13 @@ class ConfigRevision(models.Model):
 
     def activate(self):
         """
-        Cache the configuration data.
+        Cache the configuration data and notify all processes of the change.
         """
+        from netbox.config import invalidate_config
+
         cache.set('config', self.data, None)
         cache.set('config_version', self.pk, None)
+        invalidate_config()
     activate.alters_data = True
 
     @property
@@ -14,7 +14,7 @@ from core.models import ObjectChange
 from extras.events import enqueue_event
 from extras.utils import run_validators
 from netbox.config import get_config
-from netbox.context import current_request, events_queue
+from netbox.context import changelog_queue, current_request, events_queue
 from netbox.models.features import ChangeLoggingMixin
 from utilities.exceptions import AbortRequest
 from .models import ConfigRevision
@@ -43,6 +43,45 @@ clear_events = Signal()
 # Change logging & event handling
 #
 
+def get_previous_change(instance, request_id):
+    """
+    Return the most recent ObjectChange recorded for the given object by the specified request (if any), including
+    any which have been queued for deferred creation.
+    """
+    object_type = ContentType.objects.get_for_model(instance)
+    if queue := changelog_queue.get():
+        if changes := queue.get((object_type.pk, instance.pk, request_id)):
+            return changes[-1]
+    return ObjectChange.objects.filter(
+        changed_object_type=object_type,
+        changed_object_id=instance.pk,
+        request_id=request_id
+    ).first()
+
+
+def save_objectchange(objectchange):
+    """
+    Save the given ObjectChange, or queue it for creation in bulk if change logging has been deferred (see
+    deferred_change_logging()).
+    """
+    queue = changelog_queue.get()
+    if queue is None:
+        objectchange.save()
+        return
+
+    # Record the user's name while it is at hand (normally done by ObjectChange.save())
+    if not objectchange.user_name:
+        objectchange.user_name = objectchange.user.username
+    # Discard any cached references to the changed and related objects, retaining only their types & IDs: these
+    # objects may since have been deleted (clearing their PKs) by the time the queue is flushed.
+    for field_name in ('changed_object', 'related_object'):
+        field = objectchange._meta.get_field(field_name)
+        if field.is_cached(objectchange):
+            field.delete_cached_value(objectchange)
+    key = (objectchange.changed_object_type_id, objectchange.changed_object_id, objectchange.request_id)
+    queue.setdefault(key, []).append(objectchange)
+
+
 @receiver((post_save, m2m_changed))
 def handle_changed_object(sender, instance, **kwargs):
     """
@@ -79,19 +118,15 @@ def handle_changed_object(sender, instance, **kwargs):
     objectchange = instance.to_objectchange(action)
     # If this is a many-to-many field change, check for a previous ObjectChange instance recorded
     # for this object by this request and update it
-    if m2m_changed and (
-        prev_change := ObjectChange.objects.filter(
-            changed_object_type=ContentType.objects.get_for_model(instance),
-            changed_object_id=instance.pk,
-            request_id=request.id
-        ).first()
-    ):
+    if m2m_changed and (prev_change := get_previous_change(instance, request.id)):
         prev_change.postchange_data = objectchange.postchange_data
-        prev_change.save()
+        # A queued ObjectChange will be saved when the queue is flushed
+        if prev_change.pk:
+            prev_change.save()
     elif objectchange and objectchange.has_changes:
         objectchange.user = request.user
         objectchange.request_id = request.id
-        objectchange.save()
+        save_objectchange(objectchange)
 
     # Ensure that we're working with fresh M2M assignments
     if m2m_changed:
@@ -138,16 +173,17 @@ def handle_deleted_object(sender, instance, **kwargs):
         objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
         objectchange.user = request.user
         objectchange.request_id = request.id
-        objectchange.save()
+        save_objectchange(objectchange)
 
     # Django does not automatically send an m2m_changed signal for the reverse direction of a
     # many-to-many relationship (see https://code.djangoproject.com/ticket/17688), so we need to
     # trigger one manually. We do this by checking for any reverse M2M relationships on the
     # instance being deleted, and explicitly call .remove() on the remote M2M field to delete
     # the association. This triggers an m2m_changed signal with the `post_remove` action type
-    # for the forward direction of the relationship, ensuring that the change is recorded.
+    # for the forward direction of the relationship, ensuring that the change is recorded. (This
+    # is skipped if the associations have already been removed in bulk.)
     for relation in instance._meta.related_objects:
-        if type(relation) is not ManyToManyRel:
+        if type(relation) is not ManyToManyRel or getattr(instance, '_reverse_m2m_removed', False):
             continue
         related_model = relation.related_model
         related_field_name = relation.remote_field.name
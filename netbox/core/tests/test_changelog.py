@@ -8,7 +8,8 @@ from core.models import ObjectChange, ObjectType
 from dcim.choices import SiteStatusChoices
 from dcim.models import Site
 from extras.choices import *
-from extras.models import CustomField, CustomFieldChoiceSet, Tag
+from extras.models import ConfigContext, CustomField, CustomFieldChoiceSet, Tag
+from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
 from utilities.testing import APITestCase
 from utilities.testing.utils import create_tags, post_data
 from utilities.testing.views import ModelViewTestCase
@@ -143,6 +144,40 @@ class ChangeLogViewTest(ModelViewTestCase):
         self.assertEqual(oc.prechange_data['tags'], ['Tag 1', 'Tag 2'])
         self.assertEqual(oc.postchange_data, None)
 
+    def test_bulk_import_objects(self):
+        create_tags('Tag 1', 'Tag 2')
+        csv_data = (
+            "name,slug,status,cf_cf1,tags",
+            "Site 1,site-1,active,ABC,\"tag-1,tag-2\"",
+            "Site 2,site-2,planned,DEF,tag-1",
+        )
+
+        request = {
+            'path': self._get_url('bulk_import'),
+            'data': {
+                'data': '\n'.join(csv_data),
+                'format': ImportFormatChoices.CSV,
+                'csv_delimiter': CSVDelimiterChoices.AUTO,
+            },
+        }
+        self.add_permissions('dcim.add_site', 'extras.view_tag')
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 302)
+
+        # Verify the creation of a single ObjectChange record (including tags) for each new object
+        self.assertEqual(ObjectChange.objects.count(), 2)
+        site = Site.objects.get(name='Site 1')
+        oc = ObjectChange.objects.get(
+            changed_object_type=ContentType.objects.get_for_model(Site),
+            changed_object_id=site.pk
+        )
+        self.assertEqual(oc.changed_object, site)
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc.user_name, self.user.username)
+        self.assertEqual(oc.object_repr, 'Site 1')
+        self.assertEqual(oc.postchange_data['custom_fields']['cf1'], 'ABC')
+        self.assertEqual(oc.postchange_data['tags'], ['Tag 1', 'Tag 2'])
+
     def test_bulk_update_objects(self):
         sites = (
             Site(name='Site 1', slug='site-1', status=SiteStatusChoices.STATUS_ACTIVE),
@@ -210,6 +245,48 @@ class ChangeLogViewTest(ModelViewTestCase):
         self.assertEqual(objectchange.prechange_data['slug'], sites[0].slug)
         self.assertEqual(objectchange.postchange_data, None)
 
+    @override_settings(BULK_DELETE_CHUNK_SIZE=2)
+    def test_bulk_delete_objects_with_m2m(self):
+        sites = (
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+            Site(name='Site 3', slug='site-3'),
+        )
+        Site.objects.bulk_create(sites)
+        config_context = ConfigContext.objects.create(name='Config Context 1', data={})
+        config_context.sites.set(sites)
+
+        form_data = {
+            'pk': [site.pk for site in sites],
+            'confirm': True,
+            '_confirm': True,
+        }
+
+        request = {
+            'path': self._get_url('bulk_delete'),
+            'data': post_data(form_data),
+        }
+        self.add_permissions('dcim.delete_site')
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 302)
+        self.assertFalse(Site.objects.exists())
+
+        # Verify that a change record was created for each deleted object
+        self.assertEqual(ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(Site),
+            action=ObjectChangeActionChoices.ACTION_DELETE
+        ).count(), len(sites))
+
+        # Verify that the removal of all sites from the config context was recorded as a single change
+        objectchanges = ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(ConfigContext),
+            changed_object_id=config_context.pk
+        )
+        self.assertEqual(objectchanges.count(), 1)
+        self.assertEqual(objectchanges[0].action, ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(len(objectchanges[0].prechange_data['sites']), 3)
+        self.assertEqual(objectchanges[0].postchange_data['sites'], [])
+
     @override_settings(CHANGELOG_SKIP_EMPTY_CHANGES=False)
     def test_update_object_change(self):
         # Create a Site
@@ -0,0 +1,134 @@
+import uuid
+from unittest.mock import ANY, call, patch
+
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+from core.choices import JobStatusChoices
+from core.jobs import BulkDeleteJob, BulkImportJob, update_job_progress
+from core.models import Job
+from dcim.models import Site
+from netbox.choices import CSVDelimiterChoices, ImportFormatChoices, ImportMethodChoices
+from utilities.request import copy_safe_request
+from utilities.testing import TestCase
+
+
+class BulkJobTestCase(TestCase):
+
+    def _get_request(self, path):
+        request = RequestFactory().post(path)
+        request.user = self.user
+        request.id = uuid.uuid4()
+        return copy_safe_request(request)
+
+    @staticmethod
+    def _get_import_data(*rows):
+        return {
+            'data': '\n'.join(('name,slug,status', *rows)),
+            'format': ImportFormatChoices.CSV,
+            'csv_delimiter': CSVDelimiterChoices.AUTO,
+            'import_method': ImportMethodChoices.DIRECT,
+        }
+
+
+class BulkImportJobTest(BulkJobTestCase):
+
+    def test_bulk_import_job(self):
+        self.add_permissions('dcim.add_site')
+        request = self._get_request(reverse('dcim:site_bulk_import'))
+
+        with patch('core.jobs.update_job_progress', wraps=update_job_progress) as mock_update_progress:
+            job = BulkImportJob.enqueue(
+                user=self.user,
+                immediate=True,
+                view='dcim.views.SiteBulkImportView',
+                data=self._get_import_data('Site 1,site-1,active', 'Site 2,site-2,planned'),
+                request=request,
+            )
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data['imported'], 2)
+        self.assertEqual(job.data['results_url'], f"{reverse('dcim:site_list')}?modified_by_request={request.id}")
+        self.assertEqual(mock_update_progress.call_args_list, [call(job, 2, 2, ANY)])
+        self.assertEqual(set(Site.objects.values_list('name', flat=True)), {'Site 1', 'Site 2'})
+
+    def test_bulk_import_job_invalid_data(self):
+        self.add_permissions('dcim.add_site')
+        job = BulkImportJob.enqueue(
+            user=self.user,
+            immediate=True,
+            view='dcim.views.SiteBulkImportView',
+            data=self._get_import_data('Site 1,site-1,active', 'Site 2,site-2,invalid'),
+            request=self._get_request(reverse('dcim:site_bulk_import')),
+        )
+        self.assertEqual(job.status, JobStatusChoices.STATUS_ERRORED)
+        self.assertEqual(len(job.data['errors']), 1)
+        self.assertTrue(job.data['errors'][0].startswith('Record 2 status:'))
+        self.assertFalse(Site.objects.exists())
+
+    def test_bulk_import_view_background_job(self):
+        self.add_permissions('dcim.add_site')
+        data = {
+            **self._get_import_data('Site 1,site-1,active'),
+            'background_job': True,
+        }
+
+        # Run the job immediately rather than enqueuing it for a worker
+        enqueue = BulkImportJob.enqueue
+        with (
+            patch('netbox.views.generic.bulk_views.get_workers_for_queue', return_value=['worker']),
+            patch.object(BulkImportJob, 'enqueue', side_effect=lambda **kwargs: enqueue(immediate=True, **kwargs)),
+        ):
+            response = self.client.post(reverse('dcim:site_bulk_import'), data)
+
+        job = Job.objects.get(name='Import sites')
+        self.assertRedirects(response, reverse('core:job', kwargs={'pk': job.pk}), fetch_redirect_response=False)
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data['imported'], 1)
+        self.assertTrue(Site.objects.filter(name='Site 1').exists())
+
+
+class BulkDeleteJobTest(BulkJobTestCase):
+
+    @override_settings(BULK_DELETE_CHUNK_SIZE=2)
+    def test_bulk_delete_job(self):
+        sites = Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)
+        ])
+        self.add_permissions('dcim.delete_site')
+
+        with patch('core.jobs.update_job_progress', wraps=update_job_progress) as mock_update_progress:
+            job = BulkDeleteJob.enqueue(
+                user=self.user,
+                immediate=True,
+                view='dcim.views.SiteBulkDeleteView',
+                pk_list=[site.pk for site in sites],
+                request=self._get_request(reverse('dcim:site_bulk_delete')),
+            )
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data, {'deleted': 3})
+        self.assertEqual(mock_update_progress.call_args_list, [call(job, 2, 3, ANY), call(job, 3, 3, ANY)])
+        self.assertFalse(Site.objects.exists())
+
+    @override_settings(BULK_DELETE_CHUNK_SIZE=1)
+    def test_bulk_delete_job_progress_throttled(self):
+        sites = Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)
+        ])
+        self.add_permissions('dcim.delete_site')
+
+        # Only the first and final updates should be written within the update interval
+        with patch('core.jobs.update_job_progress', wraps=update_job_progress) as mock_update_progress:
+            job = BulkDeleteJob.enqueue(
+                user=self.user,
+                immediate=True,
+                view='dcim.views.SiteBulkDeleteView',
+                pk_list=[site.pk for site in sites],
+                request=self._get_request(reverse('dcim:site_bulk_delete')),
+            )
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(mock_update_progress.call_args_list, [call(job, 1, 5, ANY), call(job, 5, 5, ANY)])
+
+        # A single database connection should be used for all updates
+        connection = mock_update_progress.call_args_list[0].args[3]
+        self.assertIs(mock_update_progress.call_args_list[1].args[3], connection)
+        self.assertIsNone(connection.connection)
@@ -9,6 +9,7 @@ from extras.graphql.mixins import (
     ConfigContextMixin, ContactsMixin, CustomFieldsMixin, ImageAttachmentsMixin, TagsMixin,
 )
 from ipam.graphql.mixins import IPAddressesMixin, VLANGroupsMixin
+from netbox.graphql.optimizer import prefetch_generic_foreign_key
 from netbox.graphql.scalars import BigInt
 from netbox.graphql.types import BaseObjectType, NetBoxObjectType, OrganizationalObjectType
 from .filters import *
@@ -116,7 +117,12 @@ class ModularComponentTemplateType(ComponentTemplateType):
 )
 class CableTerminationType(NetBoxObjectType):
     cable: Annotated["CableType", strawberry.lazy('dcim.graphql.types')] | None
-    termination: Annotated[Union[
+
+    @strawberry_django.field(
+        only=['termination_type', 'termination_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.CableTermination, 'termination')]
+    )
+    def termination(self) -> Annotated[Union[
         Annotated["CircuitTerminationType", strawberry.lazy('circuits.graphql.types')],
         Annotated["ConsolePortType", strawberry.lazy('dcim.graphql.types')],
         Annotated["ConsoleServerPortType", strawberry.lazy('dcim.graphql.types')],
@@ -126,7 +132,8 @@ class CableTerminationType(NetBoxObjectType):
         Annotated["PowerOutletType", strawberry.lazy('dcim.graphql.types')],
         Annotated["PowerPortType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RearPortType", strawberry.lazy('dcim.graphql.types')],
-    ], strawberry.union("CableTerminationTerminationType")] | None
+    ], strawberry.union("CableTerminationTerminationType")] | None:
+        return self.termination
 
 
 @strawberry_django.type(
@@ -289,7 +296,11 @@ class InventoryItemTemplateType(ComponentTemplateType):
 
     child_items: List[Annotated["InventoryItemTemplateType", strawberry.lazy('dcim.graphql.types')]]
 
-    component: Annotated[Union[
+    @strawberry_django.field(
+        only=['component_type', 'component_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.InventoryItemTemplate, 'component')]
+    )
+    def component(self) -> Annotated[Union[
         Annotated["ConsolePortType", strawberry.lazy('dcim.graphql.types')],
         Annotated["ConsoleServerPortType", strawberry.lazy('dcim.graphql.types')],
         Annotated["FrontPortType", strawberry.lazy('dcim.graphql.types')],
@@ -297,7 +308,8 @@ class InventoryItemTemplateType(ComponentTemplateType):
         Annotated["PowerOutletType", strawberry.lazy('dcim.graphql.types')],
         Annotated["PowerPortType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RearPortType", strawberry.lazy('dcim.graphql.types')],
-    ], strawberry.union("InventoryItemTemplateComponentType")] | None
+    ], strawberry.union("InventoryItemTemplateComponentType")] | None:
+        return self.component
 
 
 @strawberry_django.type(
@@ -375,7 +387,10 @@ class FrontPortTemplateType(ModularComponentTemplateType):
 class MACAddressType(NetBoxObjectType):
     mac_address: str
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['assigned_object_type', 'assigned_object_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.MACAddress, 'assigned_object')]
+    )
     def assigned_object(self) -> Annotated[Union[
         Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')],
         Annotated["VMInterfaceType", strawberry.lazy('virtualization.graphql.types')],
@@ -437,7 +452,11 @@ class InventoryItemType(ComponentType):
     def parent(self) -> Annotated["InventoryItemType", strawberry.lazy('dcim.graphql.types')] | None:
         return self.parent
 
-    component: Annotated[Union[
+    @strawberry_django.field(
+        only=['component_type', 'component_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.InventoryItem, 'component')]
+    )
+    def component(self) -> Annotated[Union[
         Annotated["ConsolePortType", strawberry.lazy('dcim.graphql.types')],
         Annotated["ConsoleServerPortType", strawberry.lazy('dcim.graphql.types')],
         Annotated["FrontPortType", strawberry.lazy('dcim.graphql.types')],
@@ -445,7 +464,8 @@ class InventoryItemType(ComponentType):
         Annotated["PowerOutletType", strawberry.lazy('dcim.graphql.types')],
         Annotated["PowerPortType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RearPortType", strawberry.lazy('dcim.graphql.types')],
-    ], strawberry.union("InventoryItemComponentType")] | None
+    ], strawberry.union("InventoryItemComponentType")] | None:
+        return self.component
 
 
 @strawberry_django.type(
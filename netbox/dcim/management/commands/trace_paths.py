@@ -1,10 +1,22 @@
-from django.core.management.base import BaseCommand
+import multiprocessing
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
-from django.db import connection
+from django.db import connection, connections, transaction
 from django.db.models import Q
+from django.utils import timezone
 
-from dcim.models import CablePath, ConsolePort, ConsoleServerPort, Interface, PowerFeed, PowerOutlet, PowerPort
-from dcim.signals import create_cablepath
+from dcim.models import (
+    Cable, CablePath, ConsolePort, ConsoleServerPort, Interface, PowerFeed, PowerOutlet, PowerPort,
+)
+from dcim.tracing import CablePathTracer
+from dcim.utils import bulk_create_cablepaths, compile_path_node, decompile_path_node
+from utilities.datetime import datetime_from_timestamp
 
 ENDPOINT_MODELS = (
     ConsolePort,
@@ -16,6 +28,26 @@ ENDPOINT_MODELS = (
 )
 
 
+def trace_origins(label, pks):
+    """
+    Trace and save the CablePaths originating from the specified objects of the model identified by `label`. All
+    paths are traced using a shared CablePathTracer and inserted in bulk. Returns the number of paths created.
+    """
+    model = apps.get_model(label)
+    origins = list(model.objects.filter(pk__in=pks, _path__isnull=True).order_by('pk'))
+
+    tracer = CablePathTracer()
+    tracer.prefetch(origins)
+    cable_paths = [
+        cp for obj in origins if (cp := CablePath.from_origin([obj], tracer=tracer))
+    ]
+
+    with transaction.atomic():
+        bulk_create_cablepaths(cable_paths)
+
+    return len(cable_paths)
+
+
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in NetBox"
 
@@ -28,6 +60,18 @@ class Command(BaseCommand):
             "--no-input", action='store_true', dest='no_input',
             help="Do not prompt user for any input/confirmation"
         )
+        parser.add_argument(
+            "--changed-since", metavar='TIMESTAMP', dest='changed_since',
+            help="Retrace only paths traversing cables modified since the specified date or ISO 8601 timestamp"
+        )
+        parser.add_argument(
+            "--workers", type=int, default=1,
+            help="The number of worker processes to use (default: 1)"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, dest='batch_size',
+            help="The maximum number of paths to trace per unit of work (default: 1000)"
+        )
 
     def draw_progress_bar(self, percentage):
         """
@@ -36,7 +80,58 @@ class Command(BaseCommand):
         bar_size = int(percentage / 5)
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20 - bar_size)}] {int(percentage)}%", ending='')
 
+    @staticmethod
+    def _parse_timestamp(value):
+        try:
+            timestamp = datetime_from_timestamp(value)
+        except ValueError:
+            raise CommandError(f"Invalid timestamp: {value}. Specify a date or datetime in ISO 8601 format.")
+        if timezone.is_naive(timestamp):
+            timestamp = timezone.make_aware(timestamp)
+        return timestamp
+
+    def delete_changed_paths(self, since, batch_size):
+        """
+        Delete all CablePaths which traverse a cable modified since the specified time. Returns a dictionary mapping
+        each endpoint model to the IDs of the origins to be retraced.
+        """
+        cable_ids = list(Cable.objects.filter(last_updated__gte=since).values_list('pk', flat=True))
+        self.stdout.write(f"Found {len(cable_ids)} cables modified since {since.isoformat()}")
+
+        origin_ids = defaultdict(set)
+        if not cable_ids:
+            return origin_ids
+
+        # Delete all paths which traverse the modified cables, recording their origins
+        cable_type = ContentType.objects.get_for_model(Cable)
+        deleted_count = 0
+        for i in range(0, len(cable_ids), batch_size):
+            nodes = [compile_path_node(cable_type.pk, pk) for pk in cable_ids[i:i + batch_size]]
+            cable_paths = CablePath.objects.filter(_nodes__overlap=nodes)
+            for path in cable_paths.values_list('path', flat=True):
+                for node in path[0]:
+                    object_type_id, object_id = decompile_path_node(node)
+                    origin_ids[ContentType.objects.get_for_id(object_type_id).model_class()].add(object_id)
+            deleted_count += cable_paths.delete()[0]
+        self.stdout.write(f"  Deleted {deleted_count} paths")
+
+        # Include any endpoints attached to the modified cables which have no path
+        for model in ENDPOINT_MODELS:
+            origin_ids[model].update(
+                model.objects.filter(cable_id__in=cable_ids, _path__isnull=True).values_list('pk', flat=True)
+            )
+
+        return origin_ids
+
     def handle(self, *model_names, **options):
+        workers = options['workers']
+        batch_size = options['batch_size']
+        if workers < 1:
+            raise CommandError("The number of workers must be at least 1.")
+        if batch_size < 1:
+            raise CommandError("The batch size must be at least 1.")
+        if options['force'] and options['changed_since']:
+            raise CommandError("The --force and --changed-since options are mutually exclusive.")
 
         # If --force was passed, first delete all existing CablePaths
         if options['force']:
@@ -66,25 +161,66 @@ class Command(BaseCommand):
                 for sql in sequence_sql:
                     cursor.execute(sql)
 
-        # Retrace paths
+        # If --changed-since was passed, delete only the paths affected by modified cables
+        changed_origin_ids = None
+        if options['changed_since']:
+            since = self._parse_timestamp(options['changed_since'])
+            changed_origin_ids = self.delete_changed_paths(since, batch_size)
+
+        # Determine the origins to be traced for each model. Paths are saved in batches, so an interrupted run can be
+        # resumed simply by running the command again (without --force).
+        chunks = []
         for model in ENDPOINT_MODELS:
             params = Q(cable__isnull=False)
             if hasattr(model, 'wireless_link'):
                 params |= Q(wireless_link__isnull=False)
-            origins = model.objects.filter(params)
-            if not options['force']:
-                origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
-            if not origins_count:
+            origins = model.objects.filter(params, _path__isnull=True)
+            if changed_origin_ids is not None:
+                origins = origins.filter(pk__in=changed_origin_ids[model])
+            origin_ids = list(origins.order_by('pk').values_list('pk', flat=True))
+            if not origin_ids:
                 self.stdout.write(f'Found no missing {model._meta.verbose_name} paths; skipping')
                 continue
-            self.stdout.write(f'Retracing {origins_count} cabled {model._meta.verbose_name_plural}...')
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath([obj])
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f'\n  Retraced {i} {model._meta.verbose_name_plural}'))
+            self.stdout.write(f'Found {len(origin_ids)} cabled {model._meta.verbose_name_plural} to trace')
+            chunks.extend(
+                (model._meta.label_lower, origin_ids[i:i + batch_size]) for i in range(0, len(origin_ids), batch_size)
+            )
+
+        if not chunks:
+            self.stdout.write(self.style.SUCCESS('Finished.'))
+            return
+
+        # Retrace paths
+        origins_count = sum(len(pks) for _label, pks in chunks)
+        self.stdout.write(f'Retracing {origins_count} cabled endpoints ({len(chunks)} chunks, {workers} workers)...')
+        start_time = time.monotonic()
+        traced_count = 0
+        paths_count = 0
+
+        def chunk_completed(chunk, count):
+            nonlocal traced_count, paths_count
+            traced_count += len(chunk[1])
+            paths_count += count
+            self.draw_progress_bar(traced_count * 100 / origins_count)
+
+        if workers > 1:
+            # Close any open database connections before forking; each worker will establish its own
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = {
+                    executor.submit(trace_origins, *chunk): chunk for chunk in chunks
+                }
+                for future in as_completed(futures):
+                    chunk_completed(futures[future], future.result())
+        else:
+            for chunk in chunks:
+                chunk_completed(chunk, trace_origins(*chunk))
+
+        elapsed = time.monotonic() - start_time
+        rate = paths_count / elapsed if elapsed else paths_count
+        self.stdout.write(self.style.SUCCESS(
+            f'\n  Created {paths_count} paths from {traced_count} endpoints in {elapsed:.2f} seconds '
+            f'({rate:.1f} paths/second)'
+        ))
 
         self.stdout.write(self.style.SUCCESS('Finished.'))
@@ -0,0 +1,85 @@
+import itertools
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+import dcim.fields
+
+OBJECT_ID_BITS = 48
+OBJECT_ID_MASK = (1 << OBJECT_ID_BITS) - 1
+
+
+def encode_node(node):
+    ct_id, object_id = node.split(':')
+    return (int(ct_id) << OBJECT_ID_BITS) | int(object_id)
+
+
+def decode_node(node):
+    return f'{node >> OBJECT_ID_BITS}:{node & OBJECT_ID_MASK}'
+
+
+def convert_paths(apps, func=None):
+    """
+    Apply func (if any) to every node of every CablePath, and repopulate its flattened list of nodes.
+    """
+    CablePath = apps.get_model('dcim', 'CablePath')
+
+    cable_paths = []
+    for cablepath in CablePath.objects.only('path').iterator(chunk_size=1000):
+        if func is not None:
+            cablepath.path = [[func(node) for node in step] for step in cablepath.path]
+        cablepath._nodes = list(itertools.chain(*cablepath.path))
+        cable_paths.append(cablepath)
+        if len(cable_paths) == 1000:
+            CablePath.objects.bulk_update(cable_paths, ['path', '_nodes'])
+            cable_paths = []
+    CablePath.objects.bulk_update(cable_paths, ['path', '_nodes'])
+
+
+def encode_paths(apps, schema_editor):
+    convert_paths(apps, encode_node)
+
+
+def decode_paths(apps, schema_editor):
+    # The _nodes column is repopulated once it has been reverted to its original type
+    CablePath = apps.get_model('dcim', 'CablePath')
+    for cablepath in CablePath.objects.only('path').iterator(chunk_size=1000):
+        CablePath.objects.filter(pk=cablepath.pk).update(
+            path=[[decode_node(node) for node in step] for step in cablepath.path]
+        )
+
+
+def populate_nodes(apps, schema_editor):
+    convert_paths(apps)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dcim', '0200_populate_mac_addresses'),
+    ]
+
+    operations = [
+        migrations.RunPython(code=migrations.RunPython.noop, reverse_code=populate_nodes),
+        # Existing nodes cannot be cast directly to the new type; they are discarded here and repopulated from each
+        # CablePath's path below.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='cablepath',
+                    name='_nodes',
+                    field=dcim.fields.PathField(base_field=models.BigIntegerField(), size=None),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    sql="ALTER TABLE dcim_cablepath ALTER COLUMN _nodes TYPE bigint[] USING '{}'",
+                    reverse_sql="ALTER TABLE dcim_cablepath ALTER COLUMN _nodes TYPE varchar(40)[] USING '{}'",
+                ),
+            ],
+        ),
+        migrations.RunPython(code=encode_paths, reverse_code=decode_paths),
+        migrations.AddIndex(
+            model_name='cablepath',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['_nodes'], name='dcim_cablepath_nodes'),
+        ),
+    ]
@@ -2,6 +2,7 @@ import itertools
 from collections import defaultdict
 
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Sum
@@ -436,7 +437,8 @@ class CablePath(models.Model):
     if the instance represents a complete end-to-end path from origin(s) to destination(s). `is_split` is True if the
     path diverges across multiple cables.
 
-    `_nodes` retains a flattened list of all nodes within the path to enable simple filtering.
+    Each node is stored as an integer encoding the object's type and ID (see compile_path_node()). `_nodes` retains a
+    flattened list of all nodes within the path to enable simple filtering.
     """
     path = models.JSONField(
         verbose_name=_('path'),
@@ -459,6 +461,9 @@ class CablePath(models.Model):
     _netbox_private = True
 
     class Meta:
+        indexes = (
+            GinIndex(fields=('_nodes',), name='dcim_cablepath_nodes'),
+        )
         verbose_name = _('cable path')
         verbose_name_plural = _('cable paths')
 
@@ -519,20 +524,25 @@ class CablePath(models.Model):
         return int(len(self.path) / 3)
 
     @classmethod
-    def from_origin(cls, terminations):
+    def from_origin(cls, terminations, tracer=None):
         """
         Create a new CablePath instance as traced from the given termination objects. These can be any object to which a
         Cable or WirelessLink connects (interfaces, console ports, circuit termination, etc.). All terminations must be
         of the same type and must belong to the same parent object.
+
+        A CablePathTracer may be passed to share cached objects among multiple traces.
         """
         from circuits.models import CircuitTermination
+        from dcim.tracing import CablePathTracer
 
         if not terminations:
             return None
+        if tracer is None:
+            tracer = CablePathTracer()
 
         # Ensure all originating terminations are attached to the same link
         if len(terminations) > 1:
-            assert all(t.link == terminations[0].link for t in terminations[1:])
+            assert all(tracer.get_link(t) == tracer.get_link(terminations[0]) for t in terminations[1:])
 
         path = []
         position_stack = []
@@ -552,7 +562,7 @@ class CablePath(models.Model):
 
             # Check for a split path (e.g. rear port fanning out to multiple front ports with
             # different cables attached)
-            if len(set(t.link for t in terminations)) > 1 and (
+            if len(set(tracer.get_link(t) for t in terminations)) > 1 and (
                     position_stack and len(terminations) != len(position_stack[-1])
             ):
                 is_split = True
@@ -564,7 +574,7 @@ class CablePath(models.Model):
             ])
 
             # Step 2: Determine the attached links (Cable or WirelessLink), if any
-            links = [termination.link for termination in terminations if termination.link is not None]
+            links = [link for termination in terminations if (link := tracer.get_link(termination)) is not None]
             if len(links) == 0:
                 if len(path) == 1:
                     # If this is the start of the path and no link exists, return None
@@ -575,7 +585,9 @@ class CablePath(models.Model):
             assert all(isinstance(link, type(links[0])) for link in links)
 
             # Step 3: Record asymmetric paths as split
-            not_connected_terminations = [termination.link for termination in terminations if termination.link is None]
+            not_connected_terminations = [
+                termination for termination in terminations if tracer.get_link(termination) is None
+            ]
             if len(not_connected_terminations) > 0:
                 is_complete = False
                 is_split = True
@@ -594,23 +606,11 @@ class CablePath(models.Model):
 
             # Step 6: Determine the far-end terminations
             if isinstance(links[0], Cable):
-                termination_type = ObjectType.objects.get_for_model(terminations[0])
-                local_cable_terminations = CableTermination.objects.filter(
-                    termination_type=termination_type,
-                    termination_id__in=[t.pk for t in terminations]
-                )
-
-                q_filter = Q()
-                for lct in local_cable_terminations:
-                    cable_end = 'A' if lct.cable_end == 'B' else 'B'
-                    q_filter |= Q(cable=lct.cable, cable_end=cable_end)
+                remote_terminations = tracer.get_remote_terminations(terminations)
 
-                # Make sure this filter has been populated; if not, we have probably been given invalid data
-                if not q_filter:
+                # Make sure the local terminations have been found; if not, we have probably been given invalid data
+                if remote_terminations is None:
                     break
-
-                remote_cable_terminations = CableTermination.objects.filter(q_filter)
-                remote_terminations = [ct.termination for ct in remote_cable_terminations]
             else:
                 # WirelessLink
                 remote_terminations = [
@@ -634,9 +634,7 @@ class CablePath(models.Model):
 
             if isinstance(remote_terminations[0], FrontPort):
                 # Follow FrontPorts to their corresponding RearPorts
-                rear_ports = RearPort.objects.filter(
-                    pk__in=[t.rear_port_id for t in remote_terminations]
-                )
+                rear_ports = tracer.get_rear_ports(remote_terminations)
                 if len(rear_ports) > 1 or rear_ports[0].positions > 1:
                     position_stack.append([fp.rear_port_position for fp in remote_terminations])
 
@@ -644,9 +642,9 @@ class CablePath(models.Model):
 
             elif isinstance(remote_terminations[0], RearPort):
                 if len(remote_terminations) == 1 and remote_terminations[0].positions == 1:
-                    front_ports = FrontPort.objects.filter(
-                        rear_port_id__in=[rp.pk for rp in remote_terminations],
-                        rear_port_position=1
+                    front_ports = tracer.get_front_ports(
+                        remote_terminations,
+                        [(rp.pk, 1) for rp in remote_terminations]
                     )
                 # Obtain the individual front ports based on the termination and all positions
                 elif len(remote_terminations) > 1 and position_stack:
@@ -656,21 +654,22 @@ class CablePath(models.Model):
                     assert len(remote_terminations) == len(positions)
 
                     # Get our front ports
-                    q_filter = Q()
-                    for rt in remote_terminations:
-                        position = positions.pop()
-                        q_filter |= Q(rear_port_id=rt.pk, rear_port_position=position)
-                    assert q_filter is not Q()
-                    front_ports = FrontPort.objects.filter(q_filter)
+                    front_ports = tracer.get_front_ports(
+                        remote_terminations,
+                        [(rt.pk, positions.pop()) for rt in remote_terminations]
+                    )
                 # Obtain the individual front ports based on the termination and position
                 elif position_stack:
-                    front_ports = FrontPort.objects.filter(
-                        rear_port_id=remote_terminations[0].pk,
-                        rear_port_position__in=position_stack.pop()
+                    front_ports = tracer.get_front_ports(
+                        remote_terminations[:1],
+                        [(remote_terminations[0].pk, position) for position in position_stack.pop()]
                     )
                 # If all rear ports have a single position, we can just get the front ports
                 elif all([rp.positions == 1 for rp in remote_terminations]):
-                    front_ports = FrontPort.objects.filter(rear_port_id__in=[rp.pk for rp in remote_terminations])
+                    front_ports = tracer.get_front_ports(
+                        remote_terminations,
+                        [(rp.pk, None) for rp in remote_terminations]
+                    )
 
                     if len(front_ports) != len(remote_terminations):
                         # Some rear ports does not have a front port
@@ -688,10 +687,7 @@ class CablePath(models.Model):
                 if len(remote_terminations) > 1:
                     is_split = True
                     break
-                circuit_termination = CircuitTermination.objects.filter(
-                    circuit=remote_terminations[0].circuit,
-                    term_side='Z' if remote_terminations[0].term_side == 'A' else 'A'
-                ).first()
+                circuit_termination = tracer.get_peer_circuit_termination(remote_terminations[0])
                 if circuit_termination is None:
                     break
                 elif circuit_termination._provider_network:
@@ -731,11 +727,11 @@ class CablePath(models.Model):
             is_split=is_split
         )
 
-    def retrace(self):
+    def retrace(self, tracer=None):
         """
         Retrace the path from the currently-defined originating termination(s)
         """
-        _new = self.from_origin(self.origins)
+        _new = self.from_origin(self.origins, tracer=tracer)
         if _new:
             self.path = _new.path
             self.is_complete = _new.is_complete
@@ -787,14 +783,10 @@ class CablePath(models.Model):
         Return all Cable IDs within the path.
         """
         cable_ct = ObjectType.objects.get_for_model(Cable).pk
-        cable_ids = []
 
-        for node in self._nodes:
-            ct, id = decompile_path_node(node)
-            if ct == cable_ct:
-                cable_ids.append(id)
-
-        return cable_ids
+        return [
+            object_id for ct_id, object_id in map(decompile_path_node, self._nodes) if ct_id == cable_ct
+        ]
 
     def get_total_length(self):
         """
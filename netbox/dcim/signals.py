@@ -8,6 +8,7 @@ from .models import (
     Cable, CablePath, CableTermination, Device, FrontPort, PathEndpoint, PowerPanel, Rack, Location, VirtualChassis,
 )
 from .models.cables import trace_paths
+from .tracing import CablePathTracer
 from .utils import create_cablepath, rebuild_paths
 
 
@@ -85,18 +86,23 @@ def update_connected_endpoints(instance, created, raw=False, **kwargs):
     if instance._terminations_modified:
         a_terminations = []
         b_terminations = []
-        # Note: instance.terminations.all() is not safe to use here as it might be stale
-        for t in CableTermination.objects.filter(cable=instance):
+        # Note: instance.terminations.all() is not safe to use here as it might be stale. The tracer loads the
+        # cable's terminations (and their terminating objects) in bulk.
+        tracer = CablePathTracer()
+        tracer.load_cables([instance.pk])
+        for t in tracer.cable_terminations[instance.pk]:
+            if (termination := tracer.objects[(t.termination_type_id, t.termination_id)]) is None:
+                continue
             if t.cable_end == CableEndChoices.SIDE_A:
-                a_terminations.append(t.termination)
+                a_terminations.append(termination)
             else:
-                b_terminations.append(t.termination)
+                b_terminations.append(termination)
         for nodes in [a_terminations, b_terminations]:
             # Examine type of first termination to determine object type (all must be the same)
             if not nodes:
                 continue
             if isinstance(nodes[0], PathEndpoint):
-                create_cablepath(nodes)
+                create_cablepath(nodes, tracer=tracer)
             else:
                 rebuild_paths(nodes)
 
@@ -113,8 +119,9 @@ def retrace_cable_paths(instance, **kwargs):
     """
     When a Cable is deleted, check for and update its connected endpoints
     """
+    tracer = CablePathTracer()
     for cablepath in CablePath.objects.filter(_nodes__contains=instance):
-        cablepath.retrace()
+        cablepath.retrace(tracer=tracer)
 
 
 @receiver(post_delete, sender=CableTermination)
@@ -125,11 +132,12 @@ def nullify_connected_endpoints(instance, **kwargs):
     model = instance.termination_type.model_class()
     model.objects.filter(pk=instance.termination_id).update(cable=None, cable_end='')
 
+    tracer = CablePathTracer()
     for cablepath in CablePath.objects.filter(_nodes__contains=instance.cable):
         # Remove the deleted CableTermination if it's one of the path's originating nodes
         if instance.termination in cablepath.origins:
             cablepath.origins.remove(instance.termination)
-        cablepath.retrace()
+        cablepath.retrace(tracer=tracer)
 
 
 @receiver(post_save, sender=FrontPort)
@@ -139,5 +147,6 @@ def extend_rearport_cable_paths(instance, created, raw, **kwargs):
     """
     if created and not raw:
         rearport = instance.rear_port
+        tracer = CablePathTracer()
         for cablepath in CablePath.objects.filter(_nodes__contains=rearport):
-            cablepath.retrace()
+            cablepath.retrace(tracer=tracer)
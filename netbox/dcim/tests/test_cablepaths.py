@@ -1,9 +1,11 @@
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
 
 from circuits.models import *
 from dcim.choices import LinkStatusChoices
 from dcim.models import *
 from dcim.svg import CableTraceSVG
+from dcim.tracing import CablePathTracer
 from dcim.utils import object_to_path_node
 
 
@@ -2420,6 +2422,146 @@ class CablePathTestCase(TestCase):
             is_active=True
         )
 
+    def test_304_trace_multiple_paths_with_shared_tracer(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [RP2] [FP2:1] --C4-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C5-- [IF4]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f'Interface {i}') for i in range(1, 5)
+        ]
+        rearport1 = RearPort.objects.create(device=self.device, name='Rear Port 1', positions=4)
+        rearport2 = RearPort.objects.create(device=self.device, name='Rear Port 2', positions=4)
+        frontports1 = [
+            FrontPort.objects.create(
+                device=self.device, name=f'Front Port 1:{i}', rear_port=rearport1, rear_port_position=i
+            ) for i in range(1, 3)
+        ]
+        frontports2 = [
+            FrontPort.objects.create(
+                device=self.device, name=f'Front Port 2:{i}', rear_port=rearport2, rear_port_position=i
+            ) for i in range(1, 3)
+        ]
+        Cable(a_terminations=[interfaces[0]], b_terminations=[frontports1[0]]).save()
+        Cable(a_terminations=[interfaces[1]], b_terminations=[frontports1[1]]).save()
+        Cable(a_terminations=[rearport1], b_terminations=[rearport2]).save()
+        Cable(a_terminations=[frontports2[0]], b_terminations=[interfaces[2]]).save()
+        Cable(a_terminations=[frontports2[1]], b_terminations=[interfaces[3]]).save()
+        self.assertEqual(CablePath.objects.count(), 4)
+
+        # Trace all paths using a shared tracer and compare them to the paths traced individually
+        interfaces = Interface.objects.filter(pk__in=[i.pk for i in interfaces])
+        tracer = CablePathTracer()
+        tracer.prefetch(interfaces)
+        for interface in interfaces:
+            cablepath = CablePath.from_origin([interface], tracer=tracer)
+            self.assertEqual(cablepath.path, interface._path.path)
+            self.assertTrue(cablepath.is_complete)
+            self.assertTrue(cablepath.is_active)
+
+    def test_305_path_node_lookups(self):
+        """
+        [IF1] --C1-- [FP1] [RP1] --C2-- [IF2]
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        rearport1 = RearPort.objects.create(device=self.device, name='Rear Port 1', positions=1)
+        frontport1 = FrontPort.objects.create(
+            device=self.device, name='Front Port 1', rear_port=rearport1, rear_port_position=1
+        )
+        cable1 = Cable(a_terminations=[interface1], b_terminations=[frontport1])
+        cable1.save()
+        cable2 = Cable(a_terminations=[rearport1], b_terminations=[interface2])
+        cable2.save()
+
+        # Look up the paths traversing each object
+        self.assertEqual(CablePath.objects.filter(_nodes__contains=cable1).count(), 2)
+        self.assertEqual(CablePath.objects.filter(_nodes__contains=rearport1).count(), 2)
+        self.assertEqual(CablePath.objects.filter(_nodes__contains=interface1).count(), 2)
+
+        # Decode the path nodes
+        cablepath = self.assertPathExists(
+            (interface1, cable1, frontport1, rearport1, cable2, interface2),
+            is_complete=True
+        )
+        self.assertEqual(cablepath.get_cable_ids(), [cable1.pk, cable2.pk])
+        self.assertEqual(
+            cablepath.path_objects,
+            [[interface1], [cable1], [frontport1], [rearport1], [cable2], [interface2]]
+        )
+
+    def test_306_retrace_paths_via_patch_panel(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [IF3]
+        [IF2] --C2-- [FP1:2]
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        interface3 = Interface.objects.create(device=self.device, name='Interface 3')
+        rearport1 = RearPort.objects.create(device=self.device, name='Rear Port 1', positions=2)
+        frontport1_1 = FrontPort.objects.create(
+            device=self.device, name='Front Port 1:1', rear_port=rearport1, rear_port_position=1
+        )
+        frontport1_2 = FrontPort.objects.create(
+            device=self.device, name='Front Port 1:2', rear_port=rearport1, rear_port_position=2
+        )
+
+        # Cable the front of the patch panel
+        cable1 = Cable(a_terminations=[interface1], b_terminations=[frontport1_1])
+        cable1.save()
+        cable2 = Cable(a_terminations=[interface2], b_terminations=[frontport1_2])
+        cable2.save()
+        self.assertPathExists((interface1, cable1, frontport1_1, rearport1), is_complete=False)
+        self.assertPathExists((interface2, cable2, frontport1_2, rearport1), is_complete=False)
+        self.assertEqual(CablePath.objects.count(), 2)
+
+        # Cable the rear of the patch panel, retracing both existing paths
+        cable3 = Cable(a_terminations=[rearport1], b_terminations=[interface3])
+        cable3.save()
+        path1 = self.assertPathExists(
+            (interface1, cable1, frontport1_1, rearport1, cable3, interface3),
+            is_complete=True
+        )
+        path2 = self.assertPathExists(
+            (interface2, cable2, frontport1_2, rearport1, cable3, interface3),
+            is_complete=True
+        )
+        self.assertPathExists(
+            (interface3, cable3, rearport1),
+            is_complete=False,
+            is_split=True
+        )
+        self.assertEqual(CablePath.objects.count(), 3)
+        interface1.refresh_from_db()
+        interface2.refresh_from_db()
+        self.assertPathIsSet(interface1, path1)
+        self.assertPathIsSet(interface2, path2)
+
+    def test_307_tracer_port_loading_and_ordering(self):
+        """
+        Ports loaded individually and then along with their device should be represented by a single instance, and
+        sorted by device and (natural) name regardless of the order in which they were loaded.
+        """
+        rearport1 = RearPort.objects.create(device=self.device, name='Rear Port 1', positions=3)
+        frontports = [
+            FrontPort.objects.create(
+                device=self.device, name=f'Front Port {i}', rear_port=rearport1, rear_port_position=position
+            ) for position, i in enumerate((10, 2, 1), start=1)
+        ]
+
+        tracer = CablePathTracer()
+        frontport_type_id = ContentType.objects.get_for_model(FrontPort).pk
+        tracer.load_objects(frontport_type_id, [frontports[0].pk])
+        frontport10 = tracer.objects[(frontport_type_id, frontports[0].pk)]
+        tracer.load_device_ports([self.device.pk])
+
+        self.assertIs(tracer.objects[(frontport_type_id, frontports[0].pk)], frontport10)
+        self.assertIn(frontport10, tracer.rear_port_front_ports[rearport1.pk])
+        self.assertEqual(
+            [fp.name for fp in tracer.get_front_ports([rearport1], [(rearport1.pk, None)])],
+            ['Front Port 1', 'Front Port 2', 'Front Port 10']
+        )
+
     def test_401_exclude_midspan_devices(self):
         """
         [IF1] --C1-- [FP1][Test Device][RP1] --C2-- [RP2][Test Device][FP2] --C3-- [IF2]
@@ -0,0 +1,147 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from dcim.models import *
+
+
+class TracePathsCommandTestCase(TestCase):
+    """
+    Test the trace_paths management command. CablePaths generated by the command must match those created by
+    create_cablepath() when tracing each origin individually.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        site = Site.objects.create(name='Site', slug='site')
+        manufacturer = Manufacturer.objects.create(name='Generic', slug='generic')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Test Device')
+        role = DeviceRole.objects.create(name='Device Role', slug='device-role')
+        device = Device.objects.create(site=site, device_type=device_type, role=role, name='Device 1')
+        patch_panel1 = Device.objects.create(site=site, device_type=device_type, role=role, name='Patch Panel 1')
+        patch_panel2 = Device.objects.create(site=site, device_type=device_type, role=role, name='Patch Panel 2')
+
+        interfaces = [
+            Interface.objects.create(device=device, name=f'Interface {i}') for i in range(1, 6)
+        ]
+        rearport1 = RearPort.objects.create(device=patch_panel1, name='Rear Port 1', positions=1)
+        rearport2 = RearPort.objects.create(device=patch_panel2, name='Rear Port 2', positions=1)
+        rearport3 = RearPort.objects.create(device=patch_panel2, name='Rear Port 3', positions=1)
+        frontport1 = FrontPort.objects.create(
+            device=patch_panel1, name='Front Port 1', rear_port=rearport1, rear_port_position=1
+        )
+        frontport2 = FrontPort.objects.create(
+            device=patch_panel2, name='Front Port 2', rear_port=rearport2, rear_port_position=1
+        )
+        frontport3 = FrontPort.objects.create(
+            device=patch_panel2, name='Front Port 3', rear_port=rearport3, rear_port_position=1
+        )
+        consoleport = ConsolePort.objects.create(device=device, name='Console Port 1')
+        consoleserverport = ConsoleServerPort.objects.create(device=device, name='Console Server Port 1')
+        powerport = PowerPort.objects.create(device=device, name='Power Port 1')
+        poweroutlet = PowerOutlet.objects.create(device=device, name='Power Outlet 1')
+
+        # [IF1] --C1-- [FP1] [RP1] --C2-- [RP2] [FP2] --C3-- [IF2]
+        # [IF3] --C4-- [IF4]
+        # [IF5] --C5-- [FP3] [RP3]
+        # [CP1] --C6-- [CSP1]
+        # [PP1] --C7-- [PO1]
+        cls.cables = {}
+        for label, a_terminations, b_terminations in (
+            ('C1', [interfaces[0]], [frontport1]),
+            ('C2', [rearport1], [rearport2]),
+            ('C3', [frontport2], [interfaces[1]]),
+            ('C4', [interfaces[2]], [interfaces[3]]),
+            ('C5', [interfaces[4]], [frontport3]),
+            ('C6', [consoleport], [consoleserverport]),
+            ('C7', [powerport], [poweroutlet]),
+        ):
+            cable = Cable(label=label, a_terminations=a_terminations, b_terminations=b_terminations)
+            cable.save()
+            cls.cables[label] = cable
+
+        cls.origins = [*interfaces, consoleport, consoleserverport, powerport, poweroutlet]
+
+    def _call_command(self, **kwargs):
+        call_command('trace_paths', no_input=True, stdout=StringIO(), **kwargs)
+
+    @staticmethod
+    def _get_path_attrs(cablepath):
+        if cablepath is None:
+            return None
+        return cablepath.path, cablepath.is_complete, cablepath.is_active, cablepath.is_split
+
+    def assertPathsMatchCreated(self):
+        """
+        Assert that the CablePath saved for each origin matches the one traced for it by create_cablepath().
+        """
+        for origin in self.origins:
+            origin.refresh_from_db()
+            expected = self._get_path_attrs(CablePath.from_origin([origin]))
+            self.assertEqual(self._get_path_attrs(origin._path), expected, msg=f"Path mismatch for {origin}")
+        self.assertEqual(CablePath.objects.count(), len(self.origins))
+
+    def test_trace_missing_paths(self):
+        CablePath.objects.all().delete()
+
+        self._call_command()
+
+        self.assertPathsMatchCreated()
+
+    def test_trace_missing_paths_in_batches(self):
+        CablePath.objects.filter(_nodes__contains=self.cables['C2']).delete()
+
+        self._call_command(batch_size=1)
+
+        self.assertPathsMatchCreated()
+
+    def test_trace_paths_force(self):
+        path_ids = set(CablePath.objects.values_list('pk', flat=True))
+
+        self._call_command(force=True)
+
+        self.assertPathsMatchCreated()
+        self.assertFalse(path_ids & set(CablePath.objects.values_list('pk', flat=True)))
+
+    def test_trace_paths_changed_since(self):
+        now = timezone.now()
+        Cable.objects.update(last_updated=now - timedelta(days=2))
+        Cable.objects.filter(pk=self.cables['C2'].pk).update(last_updated=now)
+        changed_path_ids = set(
+            CablePath.objects.filter(_nodes__contains=self.cables['C2']).values_list('pk', flat=True)
+        )
+        unchanged_path_ids = set(
+            CablePath.objects.exclude(pk__in=changed_path_ids).values_list('pk', flat=True)
+        )
+        self.assertEqual(len(changed_path_ids), 2)
+
+        # Paths not traversing a modified cable should not be retraced, even if missing
+        consoleport = ConsolePort.objects.get(name='Console Port 1')
+        consoleport._path.delete()
+        unchanged_path_ids.discard(consoleport._path_id)
+
+        self._call_command(changed_since=(now - timedelta(days=1)).isoformat())
+
+        consoleport.refresh_from_db()
+        self.assertIsNone(consoleport._path)
+        path_ids = set(CablePath.objects.values_list('pk', flat=True))
+        self.assertTrue(unchanged_path_ids <= path_ids)
+        self.assertFalse(changed_path_ids & path_ids)
+        self.assertEqual(len(path_ids - unchanged_path_ids), 2)
+
+        # Tracing the remaining missing path yields the same paths as create_cablepath()
+        self._call_command()
+        self.assertPathsMatchCreated()
+
+    def test_trace_paths_invalid_options(self):
+        with self.assertRaises(CommandError):
+            self._call_command(force=True, changed_since='2025-01-01')
+        with self.assertRaises(CommandError):
+            self._call_command(changed_since='not-a-date')
+        with self.assertRaises(CommandError):
+            self._call_command(workers=0)
+        with self.assertRaises(CommandError):
+            self._call_command(batch_size=0)
@@ -60,6 +60,41 @@ class RegionTestCase(ViewTestCases.OrganizationalObjectViewTestCase):
             'description': 'New description',
         }
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_bulk_edit_parent(self):
+        """
+        Moving nodes from several trees beneath a new parent should leave all trees consistent.
+        """
+        regions = list(Region.objects.order_by('name'))
+        child_regions = []
+        for region in regions[1:]:
+            child_region = Region(name=f'{region.name} Child', slug=f'{region.slug}-child', parent=region)
+            child_region.save()
+            child_regions.append(child_region)
+        self.add_permissions('dcim.change_region')
+
+        # Move Region 2 and Region 3's child beneath Region 1
+        data = {
+            'pk': [regions[1].pk, child_regions[1].pk],
+            'parent': regions[0].pk,
+            '_apply': True,
+        }
+        response = self.client.post(self._get_url('bulk_edit'), data)
+        self.assertHttpStatus(response, 302)
+        for region in regions:
+            region.refresh_from_db()
+        self.assertEqual(
+            set(regions[0].get_descendants().values_list('pk', flat=True)),
+            {regions[1].pk, child_regions[0].pk, child_regions[1].pk}
+        )
+        self.assertEqual(regions[2].get_descendants().count(), 0)
+
+        # Verify that the tree fields match those of a full rebuild
+        tree_fields = ('pk', 'tree_id', 'lft', 'rght', 'level')
+        tree_values = list(Region.objects.order_by('pk').values_list(*tree_fields))
+        Region.objects.rebuild()
+        self.assertEqual(list(Region.objects.order_by('pk').values_list(*tree_fields)), tree_values)
+
 
 class SiteGroupTestCase(ViewTestCases.OrganizationalObjectViewTestCase):
     model = SiteGroup
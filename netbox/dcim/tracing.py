@@ -0,0 +1,271 @@
+import itertools
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+from circuits.models import CircuitTermination
+from dcim.choices import CableEndChoices
+from dcim.models import Cable, CableTermination, FrontPort, RearPort
+from dcim.utils import decompile_path_node
+from utilities.ordering import naturalize
+
+__all__ = (
+    'CablePathTracer',
+)
+
+
+class CablePathTracer:
+    """
+    Loads and caches the objects needed to trace cable paths (cables, cable terminations, front & rear ports, etc.)
+    so that many paths can be traced without querying the database for each hop. Related objects are loaded in bulk:
+    all terminations of a cable at once, and all front & rear ports of a device at once (e.g. every position of a
+    patch panel).
+
+    A tracer's cache is never invalidated, so a new instance must be used for each set of changes to be traced.
+    """
+    def __init__(self):
+        # Cable ID -> Cable
+        self.cables = {}
+        # Cable ID -> list of CableTerminations, ordered by cable end and ID
+        self.cable_terminations = {}
+        # (ContentType ID, object ID) -> CableTermination (or None if the object has no cable)
+        self.object_cable_terminations = {}
+        # (ContentType ID, object ID) -> instance (or None if the object no longer exists)
+        self.objects = {}
+        # IDs of devices for which all front & rear ports have been loaded
+        self.port_devices = set()
+        # RearPort ID -> list of FrontPorts
+        self.rear_port_front_ports = defaultdict(list)
+        # (Circuit ID, term side) -> CircuitTermination (or None)
+        self.circuit_terminations = {}
+
+    @staticmethod
+    def _get_object_type_id(model):
+        return ContentType.objects.get_for_model(model).pk
+
+    def _add_object(self, obj):
+        self.objects[(self._get_object_type_id(obj), obj.pk)] = obj
+
+    #
+    # Bulk loading
+    #
+
+    def load_device_ports(self, device_ids):
+        """
+        Load all front and rear ports belonging to the specified devices.
+        """
+        device_ids = set(device_ids) - self.port_devices - {None}
+        if not device_ids:
+            return
+        self.port_devices.update(device_ids)
+
+        for model in (RearPort, FrontPort):
+            object_type_id = self._get_object_type_id(model)
+            for obj in model.objects.filter(device_id__in=device_ids).select_related('device'):
+                # Retain any instance already loaded, so that all references to a port are to the same instance
+                if (loaded_obj := self.objects.get((object_type_id, obj.pk))) is not None:
+                    obj = loaded_obj
+                else:
+                    self._add_object(obj)
+                if model is FrontPort:
+                    self.rear_port_front_ports[obj.rear_port_id].append(obj)
+
+    def load_objects(self, object_type_id, object_ids, device_ids=None):
+        """
+        Load the specified objects of a single type. If the objects are front or rear ports, `device_ids` may be
+        passed to load all ports belonging to their parent devices.
+        """
+        model = ContentType.objects.get_for_id(object_type_id).model_class()
+        if model in (FrontPort, RearPort) and device_ids:
+            self.load_device_ports(device_ids)
+
+        missing_ids = {pk for pk in object_ids if (object_type_id, pk) not in self.objects}
+        if not missing_ids:
+            return
+
+        queryset = model.objects.filter(pk__in=missing_ids)
+        if model in (FrontPort, RearPort):
+            queryset = queryset.select_related('device')
+        elif model is CircuitTermination:
+            queryset = queryset.select_related('circuit')
+        for obj in queryset:
+            self._add_object(obj)
+
+        # Record any objects which no longer exist
+        for pk in missing_ids:
+            self.objects.setdefault((object_type_id, pk), None)
+
+    def load_cables(self, cable_ids):
+        """
+        Load the specified Cables along with all of their CableTerminations and terminating objects.
+        """
+        cable_ids = set(cable_ids) - set(self.cables) - {None}
+        if not cable_ids:
+            return
+
+        for cable in Cable.objects.filter(pk__in=cable_ids):
+            self.cables[cable.pk] = cable
+        for cable_id in cable_ids:
+            self.cable_terminations[cable_id] = []
+        cable_terminations = CableTermination.objects.filter(cable_id__in=cable_ids).order_by(
+            'cable_id', 'cable_end', 'pk'
+        )
+
+        # Load the terminating objects, grouped by type
+        to_load = defaultdict(lambda: (set(), set()))
+        for ct in cable_terminations:
+            self.cable_terminations[ct.cable_id].append(ct)
+            self.object_cable_terminations[(ct.termination_type_id, ct.termination_id)] = ct
+            object_ids, device_ids = to_load[ct.termination_type_id]
+            object_ids.add(ct.termination_id)
+            device_ids.add(ct._device_id)
+        for object_type_id, (object_ids, device_ids) in to_load.items():
+            self.load_objects(object_type_id, object_ids, device_ids=device_ids)
+
+        # Attach the terminating objects to their CableTerminations
+        for ct in itertools.chain.from_iterable(self.cable_terminations[pk] for pk in cable_ids):
+            if (obj := self.objects[(ct.termination_type_id, ct.termination_id)]) is not None:
+                ct.termination = obj
+                if cable := self.cables.get(ct.cable_id):
+                    ct.cable = cable
+
+    def prefetch(self, terminations):
+        """
+        Load the cables attached to the given terminations (e.g. the origins of many paths about to be traced).
+        """
+        self.load_cables(getattr(t, 'cable_id', None) for t in terminations)
+
+    def get_objects(self, nodes):
+        """
+        Return the objects represented by a list of path nodes, omitting any which no longer exist.
+        """
+        to_load = defaultdict(set)
+        for node in nodes:
+            object_type_id, object_id = decompile_path_node(node)
+            to_load[object_type_id].add(object_id)
+        for object_type_id, object_ids in to_load.items():
+            self.load_objects(object_type_id, object_ids)
+
+        objects = [self.objects[decompile_path_node(node)] for node in nodes]
+        return [obj for obj in objects if obj is not None]
+
+    #
+    # Path tracing
+    #
+
+    def get_link(self, termination):
+        """
+        Return the Cable or WirelessLink attached to a termination, if any.
+        """
+        if cable_id := getattr(termination, 'cable_id', None):
+            self.load_cables([cable_id])
+            if cable := self.cables.get(cable_id):
+                return cable
+        return termination.link
+
+    def get_remote_terminations(self, terminations):
+        """
+        Return the objects terminating the far end(s) of the cable(s) attached to the given terminations (which must
+        all be of the same type), ordered by cable and CableTermination ID. Returns None if none of the given
+        terminations has a CableTermination.
+        """
+        object_type_id = self._get_object_type_id(terminations[0])
+        self.load_cables(getattr(t, 'cable_id', None) for t in terminations)
+
+        # Look up any terminations not found among the loaded cables
+        missing_ids = [t.pk for t in terminations if (object_type_id, t.pk) not in self.object_cable_terminations]
+        if missing_ids:
+            self.load_cables(
+                CableTermination.objects.filter(
+                    termination_type_id=object_type_id,
+                    termination_id__in=missing_ids
+                ).values_list('cable_id', flat=True)
+            )
+            for pk in missing_ids:
+                self.object_cable_terminations.setdefault((object_type_id, pk), None)
+
+        local_cable_terminations = [
+            lct for t in terminations if (lct := self.object_cable_terminations[(object_type_id, t.pk)]) is not None
+        ]
+        if not local_cable_terminations:
+            return None
+
+        # Gather the CableTerminations at the opposite end of each cable
+        remote_ends = {
+            (
+                lct.cable_id,
+                CableEndChoices.SIDE_A if lct.cable_end == CableEndChoices.SIDE_B else CableEndChoices.SIDE_B
+            ) for lct in local_cable_terminations
+        }
+        remote_cable_terminations = sorted(
+            [
+                ct for cable_id in {cable_id for cable_id, _ in remote_ends}
+                for ct in self.cable_terminations[cable_id] if (ct.cable_id, ct.cable_end) in remote_ends
+            ],
+            key=lambda ct: (ct.cable_id, ct.cable_end, ct.pk)
+        )
+
+        return [
+            self.objects[(ct.termination_type_id, ct.termination_id)] for ct in remote_cable_terminations
+        ]
+
+    @staticmethod
+    def _sort_ports(ports):
+        """
+        Sort front or rear ports in the same manner as their default ordering: by device (name, then ID) and then by
+        name, with names compared naturally.
+        """
+        return sorted(ports, key=lambda port: (
+            port.device.name is None,
+            naturalize(port.device.name or '', max_length=256),
+            port.device_id,
+            naturalize(port.name, max_length=256),
+            port.pk,
+        ))
+
+    def get_rear_ports(self, front_ports):
+        """
+        Return the distinct RearPorts to which the given FrontPorts map.
+        """
+        self.load_device_ports(fp.device_id for fp in front_ports)
+        object_type_id = self._get_object_type_id(RearPort)
+        self.load_objects(object_type_id, {fp.rear_port_id for fp in front_ports})
+
+        rear_ports = [self.objects[(object_type_id, pk)] for pk in {fp.rear_port_id for fp in front_ports}]
+        return self._sort_ports([rp for rp in rear_ports if rp is not None])
+
+    def get_front_ports(self, rear_ports, positions):
+        """
+        Return the FrontPorts which map to the given RearPorts at the specified positions.
+
+        Args:
+            rear_ports: An iterable of RearPorts
+            positions: An iterable of (RearPort ID, position) tuples. A position of None matches any position.
+        """
+        self.load_device_ports(rp.device_id for rp in rear_ports)
+        positions = set(positions)
+
+        front_ports = {
+            fp.pk: fp for rp in rear_ports for fp in self.rear_port_front_ports[rp.pk]
+            if (rp.pk, fp.rear_port_position) in positions or (rp.pk, None) in positions
+        }
+        return self._sort_ports(front_ports.values())
+
+    def get_peer_circuit_termination(self, circuit_termination):
+        """
+        Return the CircuitTermination on the opposite side of the given CircuitTermination's circuit, if any.
+        """
+        key = (
+            circuit_termination.circuit_id,
+            'Z' if circuit_termination.term_side == 'A' else 'A'
+        )
+        if key not in self.circuit_terminations:
+            peer = CircuitTermination.objects.filter(
+                circuit_id=key[0],
+                term_side=key[1]
+            ).select_related('circuit', '_provider_network').first()
+            if peer is not None:
+                self._add_object(peer)
+            self.circuit_terminations[key] = peer
+
+        return self.circuit_terminations[key]
@@ -1,58 +1,114 @@
+import itertools
+from collections import defaultdict
+
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 
 
+# The number of low-order bits in a path node used to store the object ID. The remaining high-order bits hold the
+# ContentType ID.
+PATH_NODE_OBJECT_ID_BITS = 48
+PATH_NODE_OBJECT_ID_MASK = (1 << PATH_NODE_OBJECT_ID_BITS) - 1
+
+
 def compile_path_node(ct_id, object_id):
-    return f'{ct_id}:{object_id}'
+    """
+    Encode a (ContentType ID, object ID) pair as a single integer suitable for storage in a bigint column.
+    """
+    return (ct_id << PATH_NODE_OBJECT_ID_BITS) | object_id
 
 
-def decompile_path_node(repr):
-    ct_id, object_id = repr.split(':')
-    return int(ct_id), int(object_id)
+def decompile_path_node(node):
+    """
+    Decode a path node into a (ContentType ID, object ID) tuple.
+    """
+    return node >> PATH_NODE_OBJECT_ID_BITS, node & PATH_NODE_OBJECT_ID_MASK
 
 
 def object_to_path_node(obj):
     """
-    Return a representation of an object suitable for inclusion in a CablePath path. Node representation is in the
-    form <ContentType ID>:<Object ID>.
+    Return a representation of an object suitable for inclusion in a CablePath path. Nodes are represented as integers
+    packing the object's ContentType ID and its primary key (see compile_path_node()).
     """
     ct = ContentType.objects.get_for_model(obj)
     return compile_path_node(ct.pk, obj.pk)
 
 
-def path_node_to_object(repr):
+def path_node_to_object(node):
     """
-    Given the string representation of a path node, return the corresponding instance. If the object no longer
-    exists, return None.
+    Given the representation of a path node, return the corresponding instance. If the object no longer exists,
+    return None.
     """
-    ct_id, object_id = decompile_path_node(repr)
+    ct_id, object_id = decompile_path_node(node)
     ct = ContentType.objects.get_for_id(ct_id)
     return ct.model_class().objects.filter(pk=object_id).first()
 
 
-def create_cablepath(terminations):
+def create_cablepath(terminations, tracer=None):
     """
     Create CablePaths for all paths originating from the specified set of nodes.
 
     :param terminations: Iterable of CableTermination objects
+    :param tracer: A CablePathTracer to be used for tracing (optional)
     """
     from dcim.models import CablePath
 
-    cp = CablePath.from_origin(terminations)
+    cp = CablePath.from_origin(terminations, tracer=tracer)
     if cp:
         cp.save()
 
 
+def bulk_create_cablepaths(cable_paths, batch_size=None):
+    """
+    Save many new CablePaths efficiently, inserting them in bulk and recording a reference to each path on its
+    originating object(s). Returns the list of saved CablePaths.
+
+    :param cable_paths: Iterable of unsaved CablePath instances
+    :param batch_size: The maximum number of objects to insert or update per query (optional)
+    """
+    from dcim.models import CablePath
+
+    cable_paths = list(cable_paths)
+    for cp in cable_paths:
+        cp._nodes = list(itertools.chain(*cp.path))
+    CablePath.objects.bulk_create(cable_paths, batch_size=batch_size)
+
+    # Update the _path reference on all originating objects, grouped by type
+    origins = defaultdict(list)
+    for cp in cable_paths:
+        origin_model = cp.origin_type.model_class()
+        for node in cp.path[0]:
+            origins[origin_model].append(origin_model(pk=decompile_path_node(node)[1], _path_id=cp.pk))
+    for origin_model, objects in origins.items():
+        origin_model.objects.bulk_update(objects, ['_path'], batch_size=batch_size)
+
+    return cable_paths
+
+
 def rebuild_paths(terminations):
     """
     Rebuild all CablePaths which traverse the specified nodes.
     """
     from dcim.models import CablePath
+    from dcim.tracing import CablePathTracer
 
+    # Gather all affected CablePaths, retracing each only once
+    cable_paths = {}
     for obj in terminations:
-        cable_paths = CablePath.objects.filter(_nodes__contains=obj)
-
-        with transaction.atomic():
-            for cp in cable_paths:
-                cp.delete()
-                create_cablepath(cp.origins)
+        for cp in CablePath.objects.filter(_nodes__contains=obj):
+            cable_paths[cp.pk] = cp
+    if not cable_paths:
+        return
+
+    # Retrace all paths using a shared tracer, loading the originating objects in bulk
+    tracer = CablePathTracer()
+    origins = {
+        cp.pk: tracer.get_objects(cp.path[0]) for cp in cable_paths.values()
+    }
+    tracer.prefetch(itertools.chain.from_iterable(origins.values()))
+
+    with transaction.atomic():
+        # Deleting a CablePath clears its primary key, so each path's origins are looked up by the original key
+        for pk, cp in cable_paths.items():
+            cp.delete()
+            create_cablepath(origins[pk], tracer=tracer)
@@ -2,12 +2,12 @@ from django.utils.translation import gettext as _
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework.fields import Field
-from rest_framework.serializers import ValidationError
+from rest_framework.serializers import ListSerializer, ValidationError
 
-from core.models import ObjectType
 from extras.choices import CustomFieldTypeChoices
 from extras.constants import CUSTOMFIELD_EMPTY_VALUES
 from extras.models import CustomField
+from extras.utils import CustomFieldResolver
 from utilities.api import get_serializer_for_model
 
 
@@ -25,8 +25,7 @@ class CustomFieldDefaultValues:
         self.model = serializer_field.parent.Meta.model
 
         # Retrieve the CustomFields for the parent model
-        object_type = ObjectType.objects.get_for_model(self.model)
-        fields = CustomField.objects.filter(object_types=object_type)
+        fields = CustomField.objects.get_cached_for_model(self.model)
 
         # Populate the default value for each CustomField
         value = {}
@@ -47,16 +46,30 @@ class CustomFieldsDataField(Field):
         Cache CustomFields assigned to this model to avoid redundant database queries
         """
         if not hasattr(self, '_custom_fields'):
-            object_type = ObjectType.objects.get_for_model(self.parent.Meta.model)
-            self._custom_fields = CustomField.objects.filter(object_types=object_type)
+            self._custom_fields = CustomField.objects.get_cached_for_model(self.parent.Meta.model)
         return self._custom_fields
 
+    def _get_resolver(self, obj):
+        """
+        Return a CustomFieldResolver for all objects being serialized (e.g. a page of results), so that the objects
+        referenced by object and multi-object custom fields are retrieved for the entire page at once.
+        """
+        if not hasattr(self, '_resolver'):
+            list_serializer = self.parent.parent
+            if isinstance(list_serializer, ListSerializer) and list_serializer.instance is not None:
+                data = list_serializer.instance
+            else:
+                data = [obj]
+            self._resolver = CustomFieldResolver(self._get_custom_fields(), data)
+        return self._resolver
+
     def to_representation(self, obj):
         # TODO: Fix circular import
         from utilities.api import get_serializer_for_model
+        resolver = self._get_resolver(obj)
         data = {}
         for cf in self._get_custom_fields():
-            value = cf.deserialize(obj.get(cf.name))
+            value = resolver.deserialize(cf, obj.get(cf.name))
             if value is not None and cf.type == CustomFieldTypeChoices.TYPE_OBJECT:
                 serializer = get_serializer_for_model(cf.related_object_type.model_class())
                 value = serializer(value, nested=True, context=self.parent.context).data
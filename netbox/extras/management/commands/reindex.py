@@ -1,10 +1,38 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, time
+
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.translation import gettext as _
 
 from netbox.registry import registry
 from netbox.search.backends import search_backend
 
+CHECKPOINT_CACHE_KEY = 'reindex_checkpoint'
+CHECKPOINT_TIMEOUT = 60 * 60 * 24 * 7  # One week
+
+
+def reindex_chunk(label, start, end, since=None, remove_existing=False):
+    """
+    Cache all objects of the indexed model identified by `label` having a primary key within the range [start, end).
+    If `end` is None, the range is unbounded. If `since` is specified, only objects modified since that time are
+    cached. Returns the number of cache entries created.
+    """
+    indexer = registry['search'][label]
+    queryset = indexer.model.objects.filter(pk__gte=start).order_by('pk')
+    if end is not None:
+        queryset = queryset.filter(pk__lt=end)
+    if since is not None:
+        queryset = queryset.filter(last_updated__gte=since)
+
+    return search_backend.cache(queryset.iterator(), indexer=indexer, remove_existing=remove_existing)
+
 
 class Command(BaseCommand):
     help = 'Reindex objects for search'
@@ -21,6 +49,29 @@ class Command(BaseCommand):
             action='store_true',
             help="For each model, reindex objects only if no cache entries already exist"
         )
+        parser.add_argument(
+            '--since',
+            metavar='TIMESTAMP',
+            help="Reindex only objects modified since the specified date or ISO 8601 timestamp"
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help="The number of worker processes to use (default: 1)"
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10000,
+            help="The maximum number of objects to reindex per unit of work (default: 10000)"
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help="Resume an interrupted reindexing from its last checkpoint (the models, --since, and --batch-size of "
+                 "the interrupted run are retained)"
+        )
 
     def _get_indexers(self, *model_names):
         indexers = {}
@@ -59,16 +110,61 @@ class Command(BaseCommand):
 
         return indexers
 
-    def handle(self, *model_labels, **kwargs):
+    @staticmethod
+    def _parse_since(value):
+        """
+        Parse the value of --since as a date or datetime, returning a timezone-aware datetime.
+        """
+        try:
+            since = parse_datetime(value)
+            if since is None and (date := parse_date(value)) is not None:
+                since = datetime.combine(date, time.min)
+        except ValueError:
+            since = None
+        if since is None:
+            raise CommandError(f"Invalid timestamp: {value}. Specify a date or datetime in ISO 8601 format.")
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    @staticmethod
+    def _get_chunks(label, model, batch_size, since=None):
+        """
+        Divide the objects of a model into ranges of primary keys, each encompassing up to `batch_size` objects.
+        Returns a list of (label, start, end) tuples. The end of the final range is left open.
+        """
+        queryset = model.objects.order_by('pk')
+        if since is not None:
+            queryset = queryset.filter(last_updated__gte=since)
+
+        chunks = []
+        start = None
+        for i, pk in enumerate(queryset.values_list('pk', flat=True).iterator()):
+            if not i % batch_size:
+                if start is not None:
+                    chunks.append((label, start, pk))
+                start = pk
+        if start is not None:
+            chunks.append((label, start, None))
+
+        return chunks
 
+    @staticmethod
+    def _save_checkpoint(checkpoint):
+        cache.set(CHECKPOINT_CACHE_KEY, checkpoint, CHECKPOINT_TIMEOUT)
+
+    def _plan(self, model_labels, since, batch_size, lazy):
+        """
+        Determine the units of work for a new reindexing run.
+        """
         # Determine which models to reindex
         indexers = self._get_indexers(*model_labels)
         if not indexers:
             raise CommandError(_("No indexers found!"))
         self.stdout.write(f'Reindexing {len(indexers)} models.')
 
-        # Clear cached values for the specified models (if not being lazy)
-        if not kwargs['lazy']:
+        # Clear cached values for the specified models (if not being lazy or reindexing only modified objects)
+        if not lazy and since is None:
             if model_labels:
                 content_types = [ContentType.objects.get_for_model(model) for model in indexers.keys()]
             else:
@@ -79,25 +175,97 @@ class Command(BaseCommand):
             deleted_count = search_backend.clear(object_types=content_types)
             self.stdout.write(f'{deleted_count} entries deleted.')
 
-        # Index models
-        self.stdout.write('Indexing models')
-        for model, idx in indexers.items():
-            app_label = model._meta.app_label
-            model_name = model._meta.model_name
-            self.stdout.write(f'  {app_label}.{model_name}... ', ending='')
-            self.stdout.flush()
+        chunks = []
+        for model in indexers:
+            label = f'{model._meta.app_label}.{model._meta.model_name}'
 
-            if kwargs['lazy']:
+            if lazy:
                 content_type = ContentType.objects.get_for_model(model)
                 if cached_count := search_backend.count(object_types=[content_type]):
-                    self.stdout.write(f'Skipping (found {cached_count} existing).')
+                    self.stdout.write(f'  {label}... Skipping (found {cached_count} existing).')
+                    continue
+
+            if since is not None:
+                try:
+                    model._meta.get_field('last_updated')
+                except FieldDoesNotExist:
+                    self.stdout.write(f'  {label}... Skipping (no modification time recorded).')
                     continue
 
-            i = search_backend.cache(model.objects.iterator(), remove_existing=False)
-            if i:
-                self.stdout.write(f'{i} entries cached.')
+            if model_chunks := self._get_chunks(label, model, batch_size, since=since):
+                chunks.extend(model_chunks)
             else:
-                self.stdout.write('No objects found.')
+                self.stdout.write(f'  {label}... No objects found.')
+
+        return chunks
+
+    def handle(self, *model_labels, **kwargs):
+        workers = kwargs['workers']
+        if workers < 1:
+            raise CommandError(_("The number of workers must be at least 1."))
+        if kwargs['batch_size'] < 1:
+            raise CommandError(_("The batch size must be at least 1."))
+
+        if kwargs['resume']:
+            # The work to be resumed was planned by the interrupted run
+            if model_labels or kwargs['since'] or kwargs['lazy']:
+                raise CommandError(_("Models, --since, and --lazy cannot be specified when resuming."))
+
+            # Pick up the remaining work from the last checkpoint. Any chunk not recorded as completed may have been
+            # partially cached, so existing entries must be removed.
+            if (checkpoint := cache.get(CHECKPOINT_CACHE_KEY)) is None:
+                raise CommandError(_("No reindexing checkpoint found."))
+            since = checkpoint['since']
+            completed = {tuple(chunk) for chunk in checkpoint['completed']}
+            chunks = [tuple(chunk) for chunk in checkpoint['chunks'] if tuple(chunk) not in completed]
+            remove_existing = True
+            self.stdout.write(f'Resuming reindexing ({len(completed)}/{len(checkpoint["chunks"])} chunks completed).')
+        else:
+            since = self._parse_since(kwargs['since']) if kwargs['since'] else None
+            chunks = self._plan(model_labels, since, kwargs['batch_size'], kwargs['lazy'])
+            # When reindexing only modified objects, their existing entries must be replaced
+            remove_existing = since is not None
+            checkpoint = {
+                'since': since,
+                'chunks': chunks,
+                'completed': [],
+            }
+            self._save_checkpoint(checkpoint)
+
+        # Track the number of outstanding chunks and entries cached per model
+        remaining = {}
+        counts = {}
+        for label, _start, _end in chunks:
+            remaining[label] = remaining.get(label, 0) + 1
+            counts[label] = 0
+
+        def chunk_completed(chunk, count):
+            label = chunk[0]
+            counts[label] += count
+            remaining[label] -= 1
+            checkpoint['completed'].append(chunk)
+            self._save_checkpoint(checkpoint)
+            if not remaining[label]:
+                self.stdout.write(f'  {label}... {counts[label]} entries cached.')
+
+        # Index models
+        self.stdout.write(f'Indexing models ({len(chunks)} chunks, {workers} workers)')
+        if workers > 1:
+            # Close any open database connections before forking; each worker will establish its own
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = {
+                    executor.submit(reindex_chunk, *chunk, since=since, remove_existing=remove_existing): chunk
+                    for chunk in chunks
+                }
+                for future in as_completed(futures):
+                    chunk_completed(futures[future], future.result())
+        else:
+            for chunk in chunks:
+                chunk_completed(chunk, reindex_chunk(*chunk, since=since, remove_existing=remove_existing))
+
+        # Reindexing has completed; discard the checkpoint
+        cache.delete(CHECKPOINT_CACHE_KEY)
 
         msg = 'Completed.'
         if total_count := search_backend.size:
@@ -0,0 +1,44 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('extras', '0122_charfield_null_choices'),
+    ]
+
+    operations = [
+        # Enable the pg_trgm extension (required for trigram indexing)
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='cachedvalue',
+            name='search_vector',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector('value', config='simple'),
+                output_field=django.contrib.postgres.search.SearchVectorField()
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='cachedvalue',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('value'),
+                    name='gin_trgm_ops'
+                ),
+                name='extras_cachedvalue_value_trgm'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='cachedvalue',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['search_vector'],
+                name='extras_cachedvalue_vector'
+            ),
+        ),
+    ]
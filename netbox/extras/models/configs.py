@@ -4,7 +4,6 @@ from django.core.validators import ValidationError
 from django.db import models
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
-from jinja2.loaders import BaseLoader
 from jinja2.sandbox import SandboxedEnvironment
 
 from extras.querysets import ConfigContextQuerySet
@@ -13,7 +12,7 @@ from netbox.models import ChangeLoggedModel
 from netbox.models.features import CloningMixin, CustomLinksMixin, ExportTemplatesMixin, SyncedDataMixin, TagsMixin
 from netbox.registry import registry
 from utilities.data import deepmerge
-from utilities.jinja2 import DataFileLoader
+from utilities.jinja2 import DataFileLoader, get_environment, get_environment_key, get_template, template_cache
 
 __all__ = (
     'ConfigContext',
@@ -273,29 +272,41 @@ class ConfigTemplate(SyncedDataMixin, CustomLinksMixin, ExportTemplatesMixin, Ta
         if context is not None:
             _context.update(context)
 
-        # Initialize the Jinja2 environment and instantiate the Template
-        environment = self._get_environment()
-        if self.data_file:
-            template = environment.get_template(self.data_file.path)
-        else:
-            template = environment.from_string(self.template_code)
-        output = template.render(**_context)
+        output = self.get_template().render(**_context)
 
         # Replace CRLF-style line terminators
         return output.replace('\r\n', '\n')
 
+    def get_template(self):
+        """
+        Return the compiled Jinja2 Template, retrieving it from the template cache where possible.
+        """
+        if not self.data_file:
+            return get_template(self.template_code, self.environment_params)
+
+        # A template loaded from a DataFile may include other files from the same DataSource, so the cached Template
+        # must be invalidated whenever the DataSource is synchronized
+        key = (
+            self.data_source_id,
+            self.data_source.last_synced,
+            self.data_file.path,
+            self.template_code,
+            get_environment_key(self.environment_params),
+        )
+        return template_cache.get(key, lambda: self._get_environment().get_template(self.data_file.path))
+
     def _get_environment(self):
         """
         Instantiate and return a Jinja2 environment suitable for rendering the ConfigTemplate.
         """
-        # Initialize the template loader & cache the base template code (if applicable)
-        if self.data_file:
-            loader = DataFileLoader(data_source=self.data_source)
-            loader.cache_templates({
-                self.data_file.path: self.template_code
-            })
-        else:
-            loader = BaseLoader()
+        if not self.data_file:
+            return get_environment(self.environment_params)
+
+        # Initialize the template loader & cache the base template code
+        loader = DataFileLoader(data_source=self.data_source)
+        loader.cache_templates({
+            self.data_file.path: self.template_code
+        })
 
         # Initialize the environment
         env_params = self.environment_params or {}
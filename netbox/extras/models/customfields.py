@@ -1,14 +1,17 @@
 import decimal
 import json
 import re
+import threading
+import uuid
 from datetime import datetime, date
 
 import django_filters
 from django import forms
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.core.validators import RegexValidator, ValidationError
-from django.db import models
+from django.db import connection, models
 from django.urls import reverse
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
@@ -17,6 +20,7 @@ from django.utils.translation import gettext_lazy as _
 from core.models import ObjectType
 from extras.choices import *
 from extras.data import CHOICE_SETS
+from netbox.context import current_request
 from netbox.models import ChangeLoggedModel
 from netbox.models.features import CloningMixin, ExportTemplatesMixin
 from netbox.search import FieldTypes
@@ -47,6 +51,15 @@ SEARCH_TYPES = {
     CustomFieldTypeChoices.TYPE_URL: FieldTypes.STRING,
 }
 
+# Cache key holding the current version of all CustomField definitions
+CUSTOMFIELDS_VERSION_KEY = 'custom_fields_version'
+
+_thread_locals = threading.local()
+
+# The in-memory cache of CustomFields (a tuple per ObjectType ID) and the version of the definitions it holds
+_custom_fields = {}
+_custom_fields_version = None
+
 
 class CustomFieldManager(models.Manager.from_queryset(RestrictedQuerySet)):
     use_in_migrations = True
@@ -58,13 +71,51 @@ class CustomFieldManager(models.Manager.from_queryset(RestrictedQuerySet)):
         content_type = ObjectType.objects.get_for_model(model._meta.concrete_model)
         return self.get_queryset().filter(object_types=content_type)
 
+    def get_cached_for_model(self, model):
+        """
+        Return a tuple of all CustomFields assigned to the given model. Definitions are cached in memory and
+        revalidated (at most once per request) against a version key shared by all processes, which is replaced
+        whenever a CustomField or CustomFieldChoiceSet is changed. The cache is bypassed within a transaction, as the
+        transaction may have modified CustomFields which have not yet been committed.
+        """
+        global _custom_fields, _custom_fields_version
+
+        object_type = ObjectType.objects.get_for_model(model._meta.concrete_model)
+        if connection.in_atomic_block:
+            return tuple(
+                self.get_queryset().filter(object_types=object_type).select_related('choice_set', 'related_object_type')
+            )
+
+        # Check the current version once per request (or on every call outside a request)
+        request_id = getattr(current_request.get(), 'id', None)
+        if request_id is None or request_id != getattr(_thread_locals, 'request_id', None):
+            _thread_locals.request_id = request_id
+            version = cache.get(CUSTOMFIELDS_VERSION_KEY)
+            if version != _custom_fields_version:
+                _custom_fields, _custom_fields_version = {}, version
+
+        custom_fields = _custom_fields
+        if object_type.pk not in custom_fields:
+            custom_fields[object_type.pk] = tuple(
+                self.get_queryset().filter(object_types=object_type).select_related('choice_set', 'related_object_type')
+            )
+        return custom_fields[object_type.pk]
+
+    def invalidate_cache(self):
+        """
+        Discard all cached CustomField definitions, in this and all other processes.
+        """
+        global _custom_fields, _custom_fields_version
+        _custom_fields_version = uuid.uuid4().hex
+        _custom_fields = {}
+        cache.set(CUSTOMFIELDS_VERSION_KEY, _custom_fields_version, None)
+
     def get_defaults_for_model(self, model):
         """
         Return a dictionary of serialized default values for all CustomFields applicable to the given model.
         """
-        custom_fields = self.get_for_model(model).filter(default__isnull=False)
         return {
-            cf.name: cf.default for cf in custom_fields
+            cf.name: cf.default for cf in self.get_cached_for_model(model) if cf.default is not None
         }
 
 
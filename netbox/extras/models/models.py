@@ -1,3 +1,4 @@
+import itertools
 import json
 import urllib.parse
 
@@ -6,7 +7,7 @@ from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelatio
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import ValidationError
 from django.db import models
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -24,7 +25,8 @@ from netbox.models.features import (
     CloningMixin, CustomFieldsMixin, CustomLinksMixin, ExportTemplatesMixin, SyncedDataMixin, TagsMixin,
 )
 from utilities.html import clean_html
-from utilities.jinja2 import render_jinja2
+from utilities.jinja2 import get_template_relations, render_jinja2
+from utilities.query import ChunkedQuerySet
 from utilities.querydict import dict_to_querydict
 from utilities.querysets import RestrictedQuerySet
 
@@ -459,25 +461,46 @@ class ExportTemplate(SyncedDataMixin, CloningMixin, ExportTemplatesMixin, Change
         """
         Render the contents of the template.
         """
+        return ''.join(self.render_stream(queryset))
+
+    def render_stream(self, queryset):
+        """
+        Render the contents of the template, returning a generator which yields the output in chunks. Any related
+        objects referenced by the template are retrieved along with the queryset, which is iterated in chunks rather
+        than being loaded into memory all at once.
+        """
+        select_related, prefetch_related = get_template_relations(self.template_code, queryset.model)
+        queryset = queryset.select_related(*select_related).prefetch_related(*prefetch_related)
         context = {
-            'queryset': queryset
+            'queryset': ChunkedQuerySet(queryset)
         }
-        output = render_jinja2(self.template_code, context)
+        output = render_jinja2(self.template_code, context, stream=True)
 
-        # Replace CRLF-style line terminators
-        output = output.replace('\r\n', '\n')
+        def replace_crlf(chunks):
+            # Replace CRLF-style line terminators (which may span two chunks)
+            pending = ''
+            for chunk in chunks:
+                chunk = pending + chunk
+                chunk, pending = (chunk[:-1], '\r') if chunk.endswith('\r') else (chunk, '')
+                yield chunk.replace('\r\n', '\n')
+            if pending:
+                yield pending
 
-        return output
+        return replace_crlf(output)
 
     def render_to_response(self, queryset):
         """
-        Render the template to an HTTP response, delivered as a named file attachment
+        Render the template to a streaming HTTP response, delivered as a named file attachment
         """
-        output = self.render(queryset)
+        output = self.render_stream(queryset)
         mime_type = 'text/plain; charset=utf-8' if not self.mime_type else self.mime_type
 
+        # Render the first chunk immediately, so that any error encountered at the outset is raised to the caller
+        # before the response is returned
+        first_chunk = next(output, '')
+
         # Build the response
-        response = HttpResponse(output, content_type=mime_type)
+        response = StreamingHttpResponse(itertools.chain((first_chunk,), output), content_type=mime_type)
 
         if self.as_attachment:
             basename = queryset.model._meta.verbose_name_plural.replace(' ', '_')
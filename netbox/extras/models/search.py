@@ -1,6 +1,9 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from netbox.search.utils import get_indexer
@@ -11,6 +14,9 @@ __all__ = (
     'CachedValue',
 )
 
+# The text search configuration used to generate the full text search vector for cached values
+SEARCH_VECTOR_CONFIG = 'simple'
+
 
 class CachedValue(models.Model):
     id = models.UUIDField(
@@ -48,6 +54,11 @@ class CachedValue(models.Model):
         verbose_name=_('weight'),
         default=1000
     )
+    search_vector = models.GeneratedField(
+        expression=SearchVector('value', config=SEARCH_VECTOR_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True
+    )
 
     _netbox_private = True
 
@@ -57,6 +68,9 @@ class CachedValue(models.Model):
         verbose_name_plural = _('cached values')
         indexes = (
             models.Index(fields=('object_type', 'object_id'), name='extras_cachedvalue_object'),
+            # Trigram index supporting case-insensitive partial matching (UPPER(value) LIKE ...)
+            GinIndex(OpClass(Upper('value'), name='gin_trgm_ops'), name='extras_cachedvalue_value_trgm'),
+            GinIndex(fields=('search_vector',), name='extras_cachedvalue_vector'),
         )
 
     def __str__(self):
@@ -1,5 +1,6 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from core.events import *
@@ -11,7 +12,7 @@ from netbox.config import get_config
 from netbox.registry import registry
 from netbox.signals import post_clean
 from utilities.exceptions import AbortRequest
-from .models import CustomField, TaggedItem
+from .models import CustomField, CustomFieldChoiceSet, TaggedItem
 from .utils import run_validators
 
 
@@ -50,10 +51,23 @@ def handle_cf_deleted(instance, **kwargs):
     instance.remove_stale_data(instance.object_types.all())
 
 
+def handle_cf_changed(**kwargs):
+    """
+    Invalidate all cached CustomField definitions once a change to a CustomField or CustomFieldChoiceSet has been
+    committed.
+    """
+    transaction.on_commit(CustomField.objects.invalidate_cache)
+
+
 post_save.connect(handle_cf_renamed, sender=CustomField)
 pre_delete.connect(handle_cf_deleted, sender=CustomField)
 m2m_changed.connect(handle_cf_added_obj_types, sender=CustomField.object_types.through)
 m2m_changed.connect(handle_cf_removed_obj_types, sender=CustomField.object_types.through)
+post_save.connect(handle_cf_changed, sender=CustomField)
+post_delete.connect(handle_cf_changed, sender=CustomField)
+post_save.connect(handle_cf_changed, sender=CustomFieldChoiceSet)
+post_delete.connect(handle_cf_changed, sender=CustomFieldChoiceSet)
+m2m_changed.connect(handle_cf_changed, sender=CustomField.object_types.through)
 
 
 #
@@ -1,7 +1,10 @@
 import datetime
 from decimal import Decimal
+from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import QuerySet
 from django.urls import reverse
 from rest_framework import status
 
@@ -11,6 +14,7 @@ from dcim.forms import SiteImportForm
 from dcim.models import Manufacturer, Rack, Site
 from extras.choices import *
 from extras.models import CustomField, CustomFieldChoiceSet
+from extras.utils import CustomFieldResolver
 from ipam.models import VLAN
 from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
 from utilities.testing import APITestCase, TestCase
@@ -613,6 +617,30 @@ class CustomFieldManagerTest(TestCase):
         self.assertEqual(CustomField.objects.get_for_model(Site).count(), 1)
         self.assertEqual(CustomField.objects.get_for_model(VirtualMachine).count(), 0)
 
+    def test_get_cached_for_model(self):
+        self.assertEqual([cf.name for cf in CustomField.objects.get_cached_for_model(Site)], ['text_field'])
+        self.assertEqual(CustomField.objects.get_cached_for_model(VirtualMachine), ())
+
+    def test_get_cached_for_model_invalidation(self):
+        # The cache is bypassed within a transaction (as is every test), so simulate autocommit mode
+        self.addCleanup(CustomField.objects.invalidate_cache)
+        CustomField.objects.invalidate_cache()
+        with patch.object(connection, 'in_atomic_block', False):
+            self.assertEqual([cf.name for cf in CustomField.objects.get_cached_for_model(Site)], ['text_field'])
+            with self.assertNumQueries(0):
+                CustomField.objects.get_cached_for_model(Site)
+
+        # Changes are reflected once they have been committed
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field = CustomField(type=CustomFieldTypeChoices.TYPE_TEXT, name='text_field2')
+            custom_field.save()
+            custom_field.object_types.set([ObjectType.objects.get_for_model(Site)])
+        with patch.object(connection, 'in_atomic_block', False):
+            self.assertEqual(
+                [cf.name for cf in CustomField.objects.get_cached_for_model(Site)],
+                ['text_field', 'text_field2']
+            )
+
 
 class CustomFieldAPITest(APITestCase):
 
@@ -818,6 +846,31 @@ class CustomFieldAPITest(APITestCase):
             [obj.pk for obj in site2_cfvs['multiobject_field']]
         )
 
+    def test_get_multiple_objects_with_custom_field_data(self):
+        """
+        Validate that object and multi-object custom field values are resolved for an entire page of objects.
+        """
+        site2 = Site.objects.get(name='Site 2')
+        vlans = VLAN.objects.order_by('vid')
+        for i in range(3, 6):
+            Site.objects.create(name=f'Site {i}', slug=f'site-{i}', custom_field_data={
+                'object_field': vlans[i - 1].pk,
+                'multiobject_field': [vlans[0].pk, vlans[i - 1].pk],
+            })
+        url = reverse('dcim-api:site-list')
+        self.add_permissions('dcim.view_site')
+
+        response = self.client.get(f'{url}?ordering=name', **self.header)
+        results = {site['name']: site['custom_fields'] for site in response.data['results']}
+        self.assertIsNone(results['Site 1']['object_field'])
+        self.assertEqual(results['Site 2']['object_field']['id'], site2.cf['object_field'].pk)
+        for i in range(3, 6):
+            self.assertEqual(results[f'Site {i}']['object_field']['id'], vlans[i - 1].pk)
+            self.assertEqual(
+                [vlan['id'] for vlan in results[f'Site {i}']['multiobject_field']],
+                [vlans[0].pk, vlans[i - 1].pk]
+            )
+
     def test_create_single_object_with_defaults(self):
         """
         Create a new site with no specified custom field values and check that it received the default values.
@@ -1426,6 +1479,50 @@ class CustomFieldModelTest(TestCase):
         site = Site.objects.get(name='Test Site')
         self.assertEqual(site.cf['foo'], 'abc')
 
+    def test_cf_resolver(self):
+        """
+        Check that objects referenced by object and multi-object custom fields are retrieved for many objects at once.
+        """
+        site_type = ObjectType.objects.get_for_model(Site)
+        vlan_type = ObjectType.objects.get_for_model(VLAN)
+        cf_object = CustomField(type=CustomFieldTypeChoices.TYPE_OBJECT, name='vlan', related_object_type=vlan_type)
+        cf_object.save()
+        cf_object.object_types.set([site_type])
+        cf_multiobject = CustomField(
+            type=CustomFieldTypeChoices.TYPE_MULTIOBJECT,
+            name='vlans',
+            related_object_type=vlan_type
+        )
+        cf_multiobject.save()
+        cf_multiobject.object_types.set([site_type])
+
+        vlans = VLAN.objects.bulk_create([VLAN(name=f'VLAN {i}', vid=i) for i in range(1, 5)])
+        sites = Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}', custom_field_data={
+                'vlan': vlans[i].pk,
+                'vlans': [vlans[3].pk, vlans[i].pk],
+            }) for i in range(3)
+        ])
+        sites = list(Site.objects.filter(pk__in=[site.pk for site in sites]).order_by('name'))
+
+        resolver = CustomFieldResolver.for_objects(sites)
+        with self.assertNumQueries(1):
+            for i, site in enumerate(sites):
+                self.assertEqual(site.cf['vlan'], vlans[i])
+                self.assertEqual(list(site.cf['vlans']), [vlans[i], vlans[3]])
+                self.assertEqual(site.cf['vlans'].count(), 2)
+                self.assertIs(site.get_custom_field_resolver(), resolver)
+
+        # Objects not referenced by the original data are retrieved on demand
+        self.assertEqual(list(resolver.deserialize(cf_multiobject, [vlans[3].pk, 0])), [vlans[3]])
+        with self.assertNumQueries(0):
+            self.assertIsNone(resolver.deserialize(cf_object, 0))
+
+        # Multi-object values should retain the QuerySet API
+        vlans_value = sites[0].cf['vlans']
+        self.assertIsInstance(vlans_value, QuerySet)
+        self.assertEqual(list(vlans_value.filter(vid=4)), [vlans[3]])
+
     def test_invalid_data(self):
         """
         Setting custom field data for a non-applicable (or non-existent) CustomField should raise a ValidationError.
@@ -0,0 +1,151 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import ObjectType
+from dcim.models import Site
+from extras.management.commands.reindex import CHECKPOINT_CACHE_KEY, Command as ReindexCommand
+from extras.models import CachedValue
+from netbox.search.backends import search_backend
+
+
+class ReindexCommandTestCase(TestCase):
+    """
+    Test the reindex management command.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)
+        ])
+
+        # Mark the first two sites as having been modified long ago
+        cls.last_updated = timezone.now() - timedelta(days=30)
+        Site.objects.filter(slug__in=['site-1', 'site-2']).update(last_updated=cls.last_updated)
+
+    def setUp(self):
+        cache.delete(CHECKPOINT_CACHE_KEY)
+        CachedValue.objects.all().delete()
+
+    def tearDown(self):
+        cache.delete(CHECKPOINT_CACHE_KEY)
+
+    def _call_command(self, *args, **kwargs):
+        call_command('reindex', *args, stdout=StringIO(), **kwargs)
+
+    def assertSitesCached(self, *slugs):
+        """
+        Assert that cache entries exist for only the specified sites.
+        """
+        cached_pks = set(
+            CachedValue.objects.filter(object_type=ObjectType.objects.get_for_model(Site)).values_list(
+                'object_id', flat=True
+            )
+        )
+        self.assertEqual(
+            sorted(Site.objects.filter(pk__in=cached_pks).values_list('slug', flat=True)),
+            sorted(slugs)
+        )
+
+    def _save_checkpoint(self, since=None, completed_count=0):
+        """
+        Save a checkpoint for an interrupted reindexing of sites (in chunks of two), of which the first
+        `completed_count` chunks have been completed.
+        """
+        chunks = ReindexCommand._get_chunks('dcim.site', Site, 2, since=since)
+        cache.set(CHECKPOINT_CACHE_KEY, {
+            'since': since,
+            'chunks': chunks,
+            'completed': chunks[:completed_count],
+        })
+        return chunks
+
+    def test_reindex(self):
+        self._call_command('dcim.site', batch_size=2)
+
+        self.assertSitesCached('site-1', 'site-2', 'site-3', 'site-4', 'site-5')
+        self.assertIsNone(cache.get(CHECKPOINT_CACHE_KEY))
+
+    def test_reindex_lazy(self):
+        site = Site.objects.get(slug='site-1')
+        search_backend.cache(site)
+
+        self._call_command('dcim.site', lazy=True)
+
+        self.assertSitesCached('site-1')
+
+    def test_reindex_since(self):
+        self._call_command('dcim.site', since=(self.last_updated + timedelta(days=1)).isoformat())
+
+        self.assertSitesCached('site-3', 'site-4', 'site-5')
+
+    def test_reindex_since_date(self):
+        self._call_command('dcim.site', since=(self.last_updated + timedelta(days=1)).date().isoformat())
+
+        self.assertSitesCached('site-3', 'site-4', 'site-5')
+
+    def test_resume(self):
+        chunks = self._save_checkpoint(completed_count=1)
+        self.assertEqual(len(chunks), 3)
+
+        self._call_command(resume=True)
+
+        # Sites within the completed chunk are not reindexed
+        self.assertSitesCached('site-3', 'site-4', 'site-5')
+        self.assertIsNone(cache.get(CHECKPOINT_CACHE_KEY))
+
+    def test_resume_since(self):
+        since = self.last_updated + timedelta(days=1)
+        self._save_checkpoint(since=since)
+
+        self._call_command(resume=True)
+
+        # Only sites modified since the time recorded by the checkpoint are reindexed
+        self.assertSitesCached('site-3', 'site-4', 'site-5')
+
+    def test_resume_replaces_partial_entries(self):
+        self._save_checkpoint(completed_count=2)
+        site = Site.objects.get(slug='site-5')
+        search_backend.cache(site)
+        site_count = CachedValue.objects.filter(object_id=site.pk).count()
+
+        self._call_command(resume=True)
+
+        self.assertEqual(CachedValue.objects.filter(object_id=site.pk).count(), site_count)
+
+    def test_resume_without_checkpoint(self):
+        with self.assertRaisesMessage(CommandError, 'No reindexing checkpoint found.'):
+            self._call_command(resume=True)
+
+    def test_resume_invalid_arguments(self):
+        self._save_checkpoint()
+
+        for args, kwargs in (
+            (('dcim.site',), {}),
+            ((), {'since': '2025-01-01'}),
+            ((), {'lazy': True}),
+        ):
+            with self.subTest(args=args, kwargs=kwargs):
+                with self.assertRaises(CommandError):
+                    self._call_command(*args, resume=True, **kwargs)
+
+        # The checkpoint is retained
+        self.assertIsNotNone(cache.get(CHECKPOINT_CACHE_KEY))
+        self.assertSitesCached()
+
+    def test_invalid_arguments(self):
+        for args, kwargs in (
+            (('dcim.foo',), {}),
+            (('dcim.site.foo',), {}),
+            (('dcim.site',), {'since': 'not-a-date'}),
+            (('dcim.site',), {'workers': 0}),
+            (('dcim.site',), {'batch_size': 0}),
+        ):
+            with self.subTest(args=args, kwargs=kwargs):
+                with self.assertRaises(CommandError):
+                    self._call_command(*args, **kwargs)
@@ -2,9 +2,10 @@ from django.test import TestCase
 
 from core.models import ObjectType
 from dcim.models import Device, DeviceRole, DeviceType, Location, Manufacturer, Platform, Region, Site, SiteGroup
-from extras.models import ConfigContext, Tag
+from extras.models import ConfigContext, ConfigTemplate, Tag
 from tenancy.models import Tenant, TenantGroup
 from utilities.exceptions import AbortRequest
+from utilities.jinja2 import template_cache
 from virtualization.models import Cluster, ClusterGroup, ClusterType, VirtualMachine
 
 
@@ -478,3 +479,26 @@ class ConfigContextTest(TestCase):
         annotated_queryset = Device.objects.filter(name=device.name).annotate_config_context_data()
         self.assertEqual(ConfigContext.objects.get_for_object(device).count(), 2)
         self.assertEqual(device.get_config_context(), annotated_queryset[0].get_config_context())
+
+
+class ConfigTemplateTest(TestCase):
+
+    def setUp(self):
+        template_cache.clear()
+
+    def test_render_cached_template(self):
+        config_template = ConfigTemplate.objects.create(name='Template 1', template_code='Hello\r\n{{ name }}')
+        self.assertEqual(config_template.render({'name': 'foo\r\nbar'}), 'Hello\nfoo\nbar')
+        self.assertIs(config_template.get_template(), config_template.get_template())
+        self.assertEqual(len(template_cache), 1)
+
+        # Modifying the template code should result in the template being recompiled
+        config_template.template_code = 'Goodbye {{ name }}'
+        config_template.save()
+        self.assertEqual(config_template.render({'name': 'foo'}), 'Goodbye foo')
+
+        # Modifying the environment parameters should result in the template being recompiled
+        config_template.environment_params = {'trim_blocks': True}
+        config_template.save()
+        self.assertEqual(config_template.get_template().environment.trim_blocks, True)
+        self.assertEqual(len(template_cache), 3)
@@ -3,7 +3,7 @@ from django.urls import reverse
 
 from core.events import *
 from core.models import ObjectType
-from dcim.models import DeviceType, Manufacturer, Site
+from dcim.models import DeviceType, Manufacturer, Region, Site
 from extras.choices import *
 from extras.models import *
 from users.models import Group, User
@@ -619,6 +619,32 @@ class CustomLinkTest(TestCase):
         self.assertIn(f'FOO {site.name} BAR', str(response.content))
 
 
+class ExportTemplateRenderTest(TestCase):
+    user_permissions = ['dcim.view_site']
+
+    def test_export_objects_with_template(self):
+        export_template = ExportTemplate(
+            name='Test',
+            template_code='{% for site in queryset %}{{ site.name }},{{ site.region.name }}\r\n{% endfor %}'
+        )
+        export_template.save()
+        export_template.object_types.set([ObjectType.objects.get_for_model(Site)])
+
+        region = Region.objects.create(name='Region 1', slug='region-1')
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}', region=region) for i in range(1, 4)
+        ])
+
+        response = self.client.get(f'{reverse("dcim:site_list")}?export=Test')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            b''.join(response.streaming_content).decode(),
+            'Site 1,Region 1\nSite 2,Region 1\nSite 3,Region 1\n'
+        )
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="netbox_sites"')
+
+
 class SubscriptionTestCase(
     ViewTestCases.CreateObjectViewTestCase,
     ViewTestCases.DeleteObjectViewTestCase,
@@ -1,12 +1,16 @@
 import importlib
+from collections import defaultdict
 
 from django.core.exceptions import ImproperlyConfigured
 from taggit.managers import _TaggableManager
 
 from netbox.context import current_request
+from utilities.query import get_prefetched_queryset
+from .choices import CustomFieldTypeChoices
 from .validators import CustomValidator
 
 __all__ = (
+    'CustomFieldResolver',
     'image_upload',
     'is_report',
     'is_script',
@@ -84,3 +88,101 @@ def run_validators(instance, validators):
             raise ImproperlyConfigured(f"Invalid value for custom validator: {validator}")
 
         validator(instance, request)
+
+
+class CustomFieldResolver:
+    """
+    Deserialize custom field values for many objects (e.g. a page of results) at once. The objects referenced by
+    object and multi-object custom fields are retrieved using a single query per related model, the first time a
+    value referencing that model is deserialized.
+
+    Args:
+        custom_fields: An iterable of the CustomFields to be deserialized
+        data: An iterable of custom field data dictionaries (or of objects having a `custom_field_data` attribute)
+    """
+    def __init__(self, custom_fields, data):
+        self.custom_fields = list(custom_fields)
+        self.data = [
+            getattr(item, 'custom_field_data', item) or {} for item in data
+        ]
+        # Model -> {PK: (position, object)} for all objects retrieved thus far
+        self.objects = defaultdict(dict)
+        # Model -> set of PKs which have been looked up (including any which do not exist)
+        self.loaded = defaultdict(set)
+        # Models for which all references in the data have been retrieved
+        self.models = set()
+
+    @classmethod
+    def for_objects(cls, objects):
+        """
+        Return a new CustomFieldResolver for all custom fields of the given objects (which must all be of the same
+        model), and assign it to each object for use by its `cf` property and related methods.
+        """
+        from .models import CustomField
+
+        objects = list(objects)
+        if not objects:
+            return cls([], [])
+        resolver = cls(CustomField.objects.get_cached_for_model(objects[0]), objects)
+        for obj in objects:
+            obj._custom_field_resolver = resolver
+        return resolver
+
+    @staticmethod
+    def _get_pks(customfield, value):
+        if value is None:
+            return []
+        if customfield.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
+            return [customfield.related_object_type.model_class()._meta.pk.to_python(pk) for pk in value]
+        return [customfield.related_object_type.model_class()._meta.pk.to_python(value)]
+
+    def _load(self, model, pks):
+        """
+        Retrieve the specified objects, skipping any which have already been looked up.
+        """
+        pks = set(pks) - self.loaded[model]
+        if not pks:
+            return
+        self.loaded[model].update(pks)
+        objects = self.objects[model]
+        for obj in model.objects.filter(pk__in=pks):
+            objects[obj.pk] = (len(objects), obj)
+
+    def _load_model(self, model):
+        """
+        Retrieve all objects of the specified model referenced by any object or multi-object custom field in the data.
+        """
+        self.models.add(model)
+        pks = set()
+        for customfield in self.custom_fields:
+            if customfield.related_object_type and customfield.related_object_type.model_class() is model:
+                for data in self.data:
+                    pks.update(self._get_pks(customfield, data.get(customfield.name)))
+        self._load(model, pks)
+
+    def deserialize(self, customfield, value):
+        """
+        Return the deserialized value of the specified CustomField. As with CustomField.deserialize(), the value of a
+        multi-object field is returned as a QuerySet; its results are populated from the objects already retrieved.
+        """
+        if value is None or customfield.type not in (
+            CustomFieldTypeChoices.TYPE_OBJECT,
+            CustomFieldTypeChoices.TYPE_MULTIOBJECT
+        ):
+            return customfield.deserialize(value)
+
+        model = customfield.related_object_type.model_class()
+        if model not in self.models:
+            self._load_model(model)
+        pks = self._get_pks(customfield, value)
+        # Retrieve any objects not referenced by the original data
+        self._load(model, pks)
+
+        objects = self.objects[model]
+        if customfield.type == CustomFieldTypeChoices.TYPE_OBJECT:
+            obj = objects.get(pks[0])
+            return obj[1] if obj else None
+        return get_prefetched_queryset(
+            model.objects.filter(pk__in=pks),
+            [obj for _, obj in sorted(objects[pk] for pk in set(pks) if pk in objects)]
+        )
@@ -0,0 +1,147 @@
+import ipaddress
+from collections import defaultdict
+
+from django.db import connection
+
+from .choices import PrefixStatusChoices
+
+__all__ = (
+    'USED_CHILD_ADDRESSES',
+    'USED_CHILD_PREFIXES',
+    'get_available_intervals',
+    'get_interval_size',
+    'get_prefix_utilization',
+    'get_used_intervals',
+    'merge_intervals',
+)
+
+# Determine which objects within a target prefix occupy its address space
+USED_CHILD_PREFIXES = 'prefixes'
+USED_CHILD_ADDRESSES = 'addresses'
+
+USED_INTERVALS_QUERY = """
+WITH targets (idx, kind, prefix, vrf_id, any_vrf) AS (VALUES {targets})
+SELECT t.idx, HOST(NETWORK(p.prefix)), HOST(BROADCAST(p.prefix))
+FROM targets t
+JOIN ipam_prefix p ON p.prefix << t.prefix AND COALESCE(p.vrf_id, 0) = COALESCE(t.vrf_id, 0)
+WHERE t.kind = 'prefixes'
+UNION ALL
+SELECT t.idx, HOST(i.address), HOST(i.address)
+FROM targets t
+JOIN ipam_ipaddress i ON CAST(HOST(i.address) AS INET) <<= t.prefix
+    AND (t.any_vrf OR COALESCE(i.vrf_id, 0) = COALESCE(t.vrf_id, 0))
+WHERE t.kind = 'addresses'
+UNION ALL
+SELECT t.idx, HOST(r.start_address), HOST(r.end_address)
+FROM targets t
+JOIN ipam_iprange r ON CAST(HOST(r.start_address) AS INET) <<= t.prefix
+    AND CAST(HOST(r.end_address) AS INET) <<= t.prefix
+    AND COALESCE(r.vrf_id, 0) = COALESCE(t.vrf_id, 0)
+WHERE t.kind = 'addresses'
+"""
+
+
+#
+# Interval arithmetic
+#
+
+def merge_intervals(intervals):
+    """
+    Merge an iterable of inclusive (first, last) integer intervals, returning a sorted list of non-overlapping and
+    non-adjacent intervals.
+    """
+    merged = []
+    for first, last in sorted(intervals):
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def get_interval_size(intervals):
+    """
+    Return the total number of integers covered by a list of merged intervals.
+    """
+    return sum(last - first + 1 for first, last in intervals)
+
+
+def get_available_intervals(first, last, used):
+    """
+    Return the intervals within [first, last] not covered by the given list of merged intervals.
+    """
+    available = []
+    for used_first, used_last in used:
+        if used_last < first:
+            continue
+        if used_first > last:
+            break
+        if used_first > first:
+            available.append((first, used_first - 1))
+        first = used_last + 1
+    if first <= last:
+        available.append((first, last))
+    return available
+
+
+#
+# Database queries
+#
+
+def _get_used_kind(prefix):
+    if prefix.status == PrefixStatusChoices.STATUS_CONTAINER:
+        return USED_CHILD_PREFIXES
+    return USED_CHILD_ADDRESSES
+
+
+def get_used_intervals(targets):
+    """
+    Retrieve the address space occupied within each of the given targets using a single query. Each target is a
+    tuple of (prefix, VRF ID, kind, any_vrf), where kind indicates whether child prefixes or child IP addresses and
+    ranges are to be considered, and any_vrf indicates that IP addresses in any VRF are to be considered. Returns a
+    list of merged (first, last) integer intervals for each target.
+    """
+    intervals = defaultdict(list)
+    if targets:
+        values = ', '.join(['(%s, %s, CAST(%s AS CIDR), CAST(%s AS BIGINT), %s)'] * len(targets))
+        params = []
+        for i, (prefix, vrf_id, kind, any_vrf) in enumerate(targets):
+            params.extend((i, kind, str(prefix), vrf_id, any_vrf))
+
+        with connection.cursor() as cursor:
+            cursor.execute(USED_INTERVALS_QUERY.format(targets=values), params)
+            for i, first, last in cursor.fetchall():
+                intervals[i].append((int(ipaddress.ip_address(first)), int(ipaddress.ip_address(last))))
+
+    return [merge_intervals(intervals[i]) for i in range(len(targets))]
+
+
+def get_prefix_utilization(prefixes):
+    """
+    Calculate the utilization of each of the given Prefixes (as a percentage) using a single query, returning a list
+    of values in the same order. Utilization of a container is based on its child prefixes; for all others, it is
+    based on child IP addresses and ranges.
+    """
+    targets = [
+        (prefix.prefix, prefix.vrf_id, _get_used_kind(prefix), False) for prefix in prefixes
+    ]
+    used_intervals = get_used_intervals([
+        target for prefix, target in zip(prefixes, targets) if not prefix.mark_utilized
+    ])
+    used_intervals.reverse()
+
+    utilization = []
+    for prefix in prefixes:
+        if prefix.mark_utilized:
+            utilization.append(100)
+            continue
+
+        used_size = get_interval_size(used_intervals.pop())
+        prefix_size = prefix.prefix.size
+        if _get_used_kind(prefix) == USED_CHILD_ADDRESSES:
+            if prefix.family == 4 and prefix.mask_length < 31 and not prefix.is_pool:
+                prefix_size -= 2
+        utilization.append(min(float(used_size) / prefix_size * 100, 100))
+
+    return utilization
@@ -6,6 +6,7 @@ import strawberry_django
 from circuits.graphql.types import ProviderType
 from dcim.graphql.types import SiteType
 from ipam import models
+from netbox.graphql.optimizer import prefetch_generic_foreign_key
 from netbox.graphql.scalars import BigInt
 from netbox.graphql.types import BaseObjectType, NetBoxObjectType, OrganizationalObjectType
 from .filters import *
@@ -107,7 +108,10 @@ class FHRPGroupType(NetBoxObjectType, IPAddressesMixin):
 class FHRPGroupAssignmentType(BaseObjectType):
     group: Annotated["FHRPGroupType", strawberry.lazy('ipam.graphql.types')]
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['interface_type', 'interface_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.FHRPGroupAssignment, 'interface')]
+    )
     def interface(self) -> Annotated[Union[
         Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')],
         Annotated["VMInterfaceType", strawberry.lazy('virtualization.graphql.types')],
@@ -130,7 +134,10 @@ class IPAddressType(NetBoxObjectType, BaseIPAddressFamilyType):
     tunnel_terminations: List[Annotated["TunnelTerminationType", strawberry.lazy('vpn.graphql.types')]]
     services: List[Annotated["ServiceType", strawberry.lazy('ipam.graphql.types')]]
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['assigned_object_type', 'assigned_object_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.IPAddress, 'assigned_object')]
+    )
     def assigned_object(self) -> Annotated[Union[
         Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')],
         Annotated["FHRPGroupType", strawberry.lazy('ipam.graphql.types')],
@@ -164,7 +171,10 @@ class PrefixType(NetBoxObjectType, BaseIPAddressFamilyType):
     vlan: Annotated["VLANType", strawberry.lazy('ipam.graphql.types')] | None
     role: Annotated["RoleType", strawberry.lazy('ipam.graphql.types')] | None
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['scope_type', 'scope_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.Prefix, 'scope')]
+    )
     def scope(self) -> Annotated[Union[
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RegionType", strawberry.lazy('dcim.graphql.types')],
@@ -267,7 +277,10 @@ class VLANGroupType(OrganizationalObjectType):
     vlans: List[VLANType]
     vid_ranges: List[str]
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['scope_type', 'scope_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.VLANGroup, 'scope')]
+    )
     def scope(self) -> Annotated[Union[
         Annotated["ClusterType", strawberry.lazy('virtualization.graphql.types')],
         Annotated["ClusterGroupType", strawberry.lazy('virtualization.graphql.types')],
@@ -1,27 +1,71 @@
-from django.core.management.base import BaseCommand
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 
 from ipam.models import Prefix, VRF
-from ipam.utils import rebuild_prefixes
+from ipam.utils import get_inconsistent_prefixes, rebuild_prefixes
 
 
 class Command(BaseCommand):
     help = "Rebuild the prefix hierarchy (depth and children counts)"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help="Report any prefixes with incorrect depth or children counts without rebuilding the hierarchy"
+        )
+        parser.add_argument(
+            '--parallel', type=int, default=1, metavar='WORKERS',
+            help="The number of VRFs to rebuild concurrently, each in its own process (default: 1)"
+        )
+
+    def check_prefixes(self):
+        inconsistent_count = 0
+        for vrf in [None, *VRF.objects.all()]:
+            for prefix in get_inconsistent_prefixes(vrf):
+                inconsistent_count += 1
+                self.stdout.write(
+                    f'{vrf or "Global"}: {prefix} (ID {prefix.pk}) has depth {prefix._depth} (expected '
+                    f'{prefix.hierarchy_depth}) and {prefix._children} children (expected {prefix.hierarchy_children})'
+                )
+
+        if inconsistent_count:
+            self.stdout.write(self.style.ERROR(f'Found {inconsistent_count} inconsistent prefixes.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('The prefix hierarchy is consistent.'))
+
     def handle(self, *model_names, **options):
-        self.stdout.write(f'Rebuilding {Prefix.objects.count()} prefixes...')
+        if options['check']:
+            self.check_prefixes()
+            return
+
+        workers = options['parallel']
+        if workers < 1:
+            raise CommandError("The number of workers must be at least 1.")
 
-        # Reset existing counts
-        Prefix.objects.update(_depth=0, _children=0)
+        self.stdout.write(f'Rebuilding {Prefix.objects.count()} prefixes...')
 
-        # Rebuild the global table
-        global_count = Prefix.objects.filter(vrf__isnull=True).count()
-        self.stdout.write(f'Global: {global_count} prefixes...')
-        rebuild_prefixes(None)
+        # Rebuild the global table and each VRF. rebuild_prefixes() calculates the depth and child count of every
+        # prefix, so existing counts need not be reset first.
+        vrfs = {None: 'Global'}
+        vrfs.update({vrf.pk: f'VRF {vrf}' for vrf in VRF.objects.all()})
 
-        # Rebuild each VRF
-        for vrf in VRF.objects.all():
-            vrf_count = Prefix.objects.filter(vrf=vrf).count()
-            self.stdout.write(f'VRF {vrf}: {vrf_count} prefixes...')
-            rebuild_prefixes(vrf.pk)
+        if workers > 1:
+            # Close any open database connections before forking; each worker will establish its own
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = {
+                    executor.submit(rebuild_prefixes, vrf_id): vrf_id for vrf_id in vrfs
+                }
+                for future in as_completed(futures):
+                    future.result()
+                    self.stdout.write(f'{vrfs[futures[future]]}: Done')
+        else:
+            for vrf_id, name in vrfs.items():
+                vrf_count = Prefix.objects.filter(vrf=vrf_id).count()
+                self.stdout.write(f'{name}: {vrf_count} prefixes...')
+                rebuild_prefixes(vrf_id)
 
         self.stdout.write(self.style.SUCCESS('Finished.'))
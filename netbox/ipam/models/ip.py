@@ -9,6 +9,9 @@ from django.utils.translation import gettext_lazy as _
 
 from core.models import ObjectType
 from dcim.models.mixins import CachedScopeMixin
+from ipam.allocation import (
+    USED_CHILD_ADDRESSES, get_available_intervals, get_interval_size, get_prefix_utilization, get_used_intervals,
+)
 from ipam.choices import *
 from ipam.constants import *
 from ipam.fields import IPNetworkField, IPAddressField
@@ -403,74 +406,65 @@ class Prefix(ContactsMixin, GetAvailablePrefixesMixin, CachedScopeMixin, Primary
         else:
             return IPAddress.objects.filter(address__net_host_contained=str(self.prefix), vrf=self.vrf)
 
-    def get_available_ips(self):
+    def get_available_ip_intervals(self):
         """
-        Return all available IPs within this prefix as an IPSet.
+        Return all available IPs within this prefix as a list of (first, last) integer intervals.
         """
         if self.mark_utilized:
-            return netaddr.IPSet()
+            return []
 
-        prefix = netaddr.IPSet(self.prefix)
-        child_ips = netaddr.IPSet([ip.address.ip for ip in self.get_child_ips()])
-        child_ranges = []
-        for iprange in self.get_child_ranges():
-            child_ranges.append(iprange.range)
-        available_ips = prefix - child_ips - netaddr.IPSet(child_ranges)
+        first, last = self.prefix.first, self.prefix.last
 
         # IPv6 /127's, pool, or IPv4 /31-/32 sets are fully usable
-        if (self.family == 6 and self.prefix.prefixlen >= 127) or self.is_pool or (
+        if not ((self.family == 6 and self.prefix.prefixlen >= 127) or self.is_pool or (
                 self.family == 4 and self.prefix.prefixlen >= 31
-        ):
-            return available_ips
-
-        if self.family == 4:
-            # For "normal" IPv4 prefixes, omit first and last addresses
-            available_ips -= netaddr.IPSet([
-                netaddr.IPAddress(self.prefix.first),
-                netaddr.IPAddress(self.prefix.last),
-            ])
-        else:
-            # For IPv6 prefixes, omit the Subnet-Router anycast address
-            # per RFC 4291
-            available_ips -= netaddr.IPSet([netaddr.IPAddress(self.prefix.first)])
-        return available_ips
+        )):
+            if self.family == 4:
+                # For "normal" IPv4 prefixes, omit first and last addresses
+                first, last = first + 1, last - 1
+            else:
+                # For IPv6 prefixes, omit the Subnet-Router anycast address
+                # per RFC 4291
+                first += 1
+
+        # Consider child IPs in any VRF if this is a container in the global table
+        any_vrf = self.vrf_id is None and self.status == PrefixStatusChoices.STATUS_CONTAINER
+        used_intervals = get_used_intervals([
+            (self.prefix, self.vrf_id, USED_CHILD_ADDRESSES, any_vrf)
+        ])[0]
+
+        return get_available_intervals(first, last, used_intervals)
+
+    def get_available_ips(self):
+        """
+        Return all available IPs within this prefix as an IPSet.
+        """
+        return netaddr.IPSet([
+            netaddr.IPRange(netaddr.IPAddress(first, self.family), netaddr.IPAddress(last, self.family))
+            for first, last in self.get_available_ip_intervals()
+        ])
+
+    def get_available_ip_count(self):
+        """
+        Return the number of available IPs within this prefix.
+        """
+        return get_interval_size(self.get_available_ip_intervals())
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
+        available_ips = self.get_available_ip_intervals()
         if not available_ips:
             return None
-        return '{}/{}'.format(next(available_ips.__iter__()), self.prefix.prefixlen)
+        return '{}/{}'.format(netaddr.IPAddress(available_ips[0][0], self.family), self.prefix.prefixlen)
 
     def get_utilization(self):
         """
         Determine the utilization of the prefix and return it as a percentage. For Prefixes with a status of
         "container", calculate utilization based on child prefixes. For all others, count child IP addresses.
         """
-        if self.mark_utilized:
-            return 100
-
-        if self.status == PrefixStatusChoices.STATUS_CONTAINER:
-            queryset = Prefix.objects.filter(
-                prefix__net_contained=str(self.prefix),
-                vrf=self.vrf
-            )
-            child_prefixes = netaddr.IPSet([p.prefix for p in queryset])
-            utilization = float(child_prefixes.size) / self.prefix.size * 100
-        else:
-            # Compile an IPSet to avoid counting duplicate IPs
-            child_ips = netaddr.IPSet(
-                [_.range for _ in self.get_child_ranges()] + [_.address.ip for _ in self.get_child_ips()]
-            )
-
-            prefix_size = self.prefix.size
-            if self.prefix.version == 4 and self.prefix.prefixlen < 31 and not self.is_pool:
-                prefix_size -= 2
-            utilization = float(child_ips.size) / prefix_size * 100
-
-        return min(utilization, 100)
+        return get_prefix_utilization([self])[0]
 
 
 class IPRange(ContactsMixin, PrimaryModel):
@@ -32,6 +32,26 @@ class ASNRangeQuerySet(RestrictedQuerySet):
         return self.annotate(asn_count=Subquery(asns))
 
 
+def _hierarchy_depth():
+    return RawSQL(
+        'SELECT COUNT(DISTINCT U0."prefix") AS "c" '
+        'FROM "ipam_prefix" U0 '
+        'WHERE (U0."prefix" >> "ipam_prefix"."prefix" '
+        'AND COALESCE(U0."vrf_id", 0) = COALESCE("ipam_prefix"."vrf_id", 0))',
+        ()
+    )
+
+
+def _hierarchy_children():
+    return RawSQL(
+        'SELECT COUNT(U1."prefix") AS "c" '
+        'FROM "ipam_prefix" U1 '
+        'WHERE (U1."prefix" << "ipam_prefix"."prefix" '
+        'AND COALESCE(U1."vrf_id", 0) = COALESCE("ipam_prefix"."vrf_id", 0))',
+        ()
+    )
+
+
 class PrefixQuerySet(RestrictedQuerySet):
 
     def annotate_hierarchy(self):
@@ -40,22 +60,21 @@ class PrefixQuerySet(RestrictedQuerySet):
         comparison. (NULL != NULL).
         """
         return self.annotate(
-            hierarchy_depth=RawSQL(
-                'SELECT COUNT(DISTINCT U0."prefix") AS "c" '
-                'FROM "ipam_prefix" U0 '
-                'WHERE (U0."prefix" >> "ipam_prefix"."prefix" '
-                'AND COALESCE(U0."vrf_id", 0) = COALESCE("ipam_prefix"."vrf_id", 0))',
-                ()
-            ),
-            hierarchy_children=RawSQL(
-                'SELECT COUNT(U1."prefix") AS "c" '
-                'FROM "ipam_prefix" U1 '
-                'WHERE (U1."prefix" << "ipam_prefix"."prefix" '
-                'AND COALESCE(U1."vrf_id", 0) = COALESCE("ipam_prefix"."vrf_id", 0))',
-                ()
-            )
+            hierarchy_depth=_hierarchy_depth(),
+            hierarchy_children=_hierarchy_children()
         )
 
+    def update_hierarchy(self, depth=True, children=True):
+        """
+        Recalculate and save the depth and/or number of child prefixes for each Prefix within a single query.
+        """
+        fields = {}
+        if depth:
+            fields['_depth'] = _hierarchy_depth()
+        if children:
+            fields['_children'] = _hierarchy_children()
+        return self.update(**fields)
+
 
 class VLANGroupQuerySet(RestrictedQuerySet):
 
@@ -2,28 +2,21 @@ from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from dcim.models import Device
+from netbox.context import prefix_rebuild_queue
 from virtualization.models import VirtualMachine
 from .models import IPAddress, Prefix
 
 
-def update_parents_children(prefix):
+def update_hierarchy(prefix):
     """
-    Update depth on prefix & containing prefixes
+    Recalculate the cached depth and child count of all prefixes affected by the addition or removal of the given
+    Prefix (e.g. because it has been created, moved, or deleted). The child count of each containing prefix (and of
+    the prefix itself) is recounted, as is the depth of each covered prefix. Absolute values are computed so that any
+    stale values are corrected rather than compounded.
     """
-    parents = prefix.get_parents(include_self=True).annotate_hierarchy()
-    for parent in parents:
-        parent._children = parent.hierarchy_children
-    Prefix.objects.bulk_update(parents, ['_children'], batch_size=100)
-
-
-def update_children_depth(prefix):
-    """
-    Update children count on prefix & contained prefixes
-    """
-    children = prefix.get_children(include_self=True).annotate_hierarchy()
-    for child in children:
-        child._depth = child.hierarchy_depth
-    Prefix.objects.bulk_update(children, ['_depth'], batch_size=100)
+    prefixes = Prefix.objects.filter(vrf_id=prefix.vrf_id)
+    prefixes.filter(prefix__net_contains_or_equals=prefix.prefix).update_hierarchy()
+    prefixes.filter(prefix__net_contained=prefix.prefix).update_hierarchy(children=False)
 
 
 @receiver(post_save, sender=Prefix)
@@ -32,21 +25,35 @@ def handle_prefix_saved(instance, created, **kwargs):
     # Prefix has changed (or new instance has been created)
     if created or instance.vrf_id != instance._vrf_id or instance.prefix != instance._prefix:
 
-        update_parents_children(instance)
-        update_children_depth(instance)
+        # If the hierarchy is being rebuilt in bulk, simply record the affected VRFs
+        if (queue := prefix_rebuild_queue.get()) is not None:
+            queue.add(instance.vrf_id)
+            if not created:
+                queue.add(instance._vrf_id)
+
+        else:
+            # If this is not a new prefix, clean up parent/children of previous prefix
+            if not created:
+                update_hierarchy(Prefix(pk=instance.pk, vrf_id=instance._vrf_id, prefix=instance._prefix))
+            update_hierarchy(instance)
+            instance._depth, instance._children = Prefix.objects.filter(pk=instance.pk).values_list(
+                '_depth', '_children'
+            ).get()
 
-        # If this is not a new prefix, clean up parent/children of previous prefix
-        if not created:
-            old_prefix = Prefix(vrf_id=instance._vrf_id, prefix=instance._prefix)
-            update_parents_children(old_prefix)
-            update_children_depth(old_prefix)
+        # Update the cached prefix & VRF so that the changes are not applied again if the instance is re-saved
+        instance._prefix = instance.prefix
+        instance._vrf_id = instance.vrf_id
 
 
 @receiver(post_delete, sender=Prefix)
 def handle_prefix_deleted(instance, **kwargs):
 
-    update_parents_children(instance)
-    update_children_depth(instance)
+    # If the hierarchy is being rebuilt in bulk, simply record the affected VRF
+    if (queue := prefix_rebuild_queue.get()) is not None:
+        queue.add(instance.vrf_id)
+        return
+
+    update_hierarchy(instance)
 
 
 @receiver(pre_delete, sender=IPAddress)
@@ -3,6 +3,7 @@ import django_tables2 as tables
 from django.utils.safestring import mark_safe
 from django_tables2.utils import Accessor
 
+from ipam.allocation import get_prefix_utilization
 from ipam.models import *
 from netbox.tables import NetBoxTable, columns
 from tenancy.tables import TenancyColumnsMixin, TenantColumn
@@ -152,6 +153,37 @@ class PrefixUtilizationColumn(columns.UtilizationColumn):
     {% endif %}
     """
 
+    def __init__(self, *args, **kwargs):
+        # Utilization is calculated in bulk for all prefixes in the table (see get_utilization())
+        kwargs.setdefault('accessor', 'pk')
+        kwargs.setdefault('empty_values', ())
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def get_utilization(record, table):
+        """
+        Return the utilization of a prefix. Utilization is calculated for all prefixes on the table's current page at
+        once, using a single query.
+        """
+        if not record.pk:
+            return None
+        if not hasattr(table, '_prefix_utilization') or record.pk not in table._prefix_utilization:
+            prefixes = [row.record for row in table.paginated_rows if row.record.pk]
+            table._prefix_utilization = dict(zip(
+                [prefix.pk for prefix in prefixes],
+                get_prefix_utilization(prefixes)
+            ))
+        return table._prefix_utilization.get(record.pk)
+
+    def render(self, record, table, **kwargs):
+        kwargs['value'] = self.get_utilization(record, table)
+        return super().render(record=record, table=table, **kwargs)
+
+    def value(self, record, table, **kwargs):
+        if (utilization := self.get_utilization(record, table)) is None:
+            return ''
+        return f'{utilization}%'
+
 
 class PrefixTable(TenancyColumnsMixin, NetBoxTable):
     prefix = columns.TemplateColumn(
@@ -219,7 +251,6 @@ class PrefixTable(TenancyColumnsMixin, NetBoxTable):
     )
     utilization = PrefixUtilizationColumn(
         verbose_name=_('Utilization'),
-        accessor='get_utilization',
         orderable=False
     )
     comments = columns.MarkdownColumn(
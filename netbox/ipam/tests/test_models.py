@@ -3,8 +3,10 @@ from django.test import TestCase, override_settings
 from netaddr import IPNetwork, IPSet
 from utilities.data import string_to_ranges
 
+from ipam.allocation import get_prefix_utilization
 from ipam.choices import *
 from ipam.models import *
+from ipam.utils import deferred_prefix_rebuild, get_inconsistent_prefixes, rebuild_prefixes
 
 
 class TestAggregate(TestCase):
@@ -290,6 +292,35 @@ class TestPrefix(TestCase):
         IPRange.objects.create(start_address=IPNetwork('10.0.0.33/24'), end_address=IPNetwork('10.0.0.64/24'))
         self.assertEqual(prefix.get_utilization(), 64 / 254 * 100)  # ~25% utilization
 
+    def test_get_prefix_utilization(self):
+        prefixes = Prefix.objects.bulk_create((
+            Prefix(prefix=IPNetwork('10.0.0.0/24'), status=PrefixStatusChoices.STATUS_CONTAINER),
+            Prefix(prefix=IPNetwork('10.0.0.0/26')),
+            Prefix(prefix=IPNetwork('10.0.0.0/27')),
+            Prefix(prefix=IPNetwork('10.0.0.128/26'), mark_utilized=True),
+            Prefix(prefix=IPNetwork('2001:db8::/126'), is_pool=True),
+        ))
+        IPAddress.objects.bulk_create([
+            IPAddress(address=IPNetwork(f'10.0.0.{i}/24')) for i in range(1, 5)
+        ] + [
+            IPAddress(address=IPNetwork('2001:db8::1/126')),
+        ])
+        IPRange.objects.create(start_address=IPNetwork('10.0.0.3/24'), end_address=IPNetwork('10.0.0.10/24'))
+
+        utilization = get_prefix_utilization(prefixes)
+        self.assertEqual(utilization, [prefix.get_utilization() for prefix in prefixes])
+        self.assertEqual(utilization, [50, 10 / 62 * 100, 10 / 30 * 100, 100, 25])
+
+    def test_get_available_ip_count(self):
+        prefix = Prefix.objects.create(prefix=IPNetwork('10.0.0.0/24'))
+        IPAddress.objects.bulk_create([
+            IPAddress(address=IPNetwork(f'10.0.0.{i}/24')) for i in range(1, 5)
+        ])
+        IPRange.objects.create(start_address=IPNetwork('10.0.0.3/24'), end_address=IPNetwork('10.0.0.10/24'))
+
+        self.assertEqual(prefix.get_available_ip_count(), 244)
+        self.assertEqual(prefix.get_available_ip_count(), prefix.get_available_ips().size)
+
     #
     # Uniqueness enforcement tests
     #
@@ -515,6 +546,56 @@ class TestPrefixHierarchy(TestCase):
         self.assertEqual(prefixes[3]._depth, 2)
         self.assertEqual(prefixes[3]._children, 0)
 
+    def test_hierarchy_consistency(self):
+        # Create, modify, and delete prefixes in a variety of ways
+        Prefix(prefix='10.0.0.0/12').save()
+        Prefix(prefix='10.0.0.0/16').save()
+        Prefix(prefix='10.1.0.0/24').save()
+        p = Prefix.objects.get(prefix='10.0.0.0/24')
+        p.prefix = '10.0.0.0/20'
+        p.save()
+        p.save()
+        Prefix.objects.filter(prefix='10.0.0.0/16').first().delete()
+        Prefix.objects.get(prefix='10.0.0.0/8').delete()
+
+        self.assertFalse(get_inconsistent_prefixes(None).exists())
+
+    def test_stale_hierarchy_corrected(self):
+        # Stale values for the affected prefixes should be recalculated rather than adjusted
+        Prefix.objects.update(_depth=0, _children=0)
+        Prefix.objects.get(prefix='10.0.0.0/16').delete()
+
+        prefixes = Prefix.objects.filter(prefix__family=4)
+        self.assertFalse(get_inconsistent_prefixes(None).filter(pk__in=prefixes).exists())
+        self.assertEqual(prefixes.get(prefix='10.0.0.0/8')._children, 1)
+        self.assertEqual(prefixes.get(prefix='10.0.0.0/24')._depth, 1)
+
+    def test_rebuild_prefixes(self):
+        Prefix(prefix='10.0.0.0/16').save()
+        Prefix(prefix='10.0.1.0/24').save()
+        Prefix(prefix='2001:db8::/36').save()
+        Prefix.objects.update(_depth=5, _children=5)
+
+        rebuild_prefixes(None)
+
+        self.assertFalse(get_inconsistent_prefixes(None).exists())
+        prefix = Prefix.objects.get(prefix='10.0.0.0/8')
+        self.assertEqual(prefix._depth, 0)
+        self.assertEqual(prefix._children, 4)
+
+    def test_deferred_prefix_rebuild(self):
+        with deferred_prefix_rebuild():
+            Prefix(prefix='10.0.0.0/12').save()
+            Prefix(prefix='10.0.0.0/20').save()
+            Prefix.objects.get(prefix='10.0.0.0/16').delete()
+
+            # The hierarchy is not updated until the context exits
+            self.assertEqual(Prefix.objects.get(prefix='10.0.0.0/8')._children, 2)
+
+        self.assertFalse(get_inconsistent_prefixes(None).exists())
+        prefix = Prefix.objects.get(prefix='10.0.0.0/8')
+        self.assertEqual(prefix._children, 3)
+
 
 class TestIPAddress(TestCase):
 
@@ -5,6 +5,7 @@ from django.test import override_settings
 from django.urls import reverse
 from netaddr import IPNetwork
 
+from core.models import ObjectChange
 from dcim.constants import InterfaceTypeChoices
 from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site, Interface
 from ipam.choices import *
@@ -701,6 +702,33 @@ class IPAddressTestCase(ViewTestCases.PrimaryObjectViewTestCase):
             'description': 'New description',
         }
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_bulk_edit_status(self):
+        ipaddresses = IPAddress.objects.all()
+        tenant = Tenant.objects.create(name='Tenant 1', slug='tenant-1')
+        self.add_permissions('ipam.change_ipaddress')
+
+        # Modify only fields which can be updated in bulk
+        data = {
+            'pk': [ipaddress.pk for ipaddress in ipaddresses],
+            'status': IPAddressStatusChoices.STATUS_DEPRECATED,
+            'tenant': tenant.pk,
+            '_apply': True,
+        }
+        response = self.client.post(self._get_url('bulk_edit'), data)
+        self.assertHttpStatus(response, 302)
+        for ipaddress in IPAddress.objects.all():
+            self.assertEqual(ipaddress.status, IPAddressStatusChoices.STATUS_DEPRECATED)
+            self.assertEqual(ipaddress.tenant, tenant)
+
+        # Verify that a change record was created for each object
+        changes = ObjectChange.objects.filter(changed_object_type=ContentType.objects.get_for_model(IPAddress))
+        self.assertEqual(changes.count(), ipaddresses.count())
+        for change in changes:
+            self.assertEqual(change.prechange_data['status'], IPAddressStatusChoices.STATUS_ACTIVE)
+            self.assertEqual(change.postchange_data['status'], IPAddressStatusChoices.STATUS_DEPRECATED)
+            self.assertEqual(change.postchange_data['tenant'], tenant.pk)
+
 
 class FHRPGroupTestCase(ViewTestCases.PrimaryObjectViewTestCase):
     model = FHRPGroup
@@ -1,5 +1,11 @@
+import ipaddress
+from contextlib import contextmanager
+
 import netaddr
+from django.db import connection, transaction
+from django.db.models import F
 
+from netbox.context import prefix_rebuild_queue
 from .constants import *
 from .models import Prefix, VLAN
 
@@ -7,6 +13,8 @@ __all__ = (
     'add_available_ipaddresses',
     'add_available_vlans',
     'add_requested_prefixes',
+    'deferred_prefix_rebuild',
+    'get_inconsistent_prefixes',
     'get_next_available_prefix',
     'rebuild_prefixes',
 )
@@ -148,64 +156,93 @@ def add_available_vlans(vlans, vlan_group):
     return vlans
 
 
-def rebuild_prefixes(vrf):
+def _get_prefix_range(prefix):
+    """
+    Return the IP version and the first & last addresses (as integers) of a prefix given in CIDR notation.
+    """
+    address, prefixlen = prefix.split('/')
+    address = ipaddress.ip_address(address)
+    first = int(address)
+    return address.version, first, first + (1 << (address.max_prefixlen - int(prefixlen))) - 1
+
+
+def rebuild_prefixes(vrf, batch_size=10000):
     """
     Rebuild the prefix hierarchy for all prefixes in the specified VRF (or global table).
+
+    Prefixes are streamed in order from a server-side cursor and compared as integer ranges. The resulting depth and
+    child counts are copied into a temporary table in batches, and finally applied with a single UPDATE.
     """
-    def contains(parent, child):
-        return child in parent and child != parent
-
-    def push_to_stack(prefix):
-        # Increment child count on parent nodes
-        for n in stack:
-            n['children'] += 1
-        stack.append({
-            'pk': [prefix['pk']],
-            'prefix': prefix['prefix'],
-            'children': 0,
-        })
+    vrf_id = getattr(vrf, 'pk', vrf)
+    table = Prefix._meta.db_table
+    temp_table = f'{table}_hierarchy'
+
+    stack = []  # (pks, range, number of prefixes seen when pushed)
+    results = []  # (pk, depth, children)
+    seen = 0
+
+    def pop_from_stack():
+        pks, _, pushed_at = stack.pop()
+        # All prefixes seen since this node was pushed (excluding the node itself and its duplicates) are its children
+        children = seen - pushed_at - len(pks)
+        results.extend((pk, len(stack), children) for pk in pks)
+
+    def flush_results(cursor):
+        with cursor.copy(f'COPY {temp_table} (id, depth, children) FROM STDIN') as copy:
+            for row in results:
+                copy.write_row(row)
+        results.clear()
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TEMPORARY TABLE {temp_table} (id bigint, depth smallint, children bigint) ON COMMIT DROP'
+            )
 
-    stack = []
-    update_queue = []
-    prefixes = Prefix.objects.filter(vrf=vrf).values('pk', 'prefix')
-
-    # Iterate through all Prefixes in the VRF, growing and shrinking the stack as we go
-    for i, p in enumerate(prefixes):
-
-        # Grow the stack if this is a child of the most recent prefix
-        if not stack or contains(stack[-1]['prefix'], p['prefix']):
-            push_to_stack(p)
-
-        # Handle duplicate prefixes
-        elif stack[-1]['prefix'] == p['prefix']:
-            stack[-1]['pk'].append(p['pk'])
-
-        # If this is a sibling or parent of the most recent prefix, pop nodes from the
-        # stack until we reach a parent prefix (or the root)
-        else:
-            while stack and not contains(stack[-1]['prefix'], p['prefix']):
-                node = stack.pop()
-                for pk in node['pk']:
-                    update_queue.append(
-                        Prefix(pk=pk, _depth=len(stack), _children=node['children'])
+            with connection.chunked_cursor() as prefix_cursor:
+                if vrf_id is None:
+                    prefix_cursor.execute(f'SELECT id, prefix FROM {table} WHERE vrf_id IS NULL ORDER BY prefix, id')
+                else:
+                    prefix_cursor.execute(
+                        f'SELECT id, prefix FROM {table} WHERE vrf_id = %s ORDER BY prefix, id', [vrf_id]
                     )
-            push_to_stack(p)
-
-        # Flush the update queue once it reaches 100 Prefixes
-        if len(update_queue) >= 100:
-            Prefix.objects.bulk_update(update_queue, ['_depth', '_children'])
-            update_queue = []
-
-    # Clear out any prefixes remaining in the stack
-    while stack:
-        node = stack.pop()
-        for pk in node['pk']:
-            update_queue.append(
-                Prefix(pk=pk, _depth=len(stack), _children=node['children'])
-            )
 
-    # Final flush of any remaining Prefixes
-    Prefix.objects.bulk_update(update_queue, ['_depth', '_children'])
+                # Iterate through all Prefixes in the VRF, growing and shrinking the stack as we go
+                while rows := prefix_cursor.fetchmany(batch_size):
+                    for pk, prefix in rows:
+                        version, first, last = prefix_range = _get_prefix_range(prefix)
+
+                        # Handle duplicate prefixes
+                        if stack and stack[-1][1] == prefix_range:
+                            stack[-1][0].append(pk)
+
+                        else:
+                            # Pop nodes from the stack until we reach a parent prefix (or the root)
+                            while stack and not (
+                                stack[-1][1][0] == version and stack[-1][1][1] <= first and last <= stack[-1][1][2]
+                            ):
+                                pop_from_stack()
+                            stack.append(([pk], prefix_range, seen))
+
+                        seen += 1
+
+                    # Flush the results in batches
+                    if len(results) >= batch_size:
+                        flush_results(cursor)
+
+            # Clear out any prefixes remaining in the stack
+            while stack:
+                pop_from_stack()
+            flush_results(cursor)
+
+            # Apply the results, updating only those prefixes which have changed
+            cursor.execute(
+                f'UPDATE {table} SET _depth = t.depth, _children = t.children '
+                f'FROM {temp_table} t '
+                f'WHERE {table}.id = t.id '
+                f'AND ({table}._depth, {table}._children) IS DISTINCT FROM (t.depth, t.children)'
+            )
+            cursor.execute(f'DROP TABLE {temp_table}')
 
 
 def get_next_available_prefix(ipset, prefix_size):
@@ -218,3 +255,36 @@ def get_next_available_prefix(ipset, prefix_size):
             ipset.remove(allocated_prefix)
             return allocated_prefix
     return None
+
+
+def get_inconsistent_prefixes(vrf):
+    """
+    Return all prefixes in the specified VRF (or global table) whose cached depth or child count differs from the
+    actual hierarchy.
+    """
+    return Prefix.objects.filter(vrf=vrf).annotate_hierarchy().exclude(
+        _depth=F('hierarchy_depth'),
+        _children=F('hierarchy_children')
+    )
+
+
+@contextmanager
+def deferred_prefix_rebuild():
+    """
+    Suspend the incremental maintenance of the prefix hierarchy as prefixes are created, modified, or deleted within
+    the context. On exit, rebuild the hierarchy once for each affected VRF. (Intended for bulk operations.) Nested
+    contexts share the outermost queue.
+    """
+    if prefix_rebuild_queue.get() is not None:
+        yield
+        return
+
+    token = prefix_rebuild_queue.set(set())
+    try:
+        yield
+        vrfs = prefix_rebuild_queue.get()
+    finally:
+        prefix_rebuild_queue.reset(token)
+
+    for vrf in vrfs:
+        rebuild_prefixes(vrf)
@@ -22,7 +22,7 @@ from . import filtersets, forms, tables
 from .choices import PrefixStatusChoices
 from .constants import *
 from .models import *
-from .utils import add_requested_prefixes, add_available_ipaddresses, add_available_vlans
+from .utils import add_requested_prefixes, add_available_ipaddresses, add_available_vlans, deferred_prefix_rebuild
 
 
 #
@@ -668,6 +668,11 @@ class PrefixBulkImportView(generic.BulkImportView):
     queryset = Prefix.objects.all()
     model_form = forms.PrefixImportForm
 
+    def create_and_update_objects(self, form, request):
+        # Rebuild the hierarchy of each affected VRF once, rather than updating it as each prefix is saved
+        with deferred_prefix_rebuild():
+            return super().create_and_update_objects(form, request)
+
 
 @register_model_view(Prefix, 'bulk_edit', path='edit', detail=False)
 class PrefixBulkEditView(generic.BulkEditView):
@@ -675,6 +680,7 @@ class PrefixBulkEditView(generic.BulkEditView):
     filterset = filtersets.PrefixFilterSet
     table = tables.PrefixTable
     form = forms.PrefixBulkEditForm
+    bulk_update_fields = ('tenant', 'status', 'role', 'is_pool', 'mark_utilized', 'description', 'comments')
 
 
 @register_model_view(Prefix, 'bulk_delete', path='delete', detail=False)
@@ -931,6 +937,7 @@ class IPAddressBulkEditView(generic.BulkEditView):
     filterset = filtersets.IPAddressFilterSet
     table = tables.IPAddressTable
     form = forms.IPAddressBulkEditForm
+    bulk_update_fields = ('tenant', 'status', 'role', 'description', 'comments')
 
 
 @register_model_view(IPAddress, 'bulk_delete', path='delete', detail=False)
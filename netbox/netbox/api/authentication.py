@@ -1,12 +1,14 @@
 import logging
 
 from django.conf import settings
-from django.utils import timezone
+from django.core.cache import cache
 from rest_framework import authentication, exceptions
 from rest_framework.permissions import BasePermission, DjangoObjectPermissions, SAFE_METHODS
 
 from netbox.config import get_config
+from users.constants import TOKEN_CACHE_TIMEOUT
 from users.models import Token
+from users.utils import record_token_use
 from utilities.request import get_client_ip
 
 
@@ -39,20 +41,26 @@ class TokenAuthentication(authentication.TokenAuthentication):
 
     def authenticate_credentials(self, key):
         model = self.get_model()
-        try:
-            token = model.objects.prefetch_related('user').get(key=key)
-        except model.DoesNotExist:
-            raise exceptions.AuthenticationFailed("Invalid token")
-
-        # Update last used, but only once per minute at most. This reduces write load on the database
-        if not token.last_used or (timezone.now() - token.last_used).total_seconds() > 60:
-            # If maintenance mode is enabled, assume the database is read-only, and disable updating the token's
-            # last_used time upon authentication.
-            if get_config().MAINTENANCE_MODE:
-                logger = logging.getLogger('netbox.auth.login')
-                logger.debug("Maintenance mode enabled: Disabling update of token's last used timestamp")
-            else:
-                Token.objects.filter(pk=token.pk).update(last_used=timezone.now())
+
+        # Tokens are cached briefly (along with their users) to avoid querying the database on every request. Cached
+        # tokens are invalidated whenever the token or its user is modified or deleted.
+        cache_key = model.get_cache_key(key)
+        token = cache.get(cache_key)
+        if token is None:
+            try:
+                token = model.objects.select_related('user').get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed("Invalid token")
+            cache.set(cache_key, token, TOKEN_CACHE_TIMEOUT)
+
+        # Record the token's use. Updates to its last_used time are buffered and written to the database in bulk.
+        # If maintenance mode is enabled, assume the database is read-only, and disable updating the token's
+        # last_used time upon authentication.
+        if get_config().MAINTENANCE_MODE:
+            logger = logging.getLogger('netbox.auth.login')
+            logger.debug("Maintenance mode enabled: Disabling update of token's last used timestamp")
+        else:
+            record_token_use(token)
 
         # Enforce the Token's expiration time, if one has been set.
         if token.is_expired:
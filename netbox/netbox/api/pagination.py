@@ -1,7 +1,12 @@
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from netbox.config import get_config
+from utilities.query import get_estimated_count
 
 
 class OptionalLimitOffsetPagination(LimitOffsetPagination):
@@ -9,21 +14,52 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Alternatively, a client may specify a starting ID (e.g. `?start=1000`) in place of an offset to employ keyset
+    pagination: Objects are ordered by ID, and only those with an ID equal to or greater than the starting ID are
+    returned. The total count of objects is not calculated. This enables efficient iteration through very large
+    result sets, as each page is retrieved in constant time.
+
+    Counting all objects matching a query can be expensive for large tables. A client may pass `?count=false` to omit
+    the count, and where COUNT_ESTIMATE_THRESHOLD has been set, the query planner's estimate is reported in place of
+    an exact count for large result sets.
+
+    Where pagination has been disabled, the view may instead stream the response using stream_queryset() and
+    get_streaming_response(), retrieving and serializing objects in chunks.
     """
+    start_query_param = 'start'
+    start_query_description = _('The minimum ID of objects to return (enables keyset pagination).')
+
+    count_query_param = 'count'
+    count_query_description = _('Set to false to omit the total count of objects from the response.')
+
+    # The number of objects retrieved from the database and serialized at once when streaming a response
+    stream_chunk_size = 1000
+
     def __init__(self):
         self.default_limit = get_config().PAGINATE_COUNT
+        self.start = None
+        self.count_estimated = False
+        self.has_next = False
 
     def paginate_queryset(self, queryset, request, view=None):
-
-        if isinstance(queryset, QuerySet):
-            self.count = self.get_queryset_count(queryset)
-        else:
-            # We're dealing with an iterable, not a QuerySet
-            self.count = len(queryset)
+        self.start = self.get_start(request)
+        if self.start is not None:
+            return self.paginate_queryset_by_start(queryset, request)
 
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
         self.request = request
+        self.count, self.count_estimated = self.get_count(queryset, request)
+
+        # If the count has been omitted or estimated, retrieve one additional object to determine whether a subsequent
+        # page exists.
+        if self.count is None or self.count_estimated:
+            if not self.limit:
+                return list(queryset[self.offset:])
+            results = list(queryset[self.offset:self.offset + self.limit + 1])
+            self.has_next = len(results) > self.limit
+            return results[:self.limit]
 
         if self.limit and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
@@ -36,6 +72,36 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset:])
 
+    def is_streamable(self, request):
+        """
+        Return True if pagination has been disabled for the request (e.g. `?limit=0`), in which case the entire list
+        of objects may be streamed to the client.
+        """
+        return self.get_start(request) is None and not self.get_limit(request)
+
+    def stream_queryset(self, queryset, request):
+        """
+        Return an iterator over all objects in the queryset (beginning at the requested offset) for a request which
+        has disabled pagination. Objects are retrieved from the database using a server-side cursor and yielded in
+        lists of `stream_chunk_size`. Any prefetches are performed for each list.
+        """
+        self.limit = None
+        self.offset = self.get_offset(request)
+        self.request = request
+        self.count, self.count_estimated = self.get_count(queryset, request)
+
+        return self._iter_chunks(queryset[self.offset:])
+
+    def _iter_chunks(self, queryset):
+        chunk = []
+        for obj in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(obj)
+            if len(chunk) == self.stream_chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
     def get_limit(self, request):
         if self.limit_query_param:
             MAX_PAGE_SIZE = get_config().MAX_PAGE_SIZE
@@ -54,6 +120,70 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
 
         return self.default_limit
 
+    def get_count_enabled(self, request):
+        """
+        Return False if the client has requested that the total count of objects be omitted.
+        """
+        return request.query_params.get(self.count_query_param, '').lower() not in ('false', '0')
+
+    def get_start(self, request):
+        """
+        Return the starting ID for keyset pagination, or None if not specified.
+        """
+        if self.start_query_param not in request.query_params:
+            return None
+        try:
+            start = int(request.query_params[self.start_query_param])
+            if start < 0:
+                raise ValueError()
+        except ValueError:
+            raise ValidationError({
+                self.start_query_param: _("The starting ID must be a non-negative integer.")
+            })
+        if self.offset_query_param in request.query_params:
+            raise ValidationError({
+                self.start_query_param: _("The starting ID and offset cannot be specified together.")
+            })
+        if 'ordering' in request.query_params:
+            raise ValidationError({
+                self.start_query_param: _("Objects cannot be reordered when specifying a starting ID.")
+            })
+        return start
+
+    def paginate_queryset_by_start(self, queryset, request):
+        """
+        Return the page of objects beginning with the starting ID, ordered by ID. No count is calculated.
+        """
+        if not isinstance(queryset, QuerySet):
+            raise ValidationError({
+                self.start_query_param: _("Keyset pagination is not supported for this endpoint.")
+            })
+
+        self.count = None
+        self.limit = self.get_limit(request)
+        self.offset = 0
+        self.request = request
+
+        queryset = queryset.filter(pk__gte=self.start).order_by('pk')
+        if self.limit:
+            queryset = queryset[:self.limit]
+        self.results = list(queryset)
+
+        return self.results
+
+    def get_count(self, queryset, request):
+        """
+        Return the count of objects to be reported (or None if it has been omitted), and whether it is an estimate.
+        """
+        if not isinstance(queryset, QuerySet):
+            # We're dealing with an iterable, not a QuerySet
+            return len(queryset), False
+        if not self.get_count_enabled(request):
+            return None, False
+        if (estimated_count := get_estimated_count(queryset)) is not None:
+            return estimated_count, True
+        return self.get_queryset_count(queryset), False
+
     def get_queryset_count(self, queryset):
         return queryset.count()
 
@@ -63,6 +193,20 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        if self.start is not None:
+            # A partial page indicates that there are no more objects
+            if len(self.results) < self.limit:
+                return None
+            url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+            return replace_query_param(url, self.start_query_param, self.results[-1].pk + 1)
+
+        # The count cannot be relied upon to determine whether a subsequent page exists
+        if self.count is None or self.count_estimated:
+            if not self.has_next:
+                return None
+            url = replace_query_param(self.request.build_absolute_uri(), self.limit_query_param, self.limit)
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -71,8 +215,66 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset pagination proceeds only forward
+        if self.start is not None:
+            return None
+
         return super().get_previous_link()
 
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        # Indicate whether the reported count is exact or an estimate
+        if self.count is not None:
+            response['X-Count-Estimated'] = 'true' if self.count_estimated else 'false'
+        return response
+
+    def get_streaming_response(self, results, renderer, accepted_media_type=None, renderer_context=None):
+        """
+        Return a StreamingHttpResponse which renders the given results (an iterable of lists of serialized objects)
+        incrementally, for a request which has disabled pagination.
+        """
+        data = {
+            'count': self.count,
+            'next': None,
+            'previous': None,
+        }
+        response = StreamingHttpResponse(
+            renderer.render_stream(data, results, accepted_media_type, renderer_context),
+            content_type=renderer.media_type
+        )
+        if self.count is not None:
+            response['X-Count-Estimated'] = 'true' if self.count_estimated else 'false'
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        # The count is omitted when employing keyset pagination or if requested by the client
+        response_schema['properties']['count']['nullable'] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                'name': self.start_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(self.start_query_description),
+                'schema': {
+                    'type': 'integer',
+                },
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(self.count_query_description),
+                'schema': {
+                    'type': 'boolean',
+                },
+            },
+        ]
+
 
 class StripCountAnnotationsPaginator(OptionalLimitOffsetPagination):
     """
@@ -1,7 +1,8 @@
-from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
 
 __all__ = (
     'FormlessBrowsableAPIRenderer',
+    'StreamingJSONRenderer',
     'TextRenderer',
 )
 
@@ -26,3 +27,30 @@ class TextRenderer(BaseRenderer):
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
         return str(data)
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """
+    Extends the stock JSONRenderer to support rendering a list of results incrementally. This enables the streaming of
+    very large responses without holding the entire rendered output in memory.
+    """
+    def render_stream(self, data, results, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, yielding bytestrings. `results` is an iterable of lists of serialized objects, which
+        are rendered in turn as the list under the "results" key.
+        """
+        prefix, suffix = self.render(
+            {**data, 'results': []}, accepted_media_type, renderer_context
+        ).rsplit(b'[]', 1)
+        yield prefix + b'['
+
+        first = True
+        for chunk in results:
+            if not chunk:
+                continue
+            # Strip the enclosing brackets from the rendered list
+            rendered = self.render(chunk, accepted_media_type, renderer_context)[1:-1]
+            yield rendered if first else b',' + rendered
+            first = False
+
+        yield b']' + suffix
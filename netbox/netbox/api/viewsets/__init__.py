@@ -6,6 +6,7 @@ from django.db import transaction
 from django.db.models import ProtectedError, RestrictedError
 from django_pglocks import advisory_lock
 from netbox.constants import ADVISORY_LOCK_KEYS
+from netbox.context_managers import deferred_change_logging
 from rest_framework import mixins as drf_mixins
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
@@ -88,6 +89,7 @@ class BaseViewSet(GenericViewSet):
 class NetBoxReadOnlyModelViewSet(
     mixins.CustomFieldsMixin,
     mixins.ExportTemplatesMixin,
+    mixins.StreamingListMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.ListModelMixin,
     BaseViewSet
@@ -101,6 +103,7 @@ class NetBoxModelViewSet(
     mixins.ObjectValidationMixin,
     mixins.CustomFieldsMixin,
     mixins.ExportTemplatesMixin,
+    mixins.StreamingListMixin,
     drf_mixins.CreateModelMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.UpdateModelMixin,
@@ -163,10 +166,11 @@ class NetBoxModelViewSet(
         logger = logging.getLogger(f'netbox.api.views.{self.__class__.__name__}')
         logger.info(f"Creating new {model._meta.verbose_name}")
 
-        # Enforce object-level permissions on save()
+        # Enforce object-level permissions on save(). Change records for all created objects are saved in bulk.
         try:
             with transaction.atomic():
-                instance = serializer.save()
+                with deferred_change_logging():
+                    instance = serializer.save()
                 self._validate_objects(instance)
         except ObjectDoesNotExist:
             raise PermissionDenied()
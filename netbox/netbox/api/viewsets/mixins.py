@@ -6,7 +6,10 @@ from rest_framework.response import Response
 
 from core.models import ObjectType
 from extras.models import ExportTemplate
+from netbox.api.pagination import OptionalLimitOffsetPagination
+from netbox.api.renderers import StreamingJSONRenderer
 from netbox.api.serializers import BulkOperationSerializer
+from utilities.deletion import bulk_delete
 
 __all__ = (
     'BulkDestroyModelMixin',
@@ -15,6 +18,7 @@ __all__ = (
     'ExportTemplatesMixin',
     'ObjectValidationMixin',
     'SequentialBulkCreatesMixin',
+    'StreamingListMixin',
 )
 
 
@@ -50,6 +54,30 @@ class ExportTemplatesMixin:
         return super().list(request, *args, **kwargs)
 
 
+class StreamingListMixin:
+    """
+    Stream the list of objects to the client when pagination has been disabled (e.g. `?limit=0`), rather than loading
+    and serializing all objects in memory at once. Objects are serialized and rendered in chunks.
+    """
+    def list(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        paginator = self.paginator
+        if (
+            isinstance(renderer, StreamingJSONRenderer) and
+            isinstance(paginator, OptionalLimitOffsetPagination) and
+            paginator.is_streamable(request)
+        ):
+            queryset = self.filter_queryset(self.get_queryset())
+            results = (
+                self.get_serializer(chunk, many=True).data for chunk in paginator.stream_queryset(queryset, request)
+            )
+            return paginator.get_streaming_response(
+                results, renderer, request.accepted_media_type, self.get_renderer_context()
+            )
+
+        return super().list(request, *args, **kwargs)
+
+
 class SequentialBulkCreatesMixin:
     """
     Perform bulk creation of new objects sequentially, rather than all at once. This ensures that any validation
@@ -157,11 +185,7 @@ class BulkDestroyModelMixin:
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def perform_bulk_destroy(self, objects):
-        with transaction.atomic():
-            for obj in objects:
-                if hasattr(obj, 'snapshot'):
-                    obj.snapshot()
-                self.perform_destroy(obj)
+        bulk_delete(objects)
 
 
 class ObjectValidationMixin:
@@ -1,20 +1,28 @@
+import hashlib
+import json
 import logging
+import uuid
 from collections import defaultdict
 
 from django.conf import settings
 from django.contrib.auth.backends import ModelBackend, RemoteUserBackend as _RemoteUserBackend
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
-from users.constants import CONSTRAINT_TOKEN_USER
 from users.models import Group, ObjectPermission, User
 from utilities.permissions import (
-    permission_is_exempt, qs_filter_from_constraints, resolve_permission, resolve_permission_type,
+    compile_constraints, permission_is_exempt, resolve_permission, resolve_permission_type,
 )
 from .misc import _mirror_groups
 
+# Cache key holding the current version of all ObjectPermission assignments
+OBJECT_PERMISSIONS_VERSION_KEY = 'object_permissions_version'
+OBJECT_PERMISSIONS_CACHE_TIMEOUT = 86400
+
 AUTH_BACKEND_ATTRS = {
     # backend name: title, MDI icon name
     'amazon': ('Amazon AWS', 'aws'),
@@ -63,15 +71,68 @@ def get_saml_idps():
     return getattr(settings, "SOCIAL_AUTH_SAML_ENABLED_IDPS", {}).keys()
 
 
+def _get_user_permissions_version_key(user_id):
+    return f'{OBJECT_PERMISSIONS_VERSION_KEY}:{user_id}'
+
+
+def _get_default_permissions_version():
+    """
+    Return a hash of the configured DEFAULT_PERMISSIONS, so that cached permissions resolved under a different
+    configuration are not reused.
+    """
+    data = json.dumps(settings.DEFAULT_PERMISSIONS, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def invalidate_object_permissions(user_id=None):
+    """
+    Invalidate the cached ObjectPermissions of the specified user, or of all users if no user is specified.
+    """
+    key = OBJECT_PERMISSIONS_VERSION_KEY if user_id is None else _get_user_permissions_version_key(user_id)
+    cache.set(key, uuid.uuid4().hex, None)
+
+
 class ObjectPermissionMixin:
 
     def get_all_permissions(self, user_obj, obj=None):
         if not user_obj.is_active or user_obj.is_anonymous:
             return dict()
         if not hasattr(user_obj, '_object_perm_cache'):
-            user_obj._object_perm_cache = self.get_object_permissions(user_obj)
+            user_obj._object_perm_cache = self.get_cached_object_permissions(user_obj)
         return user_obj._object_perm_cache
 
+    def get_permissions_cache_key(self, user_obj):
+        """
+        Return the key under which the user's resolved permissions are cached, or None to disable caching.
+        """
+        return f'object_permissions:{self.__class__.__name__}:{user_obj.pk}'
+
+    def get_cached_object_permissions(self, user_obj):
+        """
+        Return all permissions granted to the user, as cached by any process. Cached permissions are valid only for
+        the versions of ObjectPermission assignments (global and per-user) and of DEFAULT_PERMISSIONS under which they
+        were resolved. The cache is bypassed within a transaction, as the transaction may have modified permissions
+        which have not yet been committed.
+        """
+        cache_key = self.get_permissions_cache_key(user_obj)
+        if cache_key is None or connection.in_atomic_block:
+            return dict(self.get_object_permissions(user_obj))
+
+        # Retrieve the current versions and any cached permissions in a single round trip
+        user_version_key = _get_user_permissions_version_key(user_obj.pk)
+        cached = cache.get_many([OBJECT_PERMISSIONS_VERSION_KEY, user_version_key, cache_key])
+        versions = (
+            cached.get(OBJECT_PERMISSIONS_VERSION_KEY),
+            cached.get(user_version_key),
+            _get_default_permissions_version(),
+        )
+        if cache_key in cached and cached[cache_key][0] == versions:
+            return cached[cache_key][1]
+
+        perms = dict(self.get_object_permissions(user_obj))
+        cache.set(cache_key, (versions, perms), OBJECT_PERMISSIONS_CACHE_TIMEOUT)
+        return perms
+
     def get_permission_filter(self, user_obj):
         return Q(users=user_obj) | Q(groups__user=user_obj)
 
@@ -140,10 +201,7 @@ class ObjectPermissionMixin:
             ))
 
         # Compile a QuerySet filter that matches all instances of the specified model
-        tokens = {
-            CONSTRAINT_TOKEN_USER: user_obj,
-        }
-        qs_filter = qs_filter_from_constraints(object_permissions[perm], tokens)
+        qs_filter = compile_constraints(model, object_permissions[perm], user_obj)[0]
 
         # Permission to perform the requested action on the object depends on whether the specified object matches
         # the specified constraints. Note that this check is made against the *database* record representing the object,
@@ -325,6 +383,12 @@ try:
                 permission_filter = permission_filter | Q(groups__name__in=user_obj.ldap_user.group_names)
             return permission_filter
 
+        def get_permissions_cache_key(self, user_obj):
+            # Permissions granted via LDAP group membership are not reflected in the database
+            if self.settings.FIND_GROUP_PERMS:
+                return None
+            return super().get_permissions_cache_key(user_obj)
+
     # Patch with our modified _mirror_groups() method to support our custom Group model
     _LDAPUser._mirror_groups = _mirror_groups
 
@@ -1,10 +1,13 @@
 import logging
+import os
 import threading
+import time
 
 from django.conf import settings
 from django.core.cache import cache
 from django.db.utils import DatabaseError
 from django.utils.translation import gettext_lazy as _
+from prometheus_client import Counter
 
 from .parameters import PARAMS
 
@@ -12,37 +15,128 @@ __all__ = (
     'clear_config',
     'ConfigItem',
     'get_config',
+    'invalidate_config',
     'PARAMS',
 )
 
+# Redis channel used to notify all processes of a configuration change
+INVALIDATION_CHANNEL = 'netbox.config.invalidate'
+
 _thread_locals = threading.local()
 
+# The process-wide configuration snapshot, and the time at which its version was last checked
+_snapshot = None
+_snapshot_checked = 0
+_snapshot_lock = threading.Lock()
+
+# The ID of the process in which the invalidation listener is running (if any)
+_listener_pid = None
+
+config_reloads = Counter(
+    'netbox_config_reloads',
+    'Number of times the dynamic configuration has been reloaded from the cache or database'
+)
+
 logger = logging.getLogger('netbox.config')
 
+_MISSING = object()
+
 
 def get_config():
     """
-    Return the current NetBox configuration, pulling it from cache if not already loaded in memory.
+    Return the current NetBox configuration. The first call within a thread (e.g. while handling a request) pins the
+    process-wide snapshot, which is revalidated against the cached config version at most once every
+    CONFIG_REVALIDATION_INTERVAL seconds, or immediately upon receiving an invalidation notice.
     """
     if not hasattr(_thread_locals, 'config'):
-        _thread_locals.config = Config()
-        logger.debug("Initialized configuration")
+        _thread_locals.config = _get_snapshot()
     return _thread_locals.config
 
 
 def clear_config():
     """
-    Delete the currently loaded configuration, if any.
+    Release the configuration pinned to the current thread, if any. The process-wide snapshot is retained.
     """
     if hasattr(_thread_locals, 'config'):
         del _thread_locals.config
         logger.debug("Cleared configuration")
 
 
+def invalidate_config(publish=True):
+    """
+    Discard the process-wide configuration snapshot so that it will be reloaded on next access. If publish is True,
+    all other NetBox processes are notified to do the same.
+    """
+    global _snapshot
+    _snapshot = None
+    logger.debug("Invalidated configuration")
+
+    if publish:
+        try:
+            from django_redis import get_redis_connection
+            get_redis_connection('default').publish(INVALIDATION_CHANNEL, os.getpid())
+        except Exception as e:
+            # Other processes will pick up the change upon their next revalidation
+            logger.warning(f"Unable to publish configuration invalidation: {e}")
+
+
+def _get_snapshot():
+    """
+    Return the process-wide configuration snapshot, reloading it if it has been invalidated or if the cached
+    config version has changed.
+    """
+    global _snapshot, _snapshot_checked
+    _start_listener()
+
+    with _snapshot_lock:
+        now = time.monotonic()
+        snapshot = _snapshot
+        if snapshot is not None and now - _snapshot_checked < settings.CONFIG_REVALIDATION_INTERVAL:
+            return snapshot
+        _snapshot_checked = now
+
+        # Reload the configuration only if the cached version differs from that of the snapshot. An uncached version
+        # means the active revision must be loaded from the database.
+        if snapshot is None or (version := cache.get('config_version')) is None or version != snapshot.version:
+            snapshot = _snapshot = Config()
+            config_reloads.inc()
+            logger.debug("Initialized configuration")
+
+        return snapshot
+
+
+def _listen_for_invalidations():
+    """
+    Subscribe to the invalidation channel and discard the configuration snapshot each time a notice is received.
+    """
+    try:
+        from django_redis import get_redis_connection
+        pubsub = get_redis_connection('default').pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(INVALIDATION_CHANNEL)
+        for message in pubsub.listen():
+            if message['type'] == 'message':
+                invalidate_config(publish=False)
+    except Exception as e:
+        # Fall back to periodic revalidation
+        logger.warning(f"Stopped listening for configuration invalidations: {e}")
+
+
+def _start_listener():
+    """
+    Start a background thread to listen for invalidation notices, if one is not already running in this process.
+    (The process ID is tracked because threads do not survive a fork.)
+    """
+    global _listener_pid
+    if _listener_pid == os.getpid():
+        return
+    _listener_pid = os.getpid()
+    threading.Thread(target=_listen_for_invalidations, name='config-invalidation-listener', daemon=True).start()
+
+
 class Config:
     """
-    Fetch and store in memory the current NetBox configuration. This class must be instantiated prior to access, and
-    must be re-instantiated each time it's necessary to check for updates to the cached config.
+    Fetch and store in memory the current NetBox configuration. Each instance is an immutable snapshot of a single
+    config version; use get_config() to obtain the current snapshot.
     """
     def __init__(self):
         self._populate_from_cache()
@@ -53,8 +147,9 @@ class Config:
     def __getattr__(self, item):
 
         # Check for hard-coded configuration in settings.py
-        if hasattr(settings, item):
-            return getattr(settings, item)
+        value = getattr(settings, item, _MISSING)
+        if value is not _MISSING:
+            return value
 
         # Return config value from cache
         if item in self.config:
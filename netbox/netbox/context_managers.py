@@ -1,6 +1,9 @@
+import itertools
 from contextlib import contextmanager
 
-from netbox.context import current_request, events_queue
+from core.models import ObjectChange
+from netbox.context import changelog_queue, current_request, events_queue
+from netbox.search.backends import deferred_caching
 from netbox.utils import register_request_processor
 from extras.events import flush_events
 
@@ -26,3 +29,36 @@ def event_tracking(request):
     # Clear context vars
     current_request.set(None)
     events_queue.set({})
+
+
+@register_request_processor
+@contextmanager
+def search_cache_tracking(request):
+    """
+    Queue objects which are created, modified, or deleted while processing a request, then refresh their cached
+    search representations in bulk before returning the response.
+
+    :param request: WSGIRequest object with a unique `id` set
+    """
+    with deferred_caching():
+        yield
+
+
+@contextmanager
+def deferred_change_logging():
+    """
+    Queue any ObjectChange records generated within the context, and create them in bulk on exit (rather than
+    individually as each object is saved). Nested contexts share the outermost queue. Queued records are discarded if
+    an exception is raised within the context.
+    """
+    if changelog_queue.get() is not None:
+        yield
+        return
+
+    token = changelog_queue.set({})
+    try:
+        yield
+        queue = changelog_queue.get()
+    finally:
+        changelog_queue.reset(token)
+    ObjectChange.objects.bulk_create(itertools.chain.from_iterable(queue.values()))
@@ -0,0 +1,85 @@
+from graphql import (
+    FieldNode, FragmentSpreadNode, GraphQLError, InlineFragmentNode, OperationDefinitionNode, ValidationRule,
+    get_named_type, get_nullable_type, is_list_type,
+)
+from strawberry.extensions import AddValidationRules
+
+__all__ = (
+    'MaxComplexityLimiter',
+    'get_query_complexity',
+)
+
+# The factor by which the complexity of fields nested within a list is multiplied
+LIST_COMPLEXITY_FACTOR = 10
+
+
+def get_query_complexity(context, selection_set, parent_type, fragments=None):
+    """
+    Calculate the complexity of a GraphQL selection set. Each selected field counts as one; the complexity of the
+    fields selected beneath a field which returns a list is multiplied by LIST_COMPLEXITY_FACTOR.
+
+    Args:
+        context: The graphql-core ValidationContext
+        selection_set: The SelectionSetNode to evaluate
+        parent_type: The GraphQL type on which the selections are made
+        fragments: The names of fragments being expanded (used to guard against cycles)
+    """
+    fragments = fragments or set()
+    complexity = 0
+
+    for selection in selection_set.selections:
+
+        if isinstance(selection, FieldNode):
+            complexity += 1
+            field_def = getattr(parent_type, 'fields', {}).get(selection.name.value)
+            if selection.selection_set and field_def is not None:
+                nested = get_query_complexity(
+                    context, selection.selection_set, get_named_type(field_def.type), fragments
+                )
+                if is_list_type(get_nullable_type(field_def.type)):
+                    nested *= LIST_COMPLEXITY_FACTOR
+                complexity += nested
+
+        elif isinstance(selection, InlineFragmentNode):
+            fragment_type = parent_type
+            if selection.type_condition:
+                fragment_type = context.schema.get_type(selection.type_condition.name.value) or parent_type
+            complexity += get_query_complexity(context, selection.selection_set, fragment_type, fragments)
+
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = context.get_fragment(name)
+            if fragment is None or name in fragments:
+                continue
+            fragment_type = context.schema.get_type(fragment.type_condition.name.value) or parent_type
+            complexity += get_query_complexity(context, fragment.selection_set, fragment_type, {*fragments, name})
+
+    return complexity
+
+
+def create_validator(max_complexity):
+    """
+    Create a validator which rejects any operation whose complexity exceeds the specified maximum.
+    """
+
+    class MaxComplexityValidator(ValidationRule):
+
+        def enter_operation_definition(self, node: OperationDefinitionNode, *args):
+            root_type = self.context.schema.get_root_type(node.operation)
+            complexity = get_query_complexity(self.context, node.selection_set, root_type)
+            if complexity > max_complexity:
+                self.report_error(GraphQLError(
+                    f"Query complexity of {complexity} exceeds the maximum allowed complexity of {max_complexity}.",
+                    node
+                ))
+
+    return MaxComplexityValidator
+
+
+class MaxComplexityLimiter(AddValidationRules):
+    """
+    Reject GraphQL queries whose estimated cost exceeds the specified maximum complexity. See get_query_complexity()
+    for details on how the complexity of a query is calculated.
+    """
+    def __init__(self, max_complexity):
+        super().__init__([create_validator(max_complexity)])
@@ -0,0 +1,77 @@
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.db.models import Prefetch
+from graphql import GraphQLUnionType, get_named_type
+from graphql.execution.collect_fields import collect_sub_fields
+from strawberry.schema.schema_converter import GraphQLCoreConverter
+from strawberry_django.optimizer import optimize
+from strawberry_django.utils.typing import get_django_definition
+
+__all__ = (
+    'prefetch_generic_foreign_key',
+)
+
+
+def _get_model(graphql_type):
+    """
+    Return the model represented by a GraphQL object type (if any).
+    """
+    definition = graphql_type.extensions.get(GraphQLCoreConverter.DEFINITION_BACKREF)
+    if definition is not None and (django_definition := get_django_definition(definition.origin)):
+        return django_definition.model
+
+
+def _get_possible_types(graphql_type):
+    if isinstance(graphql_type, GraphQLUnionType):
+        return graphql_type.types
+    return [graphql_type]
+
+
+def _get_field_info(info, model, field_name):
+    """
+    Return the GraphQLResolveInfo for the named field of the given model, given the info for either the field itself
+    or the field from which objects of the model are selected. Returns None if the field has not been selected.
+    """
+    if info.field_name == field_name and _get_model(info.parent_type) is model:
+        return info
+
+    for parent_type in _get_possible_types(get_named_type(info.return_type)):
+        if _get_model(parent_type) is not model:
+            continue
+        field_nodes = collect_sub_fields(
+            info.schema, info.fragments, info.variable_values, parent_type, info.field_nodes
+        ).get(field_name)
+        if field_nodes:
+            return info._replace(
+                field_name=field_name,
+                field_nodes=field_nodes,
+                return_type=parent_type.fields[field_name].type,
+                parent_type=parent_type,
+                path=info.path.add_key(field_name, parent_type.name),
+            )
+
+
+def prefetch_generic_foreign_key(model, field_name):
+    """
+    Return a prefetch hint for the query optimizer which prefetches the objects assigned to a generic foreign key. The
+    queryset for each type of assigned object is itself optimized for the fields selected on that type, so that any
+    related objects selected beneath the generic foreign key are retrieved along with the assigned objects.
+
+    Args:
+        model: The model on which the generic foreign key is defined
+        field_name: The name of the generic foreign key
+    """
+    def prefetch(info):
+        field_info = _get_field_info(info, model, field_name)
+        if field_info is None:
+            return Prefetch(field_name)
+
+        related_models = []
+        for graphql_type in _get_possible_types(get_named_type(field_info.return_type)):
+            if (related_model := _get_model(graphql_type)) and related_model not in related_models:
+                related_models.append(related_model)
+
+        return GenericPrefetch(field_name, [
+            optimize(related_model.objects.all(), field_info) for related_model in related_models
+        ])
+
+    return prefetch
@@ -1,18 +1,60 @@
+import hashlib
+
 from django.conf import settings
 from django.contrib.auth.views import redirect_to_login
+from django.core.cache import cache
 from django.http import HttpResponseNotFound, HttpResponseForbidden
 from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
+from graphql import GraphQLError
 from rest_framework.exceptions import AuthenticationFailed
 from strawberry.django.views import GraphQLView
+from strawberry.types import ExecutionResult
 
 from netbox.api.authentication import TokenAuthentication
 from netbox.config import get_config
 
+PERSISTED_QUERY_CACHE_PREFIX = 'graphql.persisted_query'
+PERSISTED_QUERY_TIMEOUT = 60 * 60 * 24 * 30  # 30 days
+PERSISTED_QUERY_MAX_LENGTH = 100 * 1024  # Maximum length (in characters) of a query which may be persisted
+
+
+class PersistedQueryError(Exception):
+    """
+    Raised when a persisted query cannot be resolved.
+    """
+    def __init__(self, message, code):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+def resolve_persisted_query(query_hash, query=None, save=True):
+    """
+    Return the GraphQL document identified by its SHA-256 hash. If the document has been provided, it is verified
+    against the hash and (if save is True and the document does not exceed PERSISTED_QUERY_MAX_LENGTH) saved for use
+    by subsequent requests.
+    """
+    cache_key = f'{PERSISTED_QUERY_CACHE_PREFIX}.{query_hash}'
+
+    if query is None:
+        if (query := cache.get(cache_key)) is None:
+            raise PersistedQueryError('PersistedQueryNotFound', 'PERSISTED_QUERY_NOT_FOUND')
+        return query
+
+    if hashlib.sha256(query.encode()).hexdigest() != query_hash:
+        raise PersistedQueryError('provided sha does not match query', 'INVALID_SHA256_HASH')
+    if save and len(query) <= PERSISTED_QUERY_MAX_LENGTH:
+        cache.set(cache_key, query, PERSISTED_QUERY_TIMEOUT)
+
+    return query
+
 
 class NetBoxGraphQLView(GraphQLView):
     """
-    Extends strawberry's GraphQLView to support DRF's token-based authentication.
+    Extends strawberry's GraphQLView to support DRF's token-based authentication, and automatic persisted queries. A
+    client may send only the SHA-256 hash of a previously submitted query (as the `persistedQuery` extension) in
+    place of the query itself.
     """
 
     @csrf_exempt
@@ -41,3 +83,57 @@ class NetBoxGraphQLView(GraphQLView):
                 return HttpResponseForbidden("No credentials provided.")
 
         return super().dispatch(request, *args, **kwargs)
+
+    def parse_http_body(self, request):
+        request_data = super().parse_http_body(request)
+
+        # Resolve an automatic persisted query
+        if persisted_query := self.get_persisted_query(request):
+            if persisted_query.get('version') != 1:
+                raise PersistedQueryError('Unsupported persisted query version', 'PERSISTED_QUERY_NOT_SUPPORTED')
+            # Only queries submitted by authenticated users are saved
+            request_data.query = resolve_persisted_query(
+                persisted_query.get('sha256Hash'),
+                request_data.query,
+                save=self.request.user.is_authenticated
+            )
+
+        return request_data
+
+    def should_render_graphql_ide(self, request):
+        # A GET request which includes a persisted query (in place of the query itself) is to be executed
+        if self.get_persisted_query(request):
+            return False
+        return super().should_render_graphql_ide(request)
+
+    def get_persisted_query(self, request):
+        """
+        Return the `persistedQuery` extension included in the request, if any.
+        """
+        if request.method == 'GET':
+            extensions = request.query_params.get('extensions')
+            if not extensions:
+                return None
+            extensions = self.parse_json(extensions)
+        else:
+            if 'application/json' not in (request.content_type or ''):
+                return None
+            body = request.body
+            # Avoid decoding the body a second time unless a persisted query has been included
+            if (b'persistedQuery' if isinstance(body, bytes) else 'persistedQuery') not in body:
+                return None
+            data = self.parse_json(body)
+            extensions = data.get('extensions') if isinstance(data, dict) else None
+
+        if isinstance(extensions, dict) and isinstance(extensions.get('persistedQuery'), dict):
+            return extensions['persistedQuery']
+        return None
+
+    def execute_operation(self, request, context, root_value):
+        try:
+            return super().execute_operation(request, context, root_value)
+        except PersistedQueryError as e:
+            return ExecutionResult(
+                data=None,
+                errors=[GraphQLError(e.message, extensions={'code': e.code})]
+            )
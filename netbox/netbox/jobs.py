@@ -11,6 +11,7 @@ from core.choices import JobStatusChoices
 from core.models import Job, ObjectType
 from netbox.constants import ADVISORY_LOCK_KEYS
 from netbox.registry import registry
+from netbox.search.backends import deferred_caching
 
 __all__ = (
     'JobRunner',
@@ -75,7 +76,9 @@ class JobRunner(ABC):
         """
         try:
             job.start()
-            cls(job).run(*args, **kwargs)
+            # Update the search cache for any modified objects in bulk upon completion
+            with deferred_caching():
+                cls(job).run(*args, **kwargs)
             job.terminate()
 
         except Exception as e:
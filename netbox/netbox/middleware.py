@@ -55,7 +55,7 @@ class CoreMiddleware:
         if is_api_request(request):
             response['API-Version'] = settings.REST_FRAMEWORK_VERSION
 
-        # Clear any cached dynamic config parameters after each request.
+        # Release the dynamic config pinned for the duration of the request.
         clear_config()
 
         return response
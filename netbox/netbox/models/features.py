@@ -13,7 +13,7 @@ from core.choices import JobStatusChoices, ObjectChangeActionChoices
 from core.models import ObjectType
 from extras.choices import *
 from extras.constants import CUSTOMFIELD_EMPTY_VALUES
-from extras.utils import is_taggable
+from extras.utils import CustomFieldResolver, is_taggable
 from netbox.config import get_config
 from netbox.registry import registry
 from netbox.signals import post_clean
@@ -182,24 +182,35 @@ class CustomFieldsMixin(models.Model):
         {'primary_site': <Site: DM-NYC>, 'cust_id': 'DMI01', 'is_active': True}
         ```
         """
+        resolver = self.get_custom_field_resolver()
         return {
-            cf.name: cf.deserialize(self.custom_field_data.get(cf.name))
-            for cf in self.custom_fields
+            cf.name: resolver.deserialize(cf, self.custom_field_data.get(cf.name))
+            for cf in resolver.custom_fields
         }
 
     @cached_property
     def custom_fields(self):
         """
-        Return the QuerySet of CustomFields assigned to this model.
+        Return the CustomFields assigned to this model.
 
         ```python
         >>> tenant = Tenant.objects.first()
         >>> tenant.custom_fields
-        <RestrictedQuerySet [<CustomField: Primary site>, <CustomField: Customer ID>, <CustomField: Is active>]>
+        (<CustomField: Primary site>, <CustomField: Customer ID>, <CustomField: Is active>)
         ```
         """
         from extras.models import CustomField
-        return CustomField.objects.get_for_model(self)
+        return CustomField.objects.get_cached_for_model(self)
+
+    def get_custom_field_resolver(self):
+        """
+        Return the CustomFieldResolver used to deserialize this object's custom field values. If the object was
+        resolved together with others (e.g. a page of table rows; see CustomFieldResolver.for_objects()), related
+        objects are retrieved for all of them at once.
+        """
+        if (resolver := getattr(self, '_custom_field_resolver', None)) is None:
+            resolver = CustomFieldResolver.for_objects([self])
+        return resolver
 
     def get_custom_fields(self, omit_hidden=False):
         """
@@ -215,9 +226,10 @@ class CustomFieldsMixin(models.Model):
             omit_hidden: If True, custom fields with no UI visibility will be omitted.
         """
         from extras.models import CustomField
+        resolver = self.get_custom_field_resolver()
         data = {}
 
-        for field in CustomField.objects.get_for_model(self):
+        for field in CustomField.objects.get_cached_for_model(self):
             value = self.custom_field_data.get(field.name)
 
             # Skip hidden fields if 'omit_hidden' is True
@@ -226,7 +238,7 @@ class CustomFieldsMixin(models.Model):
             elif omit_hidden and field.ui_visible == CustomFieldUIVisibleChoices.IF_SET and not value:
                 continue
 
-            data[field] = field.deserialize(value)
+            data[field] = resolver.deserialize(field, value)
 
         return data
 
@@ -245,15 +257,18 @@ class CustomFieldsMixin(models.Model):
         """
         from extras.models import CustomField
         groups = defaultdict(dict)
-        visible_custom_fields = CustomField.objects.get_for_model(self).exclude(
-            ui_visible=CustomFieldUIVisibleChoices.HIDDEN
-        )
+        visible_custom_fields = [
+            cf for cf in CustomField.objects.get_cached_for_model(self)
+            if cf.ui_visible != CustomFieldUIVisibleChoices.HIDDEN
+        ]
+
+        resolver = self.get_custom_field_resolver()
 
         for cf in visible_custom_fields:
             value = self.custom_field_data.get(cf.name)
             if value in CUSTOMFIELD_EMPTY_VALUES and cf.ui_visible == CustomFieldUIVisibleChoices.IF_SET:
                 continue
-            value = cf.deserialize(value)
+            value = resolver.deserialize(cf, value)
             groups[cf.group_name][cf] = value
 
         return dict(groups)
@@ -271,7 +286,7 @@ class CustomFieldsMixin(models.Model):
         from extras.models import CustomField
 
         custom_fields = {
-            cf.name: cf for cf in CustomField.objects.get_for_model(self)
+            cf.name: cf for cf in CustomField.objects.get_cached_for_model(self)
         }
 
         # Validate all field values
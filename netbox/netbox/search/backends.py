@@ -1,7 +1,9 @@
 from collections import defaultdict
+from contextlib import contextmanager
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models import F, Window, Q, prefetch_related_objects
 from django.db.models.fields.related import ForeignKey
@@ -9,11 +11,16 @@ from django.db.models.functions import window
 from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
+from django_rq import get_queue
 import netaddr
 from netaddr.core import AddrFormatError
 
 from core.models import ObjectType
 from extras.models import CachedValue, CustomField
+from extras.models.search import SEARCH_VECTOR_CONFIG
+from netbox.config import get_config
+from netbox.constants import RQ_QUEUE_DEFAULT
+from netbox.context import search_queue
 from netbox.registry import registry
 from utilities.object_types import object_type_identifier
 from utilities.querysets import RestrictedPrefetch
@@ -60,15 +67,53 @@ class SearchBackend:
 
     def caching_handler(self, sender, instance, created, **kwargs):
         """
-        Receiver for the post_save signal, responsible for caching object creation/changes.
+        Receiver for the post_save signal, responsible for caching object creation/changes. If caching has been
+        deferred (see `deferred_caching()`), the object is queued for caching instead.
         """
-        self.cache(instance, remove_existing=not created)
+        if (queue := search_queue.get()) is not None:
+            self.enqueue(queue, instance)
+        else:
+            self.cache(instance, remove_existing=not created)
 
     def removal_handler(self, sender, instance, **kwargs):
         """
-        Receiver for the post_delete signal, responsible for caching object deletion.
+        Receiver for the post_delete signal, responsible for caching object deletion. If caching has been deferred
+        (see `deferred_caching()`), the object is queued for removal instead.
+        """
+        if (queue := search_queue.get()) is not None:
+            self.enqueue(queue, instance)
+        else:
+            self.remove(instance)
+
+    @staticmethod
+    def enqueue(queue, instance):
+        """
+        Add an instance to the queue of objects to be refreshed, if its model is indexed.
+        """
+        label = instance._meta.label_lower
+        if label in registry['search']:
+            queue[label].add(instance.pk)
+
+    def flush(self, queue):
+        """
+        Refresh the cached representations of all queued objects.
+
+        Args:
+            queue: A dictionary mapping model labels to iterables of primary keys
+        """
+        for label, pks in queue.items():
+            if indexer := registry['search'].get(label):
+                self.refresh(indexer.model, pks)
+
+    def refresh(self, model, pks):
+        """
+        Replace the cached representations of the specified objects with their current state. Any objects which no
+        longer exist are removed from the cache.
         """
-        self.remove(instance)
+        instances = model.objects.filter(pk__in=pks)
+        for pk in set(pks) - set(instances.values_list('pk', flat=True)):
+            self.remove(model(pk=pk))
+        self.cache(instances, remove_existing=True)
 
     def cache(self, instances, indexer=None, remove_existing=True):
         """
@@ -105,9 +150,10 @@ class SearchBackend:
 
 class CachedValueSearchBackend(SearchBackend):
 
-    def search(self, value, user=None, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
-
-        # Build the filter used to find relevant CachedValue records
+    def get_query_filter(self, value, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+        """
+        Return a Q object for filtering CachedValue records matching the given value.
+        """
         query_filter = Q(**{f'value__{lookup}': value})
         if object_types:
             # Limit results by object type
@@ -123,6 +169,23 @@ class CachedValueSearchBackend(SearchBackend):
             except (AddrFormatError, ValueError):
                 pass
 
+        return query_filter
+
+    @staticmethod
+    def get_prefetch(user=None):
+        """
+        Return the related objects to prefetch for search results. If a user is specified, only those objects
+        which the user has permission to view will be prefetched.
+        """
+        if user:
+            return RestrictedPrefetch('object', user, 'view'), 'object_type'
+        return 'object', 'object_type'
+
+    def search(self, value, user=None, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+
+        # Build the filter used to find relevant CachedValue records
+        query_filter = self.get_query_filter(value, object_types=object_types, lookup=lookup)
+
         # Construct the base queryset to retrieve matching results
         queryset = CachedValue.objects.filter(query_filter).annotate(
             # Annotate the rank of each result for its object according to its weight
@@ -139,21 +202,21 @@ class CachedValueSearchBackend(SearchBackend):
         object_type_ids = set(queryset.values_list('object_type', flat=True))
         object_types = ObjectType.objects.filter(pk__in=object_type_ids)
 
-        # Construct a Prefetch to pre-fetch only those related objects for which the
-        # user has permission to view.
-        if user:
-            prefetch = (RestrictedPrefetch('object', user, 'view'), 'object_type')
-        else:
-            prefetch = ('object', 'object_type')
-
         # Wrap the base query to return only the lowest-weight result for each object
         # Hat-tip to https://blog.oyam.dev/django-filter-by-window-function/ for the solution
         sql, params = queryset.query.sql_with_params()
-        results = CachedValue.objects.prefetch_related(*prefetch).raw(
+        results = CachedValue.objects.prefetch_related(*self.get_prefetch(user)).raw(
             f"SELECT * FROM ({sql}) t WHERE row_number = 1",
             params
         )
 
+        return self.process_results(results, object_types)
+
+    def process_results(self, results, object_types):
+        """
+        Prefetch any related objects needed to render the display attributes of each result, and return a list of
+        results for which the referenced object is available.
+        """
         # Iterate through each ObjectType represented in the search results and prefetch any
         # related objects necessary to render the prescribed display attributes (display_attrs).
         for object_type in object_types:
@@ -208,7 +271,9 @@ class CachedValueSearchBackend(SearchBackend):
 
                 # Prefetch any associated custom fields
                 object_type = ObjectType.objects.get_for_model(indexer.model)
-                custom_fields = CustomField.objects.filter(object_types=object_type).exclude(search_weight=0)
+                custom_fields = [
+                    cf for cf in CustomField.objects.get_cached_for_model(indexer.model) if cf.search_weight
+                ]
 
             # Wipe out any previously cached values for the object
             if remove_existing:
@@ -251,6 +316,20 @@ class CachedValueSearchBackend(SearchBackend):
         # Call _raw_delete() on the queryset to avoid first loading instances into memory
         return qs._raw_delete(using=qs.db)
 
+    def refresh(self, model, pks):
+        try:
+            indexer = get_indexer(model)
+        except KeyError:
+            return 0
+
+        # Delete all existing cached values for the objects in a single query
+        object_type = ObjectType.objects.get_for_model(model)
+        qs = CachedValue.objects.filter(object_type=object_type, object_id__in=pks)
+        qs._raw_delete(using=qs.db)
+
+        # Cache the objects which still exist
+        return self.cache(model.objects.filter(pk__in=pks).iterator(), indexer=indexer, remove_existing=False)
+
     def clear(self, object_types=None):
         qs = CachedValue.objects.all()
         if object_types:
@@ -270,6 +349,69 @@ class CachedValueSearchBackend(SearchBackend):
         return CachedValue.objects.count()
 
 
+class TrigramSearchBackend(CachedValueSearchBackend):
+    """
+    A search backend which employs PostgreSQL's pg_trgm extension and full text search to match cached values using
+    GIN indexes. Matches are ranked within the database, and only the best match for each object is returned.
+    """
+
+    def get_query_filter(self, value, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+        query_filter = super().get_query_filter(value, object_types=object_types, lookup=lookup)
+
+        if lookup == LookupTypes.PARTIAL:
+            # Also match values containing all the given words, in any order
+            fts_filter = Q(search_vector=self.get_search_query(value))
+            if object_types:
+                fts_filter &= Q(object_type__in=object_types)
+            query_filter |= fts_filter
+
+        return query_filter
+
+    @staticmethod
+    def get_search_query(value):
+        return SearchQuery(value, config=SEARCH_VECTOR_CONFIG, search_type='plain')
+
+    def get_rank(self, value):
+        """
+        Return an expression representing the relevance of a cached value to the query. This supplements field
+        weight when ordering results.
+        """
+        return (
+            TrigramSimilarity('value', value) +
+            SearchRank(F('search_vector'), self.get_search_query(value))
+        )
+
+    def search(self, value, user=None, object_types=None, lookup=DEFAULT_LOOKUP_TYPE):
+        query_filter = self.get_query_filter(value, object_types=object_types, lookup=lookup)
+        rank = self.get_rank(value)
+
+        # Select the lowest-weight, highest-ranked match for each object
+        best_matches = CachedValue.objects.filter(query_filter).annotate(
+            rank=rank
+        ).order_by(
+            'object_type', 'object_id', 'weight', '-rank'
+        ).distinct(
+            'object_type', 'object_id'
+        )
+
+        results = list(
+            CachedValue.objects.filter(
+                pk__in=best_matches.values('pk')
+            ).annotate(
+                rank=rank
+            ).prefetch_related(
+                *self.get_prefetch(user)
+            ).order_by(
+                'weight', '-rank'
+            )[:MAX_RESULTS]
+        )
+
+        # Gather the ObjectTypes represented in the results (for prefetching display attributes)
+        object_types = {r.object_type for r in results}
+
+        return self.process_results(results, object_types)
+
+
 def get_backend():
     """
     Initializes and returns the configured search backend.
@@ -285,6 +427,50 @@ def get_backend():
 
 search_backend = get_backend()
 
+
+def process_search_queue(queue):
+    """
+    Refresh the cached representations of all queued objects. This serves as the entry point for background workers.
+    """
+    search_backend.flush(queue)
+
+
+def flush_search_queue(queue):
+    """
+    Refresh the search cache for all queued objects, either immediately or (if SEARCH_CACHE_BACKGROUND is enabled)
+    by enqueueing a background task.
+    """
+    if not queue:
+        return
+    if settings.SEARCH_CACHE_BACKGROUND:
+        queue_name = get_config().QUEUE_MAPPINGS.get('search', RQ_QUEUE_DEFAULT)
+        get_queue(queue_name).enqueue(
+            'netbox.search.backends.process_search_queue',
+            queue={label: list(pks) for label, pks in queue.items()}
+        )
+    else:
+        process_search_queue(queue)
+
+
+@contextmanager
+def deferred_caching():
+    """
+    Queue any objects created, modified, or deleted within the context, and refresh their cached representations in
+    bulk on exit (rather than individually as each object is saved). Nested contexts share the outermost queue.
+    """
+    if search_queue.get() is not None:
+        yield
+        return
+
+    token = search_queue.set(defaultdict(set))
+    try:
+        yield
+    finally:
+        queue = search_queue.get()
+        search_queue.reset(token)
+        flush_search_queue(queue)
+
+
 # Connect handlers to the appropriate model signals
 post_save.connect(search_backend.caching_handler)
 post_delete.connect(search_backend.removal_handler)
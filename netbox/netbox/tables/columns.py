@@ -18,6 +18,7 @@ from django_tables2.columns import library
 from django_tables2.utils import Accessor
 
 from extras.choices import CustomFieldTypeChoices
+from extras.utils import CustomFieldResolver
 from utilities.object_types import object_type_identifier, object_type_name
 from utilities.permissions import get_permission_for_model
 from utilities.templatetags.builtins.filters import render_markdown
@@ -509,7 +510,18 @@ class CustomFieldColumn(tables.Column):
             return f'<a href="{item.get_absolute_url()}">{escape(item)}</a>'
         return escape(item)
 
-    def render(self, value):
+    def deserialize(self, value, record, table):
+        """
+        Deserialize a custom field value. Objects referenced by object and multi-object custom fields are retrieved
+        for all records on the table's current page at once.
+        """
+        resolver = getattr(record, '_custom_field_resolver', None)
+        if resolver is None:
+            resolver = CustomFieldResolver.for_objects(row.record for row in table.paginated_rows)
+            record._custom_field_resolver = resolver
+        return resolver.deserialize(self.customfield, value)
+
+    def render(self, value, record, table):
         if self.customfield.type == CustomFieldTypeChoices.TYPE_BOOLEAN and value is True:
             return mark_safe('<i class="mdi mdi-check-bold text-success"></i>')
         if self.customfield.type == CustomFieldTypeChoices.TYPE_BOOLEAN and value is False:
@@ -522,22 +534,22 @@ class CustomFieldColumn(tables.Column):
             return ', '.join(self.customfield.get_choice_label(v) for v in value)
         if self.customfield.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
             return mark_safe(', '.join(
-                self._linkify_item(obj) for obj in self.customfield.deserialize(value)
+                self._linkify_item(obj) for obj in self.deserialize(value, record, table)
             ))
         if self.customfield.type == CustomFieldTypeChoices.TYPE_LONGTEXT and value:
             return render_markdown(value)
         if self.customfield.type == CustomFieldTypeChoices.TYPE_DATE and value:
             return parse_date(value).isoformat()
         if value is not None:
-            obj = self.customfield.deserialize(value)
+            obj = self.deserialize(value, record, table)
             return mark_safe(self._linkify_item(obj))
         return self.default
 
-    def value(self, value):
+    def value(self, value, record, table):
         if isinstance(value, list):
-            return ','.join(str(v) for v in self.customfield.deserialize(value))
+            return ','.join(str(v) for v in self.deserialize(value, record, table))
         if value is not None:
-            return self.customfield.deserialize(value)
+            return self.deserialize(value, record, table)
         return self.default
 
 
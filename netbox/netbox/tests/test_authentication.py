@@ -1,14 +1,21 @@
 import datetime
+from unittest.mock import patch
 
 from django.conf import settings
+from django.db import connection
 from django.test import Client
 from django.test.utils import override_settings
 from django.urls import reverse
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.test import APIClient
 
 from core.models import ObjectType
 from dcim.models import Rack, Site
+from extras.models import Tag
+from netbox.api.authentication import TokenAuthentication
+from netbox.authentication import ObjectPermissionBackend, invalidate_object_permissions
 from users.models import Group, ObjectPermission, Token, User
+from users.utils import flush_token_last_used
 from utilities.testing import TestCase
 from utilities.testing.api import APITestCase
 
@@ -28,10 +35,27 @@ class TokenAuthenticationTestCase(APITestCase):
         response = self.client.get(url, HTTP_AUTHORIZATION=f'Token {token.key}')
         self.assertEqual(response.status_code, 200)
 
-        # Check that the token's last_used time has been updated
+        # Check that the token's last_used time has been updated once buffered updates have been written
+        flush_token_last_used()
         token.refresh_from_db()
         self.assertIsNotNone(token.last_used)
 
+    def test_token_cache(self):
+        token = Token.objects.create(user=self.user)
+        authentication = TokenAuthentication()
+        authentication.authenticate_credentials(token.key)
+
+        # Subsequent authentication should not query the database
+        with self.assertNumQueries(0):
+            user, cached_token = authentication.authenticate_credentials(token.key)
+        self.assertEqual(user, self.user)
+        self.assertEqual(cached_token, token)
+
+        # Revoking the token should take effect immediately
+        token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            authentication.authenticate_credentials(token.key)
+
     @override_settings(LOGIN_REQUIRED=True, EXEMPT_VIEW_PERMISSIONS=['*'])
     def test_token_expiration(self):
         url = reverse('dcim-api:site-list')
@@ -578,3 +602,95 @@ class ObjectPermissionAPIViewTestCase(TestCase):
         url = reverse('dcim-api:rack-detail', kwargs={'pk': self.racks[0].pk})
         response = self.client.delete(url, format='json', **self.header)
         self.assertEqual(response.status_code, 204)
+
+
+class RestrictedQuerySetTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        sites = (
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+        )
+        Site.objects.bulk_create(sites)
+        racks = (
+            Rack(name='Rack 1', site=sites[0]),
+            Rack(name='Rack 2', site=sites[0]),
+            Rack(name='Rack 3', site=sites[1]),
+        )
+        Rack.objects.bulk_create(racks)
+
+        tags = (
+            Tag(name='Tag 1', slug='tag-1'),
+            Tag(name='Tag 2', slug='tag-2'),
+        )
+        Tag.objects.bulk_create(tags)
+        racks[0].tags.set(tags)
+        racks[2].tags.set([tags[1]])
+
+    def _restrict(self, constraints):
+        obj_perm = ObjectPermission(name='Test permission', constraints=constraints, actions=['view'])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(Rack))
+
+        return Rack.objects.restrict(self.user, 'view')
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_restrict_single_valued(self):
+        """
+        Constraints traversing only single-valued relationships should be applied directly.
+        """
+        queryset = self._restrict({'site__name': 'Site 1'})
+        self.assertNotIn('IN (SELECT', str(queryset.query))
+        self.assertEqual(sorted(queryset.values_list('name', flat=True)), ['Rack 1', 'Rack 2'])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_restrict_multivalued(self):
+        """
+        Constraints traversing a many-to-many relationship should not produce duplicate results.
+        """
+        queryset = self._restrict({'tags__slug__in': ['tag-1', 'tag-2']})
+        self.assertIn('IN (SELECT', str(queryset.query))
+        self.assertEqual(sorted(queryset.values_list('name', flat=True)), ['Rack 1', 'Rack 3'])
+
+
+class ObjectPermissionCacheTestCase(TestCase):
+
+    def _get_all_permissions(self):
+        # The cache is bypassed within a transaction (as is every test), so simulate autocommit mode
+        user = User.objects.get(pk=self.user.pk)
+        with patch.object(connection, 'in_atomic_block', False):
+            return ObjectPermissionBackend().get_all_permissions(user)
+
+    def test_cached_permissions(self):
+        invalidate_object_permissions()
+        self.assertNotIn('dcim.view_site', self._get_all_permissions())
+
+        # Assign a permission to the user and check that the cached permissions are invalidated once committed
+        with self.captureOnCommitCallbacks(execute=True):
+            obj_perm = ObjectPermission(name='Test permission', constraints={'name': 'Site 1'}, actions=['view'])
+            obj_perm.save()
+            obj_perm.object_types.add(ObjectType.objects.get_for_model(Site))
+            obj_perm.users.add(self.user)
+        self.assertEqual(self._get_all_permissions()['dcim.view_site'], [{'name': 'Site 1'}])
+
+        # Cached permissions are reused
+        with self.assertNumQueries(1):
+            # The user is retrieved from the database
+            self.assertIn('dcim.view_site', self._get_all_permissions())
+
+        # Disable the permission
+        with self.captureOnCommitCallbacks(execute=True):
+            obj_perm.enabled = False
+            obj_perm.save()
+        self.assertNotIn('dcim.view_site', self._get_all_permissions())
+
+    def test_cached_permissions_default_permissions(self):
+        invalidate_object_permissions()
+        self.assertNotIn('dcim.view_site', self._get_all_permissions())
+
+        # Cached permissions are not reused once DEFAULT_PERMISSIONS has changed
+        with override_settings(DEFAULT_PERMISSIONS={'dcim.view_site': ()}):
+            self.assertIn('dcim.view_site', self._get_all_permissions())
+        self.assertNotIn('dcim.view_site', self._get_all_permissions())
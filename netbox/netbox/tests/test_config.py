@@ -3,7 +3,7 @@ from django.core.cache import cache
 from django.test import override_settings, TestCase
 
 from core.models import ConfigRevision
-from netbox.config import clear_config, get_config
+from netbox.config import clear_config, get_config, invalidate_config
 
 
 # Prefix cache keys to avoid interfering with the local environment
@@ -16,6 +16,7 @@ class ConfigTestCase(TestCase):
     @override_settings(CACHES=CACHES)
     def test_config_init_empty(self):
         cache.clear()
+        invalidate_config(publish=False)
 
         config = get_config()
         self.assertEqual(config.config, {})
@@ -27,6 +28,7 @@ class ConfigTestCase(TestCase):
     def test_config_init_from_db(self):
         CONFIG_DATA = {'BANNER_TOP': 'A'}
         cache.clear()
+        invalidate_config(publish=False)
 
         # Create a config but don't load it into the cache
         configrevision = ConfigRevision.objects.create(data=CONFIG_DATA)
@@ -41,6 +43,7 @@ class ConfigTestCase(TestCase):
     def test_config_init_from_cache(self):
         CONFIG_DATA = {'BANNER_TOP': 'B'}
         cache.clear()
+        invalidate_config(publish=False)
 
         # Create a config and load it into the cache
         configrevision = ConfigRevision.objects.create(data=CONFIG_DATA)
@@ -56,6 +59,7 @@ class ConfigTestCase(TestCase):
     def test_settings_override(self):
         CONFIG_DATA = {'BANNER_TOP': 'A'}
         cache.clear()
+        invalidate_config(publish=False)
 
         # Create a config and load it into the cache
         configrevision = ConfigRevision.objects.create(data=CONFIG_DATA)
@@ -66,3 +70,36 @@ class ConfigTestCase(TestCase):
         self.assertEqual(config.version, configrevision.pk)
 
         clear_config()
+
+    @override_settings(CACHES=CACHES, CONFIG_REVALIDATION_INTERVAL=3600)
+    def test_config_snapshot(self):
+        cache.clear()
+        invalidate_config(publish=False)
+        configrevision1 = ConfigRevision.objects.create(data={'BANNER_TOP': 'A'})
+        configrevision1.activate()
+
+        # The process-wide snapshot is reused across requests
+        config = get_config()
+        clear_config()
+        self.assertIs(get_config(), config)
+        clear_config()
+
+        # Changes to the cache are not detected until the snapshot is revalidated
+        cache.set('config_version', None)
+        self.assertIs(get_config(), config)
+        clear_config()
+
+        # Activating a revision invalidates the snapshot
+        configrevision2 = ConfigRevision.objects.create(data={'BANNER_TOP': 'B'})
+        configrevision2.activate()
+        config = get_config()
+        self.assertEqual(config.version, configrevision2.pk)
+        self.assertEqual(config.BANNER_TOP, 'B')
+
+        # The configuration pinned to the current thread does not change until it is cleared
+        configrevision1.activate()
+        self.assertEqual(get_config().version, configrevision2.pk)
+        clear_config()
+        self.assertEqual(get_config().version, configrevision1.pk)
+
+        clear_config()
@@ -1,14 +1,22 @@
+import hashlib
 import json
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from graphql import parse, validate
 from rest_framework import status
 
 from core.models import ObjectType
 from dcim.choices import LocationStatusChoices
-from dcim.models import Site, Location
+from dcim.models import Interface, Site, Location
+from ipam.models import IPAddress, VRF
+from netbox.graphql.extensions import create_validator
+from netbox.graphql.schema import schema
 from users.models import ObjectPermission
-from utilities.testing import disable_warnings, APITestCase, TestCase
+from utilities.testing import create_test_device, disable_warnings, APITestCase, TestCase
 
 
 class GraphQLTestCase(TestCase):
@@ -42,6 +50,26 @@ class GraphQLTestCase(TestCase):
         with disable_warnings('django.request'):
             self.assertHttpStatus(response, 302)  # Redirect to login page
 
+    def test_query_complexity(self):
+        """
+        Validate the calculation of query complexity.
+        """
+        query = '{device_list {name interfaces {name mtu}}}'
+        # 1 + 10 * (1 + 1 + 10 * (1 + 1))
+        self.assertEqual(validate(schema._schema, parse(query), [create_validator(221)]), [])
+        errors = validate(schema._schema, parse(query), [create_validator(220)])
+        self.assertEqual(len(errors), 1)
+        self.assertIn('complexity of 221', errors[0].message)
+
+        # Fields within fragments count toward the complexity of a query
+        query = """
+            query {ip_address_list {...IPAddressFields}}
+            fragment IPAddressFields on IPAddressType {address assigned_object {... on InterfaceType {name}}}
+        """
+        # 1 + 10 * (1 + 1 + 1)
+        self.assertEqual(validate(schema._schema, parse(query), [create_validator(31)]), [])
+        self.assertEqual(len(validate(schema._schema, parse(query), [create_validator(30)])), 1)
+
 
 class GraphQLAPITestCase(APITestCase):
 
@@ -126,3 +154,164 @@ class GraphQLAPITestCase(APITestCase):
         data = json.loads(response.content)
         self.assertNotIn('errors', data)
         self.assertEqual(len(data['data']['site']['locations']), 0)
+
+    def _get_query_count(self, query):
+        """
+        Execute a GraphQL query and return the response data along with the number of database queries executed.
+        """
+        url = reverse('graphql')
+
+        # Warm any caches (e.g. of the API token) so that only the queries needed to resolve the request are counted
+        self.client.post(url, data={'query': '{__typename}'}, format="json", **self.header)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, data={'query': query}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        return data['data'], len(queries)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_graphql_generic_foreign_key_queries(self):
+        """
+        Objects assigned via a generic foreign key, and any related objects selected beneath them, should be
+        retrieved using a fixed number of queries.
+        """
+        device = create_test_device('Device 1')
+        vrf = VRF.objects.create(name='VRF 1')
+        query = """{
+            ip_address_list {
+                address
+                assigned_object {
+                    ... on InterfaceType {name device {name}}
+                    ... on FHRPGroupType {group_id}
+                }
+                vrf {name}
+            }
+        }"""
+
+        def add_ip_addresses(start, count):
+            interfaces = Interface.objects.bulk_create([
+                Interface(device=device, name=f'Interface {i}', type='1000base-t')
+                for i in range(start, start + count)
+            ])
+            IPAddress.objects.bulk_create([
+                IPAddress(address=f'192.0.2.{i}/24', assigned_object=interface, vrf=vrf)
+                for i, interface in enumerate(interfaces, start=start)
+            ])
+
+        # IP addresses, interfaces, devices, and VRFs
+        for start, count in ((1, 3), (4, 10)):
+            add_ip_addresses(start, count)
+            data, query_count = self._get_query_count(query)
+            self.assertEqual(query_count, 4)
+            self.assertEqual(len(data['ip_address_list']), start + count - 1)
+            for ip_address in data['ip_address_list']:
+                self.assertTrue(ip_address['assigned_object']['name'].startswith('Interface '))
+                self.assertEqual(ip_address['assigned_object']['device']['name'], device.name)
+                self.assertEqual(ip_address['vrf']['name'], vrf.name)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_graphql_nested_relation_queries(self):
+        """
+        Related objects selected through several levels of relationships should be retrieved using a fixed number of
+        queries.
+        """
+        vrf = VRF.objects.create(name='VRF 1')
+        query = """{
+            device_list {
+                name
+                interfaces {
+                    name
+                    ip_addresses {
+                        address
+                        vrf {name}
+                    }
+                }
+            }
+        }"""
+
+        for i in range(1, 4):
+            device = create_test_device(f'Device {i}')
+            interfaces = Interface.objects.bulk_create([
+                Interface(device=device, name=f'Interface {j}', type='1000base-t') for j in range(1, 3)
+            ])
+            IPAddress.objects.bulk_create([
+                IPAddress(address=f'192.0.{i}.{j}/24', assigned_object=interface, vrf=vrf)
+                for j, interface in enumerate(interfaces, start=1)
+            ])
+
+            # Devices, interfaces, IP addresses, and VRFs
+            data, query_count = self._get_query_count(query)
+            self.assertEqual(query_count, 4)
+            self.assertEqual(len(data['device_list']), i)
+            for device in data['device_list']:
+                for interface in device['interfaces']:
+                    self.assertEqual(interface['ip_addresses'][0]['vrf']['name'], vrf.name)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_graphql_persisted_query(self):
+        """
+        Test the resolution of automatic persisted queries.
+        """
+        Site.objects.create(name='Site 1', slug='site-1')
+        url = reverse('graphql')
+        query = '{site_list {name}}'
+        query_hash = hashlib.sha256(query.encode()).hexdigest()
+        extensions = {
+            'persistedQuery': {'version': 1, 'sha256Hash': query_hash},
+        }
+        cache.delete(f'graphql.persisted_query.{query_hash}')
+
+        # An unknown hash should return an error
+        data = {'extensions': extensions}
+        response = self.client.post(url, data=data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertEqual(data['errors'][0]['extensions']['code'], 'PERSISTED_QUERY_NOT_FOUND')
+
+        # A query which does not match its hash should be rejected
+        data = {'query': '{site_list {id}}', 'extensions': extensions}
+        response = self.client.post(url, data=data, format="json", **self.header)
+        data = json.loads(response.content)
+        self.assertEqual(data['errors'][0]['extensions']['code'], 'INVALID_SHA256_HASH')
+
+        # Submitting the query along with its hash should persist it
+        data = {'query': query, 'extensions': extensions}
+        response = self.client.post(url, data=data, format="json", **self.header)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        self.assertEqual(data['data']['site_list'], [{'name': 'Site 1'}])
+
+        # The hash alone should now suffice (via POST or GET)
+        data = {'extensions': extensions}
+        response = self.client.post(url, data=data, format="json", **self.header)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        self.assertEqual(data['data']['site_list'], [{'name': 'Site 1'}])
+        response = self.client.get(url, {'extensions': json.dumps(extensions)}, HTTP_ACCEPT='*/*', **self.header)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        self.assertEqual(data['data']['site_list'], [{'name': 'Site 1'}])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'], LOGIN_REQUIRED=False)
+    def test_graphql_persisted_query_anonymous(self):
+        """
+        Queries submitted by anonymous users should be executed, but not persisted.
+        """
+        Site.objects.create(name='Site 1', slug='site-1')
+        url = reverse('graphql')
+        query = '{site_list {slug}}'
+        query_hash = hashlib.sha256(query.encode()).hexdigest()
+        extensions = {
+            'persistedQuery': {'version': 1, 'sha256Hash': query_hash},
+        }
+        cache.delete(f'graphql.persisted_query.{query_hash}')
+
+        data = {'query': query, 'extensions': extensions}
+        response = self.client.post(url, data=data, format="json")
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        self.assertEqual(data['data']['site_list'], [{'slug': 'site-1'}])
+        self.assertIsNone(cache.get(f'graphql.persisted_query.{query_hash}'))
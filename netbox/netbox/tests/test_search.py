@@ -4,7 +4,7 @@ from django.test import TestCase
 from dcim.models import Site
 from dcim.search import SiteIndex
 from extras.models import CachedValue
-from netbox.search.backends import search_backend
+from netbox.search.backends import TrigramSearchBackend, deferred_caching, search_backend
 
 
 class SearchBackendTestCase(TestCase):
@@ -123,6 +123,35 @@ class SearchBackendTestCase(TestCase):
             CachedValue.objects.filter(object_type=content_type, object_id=site.pk).exists()
         )
 
+    def test_deferred_caching(self):
+        """
+        Test that caching of objects saved or deleted within a deferred_caching() context is performed on exit.
+        """
+        content_type = ContentType.objects.get_for_model(Site)
+        search_backend.cache(Site.objects.all())
+
+        with deferred_caching():
+            site = Site(name='Site 4', slug='site-4', description='Fourth test site')
+            site.save()
+            deleted_site_pk = Site.objects.get(name='Site 1').pk
+            Site.objects.get(pk=deleted_site_pk).delete()
+
+            # Cached values should not have been updated yet
+            self.assertFalse(
+                CachedValue.objects.filter(object_type=content_type, object_id=site.pk).exists()
+            )
+            self.assertTrue(
+                CachedValue.objects.filter(object_type=content_type, object_id=deleted_site_pk).exists()
+            )
+
+        self.assertEqual(
+            CachedValue.objects.filter(object_type=content_type, object_id=site.pk).count(),
+            3  # name, slug, description
+        )
+        self.assertFalse(
+            CachedValue.objects.filter(object_type=content_type, object_id=deleted_site_pk).exists()
+        )
+
     def test_clear_all(self):
         """
         Test that calling clear() on the backend removes all cached entries.
@@ -151,3 +180,21 @@ class SearchBackendTestCase(TestCase):
         self.assertEqual(len(results), 1)
         results = search_backend.search('xxxxx')
         self.assertEqual(len(results), 0)
+
+    def test_search_trigram_backend(self):
+        """
+        Test various searches using the trigram search backend.
+        """
+        sites = Site.objects.all()
+        search_backend.cache(sites)
+        backend = TrigramSearchBackend()
+
+        results = backend.search('site')
+        self.assertEqual(len(results), 3)
+        results = backend.search('first')
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].object, sites.get(name='Site 1'))
+        results = backend.search('site first')
+        self.assertEqual(len(results), 1)
+        results = backend.search('xxxxx')
+        self.assertEqual(len(results), 0)
@@ -9,25 +9,35 @@ from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist, Valida
 from django.db import transaction, IntegrityError
 from django.db.models import ManyToManyField, ProtectedError, RestrictedError
 from django.db.models.fields.reverse_related import ManyToManyRel
-from django.forms import ModelMultipleChoiceField, MultipleHiddenInput
+from django.db.models.signals import post_save
+from django.forms import BooleanField, ModelMultipleChoiceField, MultipleHiddenInput
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
 from django_tables2.export import TableExport
 from mptt.models import MPTTModel
 
+from core.jobs import BulkDeleteJob, BulkImportJob
 from core.models import ObjectType
 from core.signals import clear_events
 from extras.choices import CustomFieldUIEditableChoices
 from extras.models import CustomField, ExportTemplate
+from netbox.choices import ImportMethodChoices
+from netbox.context_managers import deferred_change_logging
+from netbox.models.features import ChangeLoggingMixin, TagsMixin
+from utilities.deletion import bulk_delete
 from utilities.error_handlers import handle_protectederror
 from utilities.exceptions import AbortRequest, AbortTransaction, PermissionsViolation
 from utilities.forms import BulkRenameForm, ConfirmationForm, restrict_form_fields
 from utilities.forms.bulk_import import BulkImportForm
+from utilities.forms.fields import prefetch_csv_choices
 from utilities.htmx import htmx_partial
 from utilities.permissions import get_permission_for_model
+from utilities.request import copy_safe_request
+from utilities.rqworker import get_workers_for_queue
 from utilities.views import GetReturnURLMixin, get_viewname
 from .base import BaseMultiObjectView
 from .mixins import ActionsMixin, TableMixin
@@ -309,10 +319,13 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
     Attributes:
         model_form: The form used to create each imported object
+        progress_callback: A callable to which the number of records processed and the total number of records are
+            passed periodically during an import (optional)
     """
     template_name = 'generic/bulk_import.html'
     model_form = None
     related_object_forms = dict()
+    progress_callback = None
 
     def get_required_permission(self):
         return get_permission_for_model(self.queryset.model, 'add')
@@ -342,13 +355,10 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
     def _save_object(self, import_form, model_form, request):
 
-        # Save the primary object
+        # Save the primary object. (Object-level permissions are enforced for all imported objects at once by
+        # import_objects().)
         obj = self.save_object(model_form, request)
 
-        # Enforce object-level permissions
-        if not self.queryset.filter(pk=obj.pk).first():
-            raise PermissionsViolation()
-
         # Iterate through the related object forms (if any), validating and saving each instance.
         for field_name, related_object_form in self.related_object_forms.items():
 
@@ -393,6 +403,7 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         return object_form.save()
 
     def create_and_update_objects(self, form, request):
+        logger = logging.getLogger('netbox.views.BulkImportView')
         saved_objects = []
 
         records = list(form.cleaned_data['data'])
@@ -404,66 +415,116 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
             for obj in self.queryset.model.objects.filter(id__in=prefetch_ids)
         } if prefetch_ids else {}
 
-        for i, record in enumerate(records, start=1):
-            instance = None
-            object_id = int(record.pop('id')) if record.get('id') else None
+        # Retrieve the custom fields whose default values are applied to new objects
+        custom_fields = CustomField.objects.filter(
+            object_types=ContentType.objects.get_for_model(self.queryset.model),
+            ui_editable=CustomFieldUIEditableChoices.YES
+        )
 
-            # Determine whether this object is being created or updated
-            if object_id:
-                try:
-                    instance = prefetched_objects[object_id]
-                except KeyError:
-                    form.add_error('data', _("Row {i}: Object with ID {id} does not exist").format(i=i, id=object_id))
-                    raise ValidationError('')
+        # Resolve the related objects referenced by all records in advance
+        form_kwargs = {'headers': form._csv_headers} if hasattr(form, '_csv_headers') else {}
+        template_form = self.model_form(**form_kwargs)
+        restrict_form_fields(template_form, request.user)
+        with prefetch_csv_choices(template_form, records):
+            for i, record in enumerate(records, start=1):
+                saved_objects.append(
+                    self._create_or_update_object(form, request, i, record, prefetched_objects, custom_fields)
+                )
+                if not i % 1000 or i == len(records):
+                    logger.info(f"Imported {i} of {len(records)} records")
+                    if self.progress_callback is not None:
+                        self.progress_callback(i, len(records))
 
-                # Take a snapshot for change logging
-                if instance.pk and hasattr(instance, 'snapshot'):
-                    instance.snapshot()
+        return saved_objects
 
-            else:
-                # For newly created objects, apply any default custom field values
-                custom_fields = CustomField.objects.filter(
-                    object_types=ContentType.objects.get_for_model(self.queryset.model),
-                    ui_editable=CustomFieldUIEditableChoices.YES
-                )
-                for cf in custom_fields:
-                    field_name = f'cf_{cf.name}'
-                    if field_name not in record:
-                        record[field_name] = cf.default
-
-            # Instantiate the model form for the object
-            model_form_kwargs = {
-                'data': record,
-                'instance': instance,
-            }
-            if hasattr(form, '_csv_headers'):
-                model_form_kwargs['headers'] = form._csv_headers  # Add CSV headers
-            model_form = self.model_form(**model_form_kwargs)
-
-            # When updating, omit all form fields other than those specified in the record. (No
-            # fields are required when modifying an existing object.)
-            if object_id:
-                unused_fields = [f for f in model_form.fields if f not in record]
-                for field_name in unused_fields:
-                    del model_form.fields[field_name]
-
-            restrict_form_fields(model_form, request.user)
+    def _create_or_update_object(self, form, request, i, record, prefetched_objects, custom_fields):
+        """
+        Validate and save a single record from the import data.
+        """
+        instance = None
+        object_id = int(record.pop('id')) if record.get('id') else None
 
-            if model_form.is_valid():
-                obj = self._save_object(form, model_form, request)
-                saved_objects.append(obj)
-            else:
-                # Replicate model form errors for display
-                for field, errors in model_form.errors.items():
-                    for err in errors:
-                        if field == '__all__':
-                            form.add_error(None, f'Record {i}: {err}')
-                        else:
-                            form.add_error(None, f'Record {i} {field}: {err}')
+        # Determine whether this object is being created or updated
+        if object_id:
+            try:
+                instance = prefetched_objects[object_id]
+            except KeyError:
+                form.add_error('data', _("Row {i}: Object with ID {id} does not exist").format(i=i, id=object_id))
+                raise ValidationError('')
 
-                raise ValidationError("")
+            # Take a snapshot for change logging
+            if instance.pk and hasattr(instance, 'snapshot'):
+                instance.snapshot()
 
-        return saved_objects
+        else:
+            # For newly created objects, apply any default custom field values
+            for cf in custom_fields:
+                field_name = f'cf_{cf.name}'
+                if field_name not in record:
+                    record[field_name] = cf.default
+
+        # Instantiate the model form for the object
+        model_form_kwargs = {
+            'data': record,
+            'instance': instance,
+        }
+        if hasattr(form, '_csv_headers'):
+            model_form_kwargs['headers'] = form._csv_headers  # Add CSV headers
+        model_form = self.model_form(**model_form_kwargs)
+
+        # When updating, omit all form fields other than those specified in the record. (No
+        # fields are required when modifying an existing object.)
+        if object_id:
+            unused_fields = [f for f in model_form.fields if f not in record]
+            for field_name in unused_fields:
+                del model_form.fields[field_name]
+
+        restrict_form_fields(model_form, request.user)
+
+        if model_form.is_valid():
+            return self._save_object(form, model_form, request)
+
+        # Replicate model form errors for display
+        for field, errors in model_form.errors.items():
+            for err in errors:
+                if field == '__all__':
+                    form.add_error(None, f'Record {i}: {err}')
+                else:
+                    form.add_error(None, f'Record {i} {field}: {err}')
+
+        raise ValidationError("")
+
+    def import_objects(self, form, request):
+        """
+        Create and update objects from the validated import form within a single transaction, enforcing object-level
+        permissions. Change records are created in bulk once all objects have been saved.
+
+        Args:
+            form: The validated BulkImportForm
+            request: The current request
+        """
+        with transaction.atomic():
+            with deferred_change_logging():
+                new_objs = self.create_and_update_objects(form, request)
+
+            # Enforce object-level permissions
+            if self.queryset.filter(pk__in=[obj.pk for obj in new_objs]).count() != len(new_objs):
+                raise PermissionsViolation
+
+        return new_objs
+
+    def _get_job_data(self, form, request):
+        """
+        Return the bound data for a BulkImportForm to be validated by a background import job. The contents of any
+        uploaded file are passed as direct input.
+        """
+        data = request.POST.dict()
+        if form.cleaned_data['import_method'] == ImportMethodChoices.UPLOAD:
+            data.update({
+                'import_method': ImportMethodChoices.DIRECT,
+                'data': form.raw_data,
+            })
+        return data
 
     #
     # Request handlers
@@ -485,17 +546,31 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         model = self.model_form._meta.model
         form = BulkImportForm(request.POST, request.FILES)
 
-        if form.is_valid():
+        if form.is_valid() and form.cleaned_data['background_job']:
+            logger.debug("Import form validation was successful; enqueuing background job")
+
+            if not get_workers_for_queue('default'):
+                form.add_error(None, _("Unable to enqueue import job: RQ worker process not running."))
+            else:
+                # Any uploaded file has already been read into the job data
+                job_request = copy_safe_request(request)
+                job_request.FILES = {}
+                job = BulkImportJob.enqueue(
+                    name=_("Import {model}").format(model=model._meta.verbose_name_plural),
+                    user=request.user,
+                    view=f'{self.__module__}.{self.__class__.__qualname__}',
+                    data=self._get_job_data(form, request),
+                    request=job_request,
+                )
+                messages.info(request, _("Import job {id} has been enqueued.").format(id=job.pk))
+                return redirect('core:job', pk=job.pk)
+
+        elif form.is_valid():
             logger.debug("Import form validation was successful")
 
             try:
                 # Iterate through data and bind each record to a new model form instance.
-                with transaction.atomic():
-                    new_objs = self.create_and_update_objects(form, request)
-
-                    # Enforce object-level permissions
-                    if self.queryset.filter(pk__in=[obj.pk for obj in new_objs]).count() != len(new_objs):
-                        raise PermissionsViolation
+                new_objs = self.import_objects(form, request)
 
                 if new_objs:
                     msg = f"Imported {len(new_objs)} {model._meta.verbose_name_plural}"
@@ -533,10 +608,13 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
     Attributes:
         filterset: FilterSet to apply when deleting by QuerySet
         form: The form class used to edit objects in bulk
+        bulk_update_fields: Concrete model fields which are not relied upon by the model's save() method. When only
+            these fields are modified, all objects are updated using a single query rather than saved individually.
     """
     template_name = 'generic/bulk_edit.html'
     filterset = None
     form = None
+    bulk_update_fields = ()
 
     def get_required_permission(self):
         return get_permission_for_model(self.queryset.model, 'change')
@@ -577,8 +655,18 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
                 # This form field is used to modify a field rather than set its value directly
                 model_fields[name] = None
 
+        # If only fields which can be updated in bulk are being modified, update all objects using a single query
+        if fields := self._get_bulk_update_fields(form, nullified_fields):
+            return self._bulk_update_objects(form, fields, nullified_fields)
+
+        # Record the trees containing any MPTT nodes being modified
+        tree_ids = set()
+
         for obj in self.queryset.filter(pk__in=form.cleaned_data['pk']):
 
+            if isinstance(obj, MPTTModel):
+                tree_ids.add(obj.tree_id)
+
             # Take a snapshot of change-logged models
             if hasattr(obj, 'snapshot'):
                 obj.snapshot()
@@ -625,9 +713,68 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
 
             self.post_save_operations(form, obj)
 
-        # Rebuild the tree for MPTT models
+        # Rebuild the trees of MPTT models. If any node may have been moved, all trees must be rebuilt: tree IDs may
+        # have been renumbered, and the tree fields of the stale instances saved above cannot be relied upon.
         if issubclass(self.queryset.model, MPTTModel):
-            self.queryset.model.objects.rebuild()
+            model = self.queryset.model
+            if 'parent' in form.changed_data or 'parent' in nullified_fields:
+                model.objects.rebuild()
+            else:
+                model.objects.rebuild_trees(tree_ids)
+
+        return updated_objects
+
+    def _get_bulk_update_fields(self, form, nullified_fields):
+        """
+        Return the names of the fields being modified if all of them can be updated in bulk; otherwise, return None.
+        """
+        fields = {
+            name for name in form.changed_data if name != 'pk'
+        } | {
+            name for name in nullified_fields if name in form.nullable_fields
+        }
+        if fields and fields.issubset(self.bulk_update_fields):
+            return fields
+
+    def _bulk_update_objects(self, form, fields, nullified_fields):
+        """
+        Validate each selected object with the specified fields applied, then update all of them using a single
+        UPDATE query. The post_save signal is sent for each object as though it had been saved, so that change
+        logging, event rules, and search caching are handled as usual.
+        """
+        model = self.queryset.model
+        values = {}
+        for name in fields:
+            if name in form.nullable_fields and name in nullified_fields:
+                values[name] = None if model._meta.get_field(name).null else ''
+            else:
+                values[name] = form.cleaned_data[name]
+        if issubclass(model, ChangeLoggingMixin):
+            values['last_updated'] = timezone.now()
+
+        queryset = self.queryset.filter(pk__in=form.cleaned_data['pk'])
+        if issubclass(model, TagsMixin):
+            queryset = queryset.prefetch_related('tags')
+        updated_objects = list(queryset)
+
+        for obj in updated_objects:
+            if hasattr(obj, 'snapshot'):
+                obj.snapshot()
+            for name, value in values.items():
+                setattr(obj, name, value)
+            obj.full_clean()
+        model.objects.filter(pk__in=[obj.pk for obj in updated_objects]).update(**values)
+
+        for obj in updated_objects:
+            post_save.send(
+                sender=model,
+                instance=obj,
+                created=False,
+                update_fields=frozenset(values),
+                raw=False,
+                using=queryset.db
+            )
+            self.post_save_operations(form, obj)
 
         return updated_objects
 
@@ -669,7 +816,8 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
                 logger.debug("Form validation was successful")
                 try:
                     with transaction.atomic():
-                        updated_objects = self._update_objects(form, request)
+                        with deferred_change_logging():
+                            updated_objects = self._update_objects(form, request)
 
                         # Enforce object-level permissions
                         object_count = self.queryset.filter(pk__in=[obj.pk for obj in updated_objects]).count()
@@ -828,6 +976,11 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
         """
         class BulkDeleteForm(ConfirmationForm):
             pk = ModelMultipleChoiceField(queryset=self.queryset, widget=MultipleHiddenInput)
+            background_job = BooleanField(
+                label=_("Background job"),
+                required=False,
+                help_text=_("Delete the objects using a background job (recommended for very large deletions)")
+            )
 
         return BulkDeleteForm
 
@@ -858,16 +1011,26 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
             if form.is_valid():
                 logger.debug("Form validation was successful")
 
-                # Delete objects
                 queryset = self.queryset.filter(pk__in=pk_list)
-                deleted_count = queryset.count()
+
+                # Enqueue a background job to delete the objects, if requested
+                if form.cleaned_data.get('background_job'):
+                    if not get_workers_for_queue('default'):
+                        messages.error(request, _("Unable to enqueue deletion job: RQ worker process not running."))
+                        return redirect(self.get_return_url(request))
+                    job = BulkDeleteJob.enqueue(
+                        name=_("Delete {model}").format(model=model._meta.verbose_name_plural),
+                        user=request.user,
+                        view=f'{self.__module__}.{self.__class__.__qualname__}',
+                        pk_list=list(queryset.values_list('pk', flat=True)),
+                        request=copy_safe_request(request),
+                    )
+                    messages.info(request, _("Deletion job {id} has been enqueued.").format(id=job.pk))
+                    return redirect('core:job', pk=job.pk)
+
+                # Delete objects
                 try:
-                    with transaction.atomic():
-                        for obj in queryset:
-                            # Take a snapshot of change-logged models
-                            if hasattr(obj, 'snapshot'):
-                                obj.snapshot()
-                            obj.delete()
+                    deleted_count = bulk_delete(queryset)
 
                 except (ProtectedError, RestrictedError) as e:
                     logger.info(f"Caught {type(e)} while attempting to delete objects")
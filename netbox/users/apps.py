@@ -6,7 +6,7 @@ class UsersConfig(AppConfig):
 
     def ready(self):
         from netbox.models.features import register_models
-        from . import signals  # noqa: F401
+        from . import jobs, signals  # noqa: F401
 
         # Register models
         register_models(*self.get_models())
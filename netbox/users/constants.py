@@ -7,3 +7,12 @@ OBJECTPERMISSION_OBJECT_TYPES = Q(
 )
 
 CONSTRAINT_TOKEN_USER = '$user'
+
+# The number of seconds for which an authenticated API token is cached
+TOKEN_CACHE_TIMEOUT = 60
+
+# Redis hash buffering the time at which each API token was last used, pending a bulk update of the database
+TOKEN_LAST_USED_BUFFER = 'token_last_used'
+
+# The minimum number of seconds between updates of an API token's last used time
+TOKEN_LAST_USED_INTERVAL = 60
@@ -0,0 +1,25 @@
+import logging
+
+from core.choices import JobIntervalChoices
+from netbox.config import get_config
+from netbox.jobs import JobRunner, system_job
+from .utils import flush_token_last_used
+
+logger = logging.getLogger(__name__)
+
+
+@system_job(interval=JobIntervalChoices.INTERVAL_MINUTELY * 5)
+class TokenLastUsedJob(JobRunner):
+    """
+    Write the buffered last used times of API tokens to the database.
+    """
+    class Meta:
+        name = "Token Last Used Update"
+
+    def run(self, *args, **kwargs):
+        # The database is assumed to be read-only while maintenance mode is enabled
+        if get_config().MAINTENANCE_MODE:
+            return
+
+        count = flush_token_last_used()
+        logger.debug(f"Updated the last used time of {count} tokens")
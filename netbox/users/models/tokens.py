@@ -1,4 +1,5 @@
 import binascii
+import hashlib
 import os
 
 from django.conf import settings
@@ -95,6 +96,14 @@ class Token(models.Model):
         # Generate a random 160-bit key expressed in hexadecimal.
         return binascii.hexlify(os.urandom(20)).decode()
 
+    @staticmethod
+    def get_cache_key(key):
+        """
+        Return the key under which the Token with the given key is cached. The key is hashed so that it is never
+        stored in the cache.
+        """
+        return f'token:{hashlib.sha256(key.encode()).hexdigest()}'
+
     @property
     def is_expired(self):
         if self.expires is None or timezone.now() < self.expires:
@@ -1,11 +1,15 @@
 import logging
+from functools import partial
 
 from django.contrib.auth.signals import user_login_failed
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
+from netbox.authentication import invalidate_object_permissions
 from netbox.config import get_config
-from users.models import User, UserConfig
+from users.models import Group, ObjectPermission, Token, User, UserConfig
 from utilities.request import get_client_ip
 
 
@@ -31,3 +35,50 @@ def create_userconfig(instance, created, raw=False, **kwargs):
     if created and not raw:
         config = get_config()
         UserConfig(user=instance, data=config.DEFAULT_USER_PREFERENCES).save()
+
+
+#
+# Permission caching
+#
+
+@receiver((post_save, post_delete), sender=ObjectPermission)
+@receiver(post_delete, sender=Group)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=Group.object_permissions.through)
+@receiver(m2m_changed, sender=User.object_permissions.through)
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_permissions(**kwargs):
+    """
+    Invalidate the cached permissions of all users once a change to ObjectPermissions or their assignment has been
+    committed.
+    """
+    transaction.on_commit(invalidate_object_permissions)
+
+
+@receiver((post_save, post_delete), sender=User)
+def invalidate_user_permissions(instance, **kwargs):
+    """
+    Invalidate the cached permissions of a user once a change to the user has been committed.
+    """
+    transaction.on_commit(partial(invalidate_object_permissions, instance.pk))
+
+
+#
+# Token caching
+#
+
+@receiver((post_save, post_delete), sender=Token)
+def invalidate_cached_token(instance, **kwargs):
+    """
+    Remove a Token from the cache when it has been modified or deleted (e.g. revoked).
+    """
+    cache.delete(Token.get_cache_key(instance.key))
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_user_tokens(instance, **kwargs):
+    """
+    Remove all of a user's Tokens from the cache when the user has been modified (e.g. deactivated).
+    """
+    if keys := instance.tokens.values_list('key', flat=True):
+        cache.delete_many([Token.get_cache_key(key) for key in keys])
@@ -1,5 +1,14 @@
+from datetime import datetime
+
+from django.utils import timezone
+from django_redis import get_redis_connection
 from social_core.storage import NO_ASCII_REGEX, NO_SPECIAL_REGEX
 
+from users.constants import TOKEN_LAST_USED_BUFFER, TOKEN_LAST_USED_INTERVAL
+
+# Token ID -> the time at which this process last recorded the token's use
+_token_uses = {}
+
 
 def clean_username(value):
     """Clean username removing any unsupported character"""
@@ -7,3 +16,42 @@ def clean_username(value):
     value = NO_SPECIAL_REGEX.sub('', value)
     value = value.replace(':', '')
     return value
+
+
+def record_token_use(token):
+    """
+    Record the use of an API token. The time of use is buffered in Redis (at most once per interval for each token)
+    and written to the database in bulk by flush_token_last_used().
+    """
+    from users.models import Token
+
+    now = timezone.now()
+    for last_used in (token.last_used, _token_uses.get(token.pk)):
+        if last_used and (now - last_used).total_seconds() <= TOKEN_LAST_USED_INTERVAL:
+            return
+    _token_uses[token.pk] = now
+
+    try:
+        get_redis_connection('default').hset(TOKEN_LAST_USED_BUFFER, token.pk, now.isoformat())
+    except NotImplementedError:
+        # The cache backend does not support buffering; update the token directly
+        Token.objects.filter(pk=token.pk).update(last_used=now)
+
+
+def flush_token_last_used():
+    """
+    Write all buffered API token last used times to the database. Returns the number of tokens updated.
+    """
+    from users.models import Token
+
+    # Retrieve and clear the buffer atomically
+    with get_redis_connection('default').pipeline() as pipeline:
+        pipeline.hgetall(TOKEN_LAST_USED_BUFFER)
+        pipeline.delete(TOKEN_LAST_USED_BUFFER)
+        buffer = pipeline.execute()[0]
+
+    tokens = [
+        Token(pk=int(pk), last_used=datetime.fromisoformat(last_used.decode()))
+        for pk, last_used in buffer.items()
+    ]
+    return Token.objects.bulk_update(tokens, ['last_used'], batch_size=1000)
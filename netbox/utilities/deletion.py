@@ -0,0 +1,88 @@
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.deletion import Collector
+from django.db.models.fields.reverse_related import ManyToManyRel
+from mptt.models import MPTTModel
+
+from netbox.context_managers import deferred_change_logging
+from netbox.models.features import ChangeLoggingMixin, TagsMixin
+
+__all__ = (
+    'bulk_delete',
+)
+
+
+def remove_reverse_m2m_assignments(model, objects):
+    """
+    Remove the given objects from any change-logged models which reference them via a many-to-many relationship.
+    Each referencing object is updated once (triggering an m2m_changed signal so that the change is recorded), and
+    each deleted object is flagged so that its pre_delete handler need not repeat this.
+    """
+    pks = {obj.pk for obj in objects}
+
+    for relation in model._meta.related_objects:
+        if type(relation) is not ManyToManyRel:
+            continue
+        related_model = relation.related_model
+        field_name = relation.remote_field.name
+        if not issubclass(related_model, ChangeLoggingMixin):
+            continue
+        related_objects = related_model.objects.filter(**{f'{field_name}__in': pks}).distinct()
+        for obj in related_objects.prefetch_related(field_name):
+            obj.snapshot()  # Ensure the change record includes the "before" state
+            getattr(obj, field_name).remove(*[o for o in getattr(obj, field_name).all() if o.pk in pks])
+
+    for obj in objects:
+        obj._reverse_m2m_removed = True
+
+
+def bulk_delete(queryset, chunk_size=None, progress_callback=None):
+    """
+    Delete all objects in the given queryset within a single transaction. Objects are deleted in chunks: each chunk's
+    cascade of related objects is collected and deleted at once, and change records for all deleted objects are
+    created in bulk upon completion. Objects whose model overrides delete() (or which belong to an MPTT tree) are
+    deleted individually. Returns the number of objects deleted (excluding any related objects).
+
+    Args:
+        queryset: The QuerySet of objects to delete
+        chunk_size: The maximum number of objects to delete at once (defaults to BULK_DELETE_CHUNK_SIZE)
+        progress_callback: A callable to which the number of objects deleted thus far and the total number of objects
+            are passed after each chunk is deleted (optional)
+    """
+    logger = logging.getLogger('netbox.deletion')
+    model = queryset.model
+    chunk_size = chunk_size or settings.BULK_DELETE_CHUNK_SIZE
+    delete_individually = model.delete is not Model.delete or issubclass(model, MPTTModel)
+    if issubclass(model, TagsMixin):
+        queryset = queryset.prefetch_related('tags')
+
+    pks = list(queryset.values_list('pk', flat=True))
+    deleted_count = 0
+    with transaction.atomic(using=queryset.db):
+        with deferred_change_logging():
+            for i in range(0, len(pks), chunk_size):
+                objects = list(queryset.filter(pk__in=pks[i:i + chunk_size]))
+
+                # Take a snapshot of change-logged models
+                for obj in objects:
+                    if hasattr(obj, 'snapshot'):
+                        obj.snapshot()
+
+                if delete_individually:
+                    for obj in objects:
+                        obj.delete()
+                else:
+                    remove_reverse_m2m_assignments(model, objects)
+                    collector = Collector(using=queryset.db, origin=queryset)
+                    collector.collect(objects)
+                    collector.delete()
+
+                deleted_count += len(objects)
+                logger.info(f"Deleted {deleted_count} of {len(pks)} {model._meta.verbose_name_plural}")
+                if progress_callback is not None:
+                    progress_callback(deleted_count, len(pks))
+
+    return deleted_count
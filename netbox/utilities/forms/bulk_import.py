@@ -38,6 +38,12 @@ class BulkImportForm(SyncedDataMixin, forms.Form):
         required=False
     )
 
+    background_job = forms.BooleanField(
+        label=_("Background job"),
+        required=False,
+        help_text=_("Import the data using a background job (recommended for very large imports)")
+    )
+
     data_field = 'data'
 
     def clean(self):
@@ -57,6 +63,7 @@ class BulkImportForm(SyncedDataMixin, forms.Form):
             data = self.cleaned_data['data_file'].data_as_string
         else:
             data = self.cleaned_data['data']
+        self.raw_data = data
 
         # Determine the data format
         if self.cleaned_data['format'] == ImportFormatChoices.AUTO:
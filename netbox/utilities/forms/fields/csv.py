@@ -1,7 +1,12 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django import forms
 from django.utils.translation import gettext_lazy as _
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist, FieldError
+from django.core.exceptions import (
+    EmptyResultSet, FieldError, MultipleObjectsReturned, ObjectDoesNotExist, ValidationError,
+)
 from django.db.models import Q
 
 from utilities.choices import unpack_grouped_choices
@@ -15,8 +20,12 @@ __all__ = (
     'CSVMultipleChoiceField',
     'CSVMultipleContentTypeField',
     'CSVTypedChoiceField',
+    'prefetch_csv_choices',
 )
 
+# Objects resolved in advance for CSVModelChoiceFields (see prefetch_csv_choices())
+prefetched_choices = ContextVar('prefetched_choices', default=None)
+
 
 class CSVChoicesMixin:
     STATIC_CHOICES = True
@@ -57,7 +66,21 @@ class CSVModelChoiceField(forms.ModelChoiceField):
         'invalid_choice': _('Object not found: %(value)s'),
     }
 
+    def get_prefetch_key(self):
+        """
+        Return a key identifying the set of objects from which this field selects, or None if the queryset cannot be
+        compared.
+        """
+        try:
+            return str(self.queryset.query), self.to_field_name or 'pk'
+        except EmptyResultSet:
+            return None
+
     def to_python(self, value):
+        # Return the prefetched object for this value, if one exists
+        if (prefetched := prefetched_choices.get()) and isinstance(value, (str, int)):
+            if (obj := prefetched.get(self.get_prefetch_key(), {}).get(str(value))) is not None:
+                return obj
         try:
             return super().to_python(value)
         except MultipleObjectsReturned:
@@ -120,3 +143,53 @@ class CSVMultipleContentTypeField(forms.ModelMultipleChoiceField):
                 ct_filter |= Q(app_label=app_label, model=model)
             return list(ContentType.objects.filter(ct_filter).values_list('pk', flat=True))
         return object_type_identifier(value)
+
+
+@contextmanager
+def prefetch_csv_choices(form, records):
+    """
+    Resolve the values of each CSVModelChoiceField on the given form for a batch of records in advance, using a single
+    query per field. Within the context, a field with an identical queryset returns the prefetched object for a value
+    before falling back to querying the database for it. Fields which reference the form's own model are excluded, as
+    earlier records may create or modify the referenced objects.
+
+    Args:
+        form: A model form instance representative of those used to validate the records
+        records: A list of dictionaries mapping field names to raw values
+    """
+    prefetched = {}
+
+    for name, field in form.fields.items():
+        if not isinstance(field, CSVModelChoiceField) or isinstance(field, CSVContentTypeField):
+            continue
+        if field.queryset.model is form._meta.model:
+            continue
+        key = field.get_prefetch_key()
+        if key is None or '__' in key[1]:
+            continue
+        values = {str(record[name]) for record in records if isinstance(record.get(name), (str, int))}
+        if not values:
+            continue
+
+        objects = {}
+        ambiguous = set()
+        try:
+            for obj in field.queryset.filter(**{f'{key[1]}__in': values}):
+                value = str(getattr(obj, key[1]))
+                if value in objects:
+                    ambiguous.add(value)
+                objects[value] = obj
+        except (FieldError, TypeError, ValueError, ValidationError):
+            # Leave invalid values to be reported by the field itself
+            continue
+
+        # Values matching multiple objects are left to the field to reject
+        for value in ambiguous:
+            del objects[value]
+        prefetched[key] = objects
+
+    token = prefetched_choices.set(prefetched)
+    try:
+        yield
+    finally:
+        prefetched_choices.reset(token)
@@ -1,13 +1,40 @@
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
 from django.apps import apps
-from jinja2 import BaseLoader, TemplateNotFound
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from jinja2 import BaseLoader, TemplateNotFound, nodes
 from jinja2.meta import find_referenced_templates
 from jinja2.sandbox import SandboxedEnvironment
+from prometheus_client import Counter
 
 from netbox.config import get_config
 
 __all__ = (
     'DataFileLoader',
+    'TemplateCache',
+    'get_environment',
+    'get_environment_key',
+    'get_template',
+    'get_template_relations',
+    'render_jinja2',
+    'template_cache',
+)
+
+template_cache_hits = Counter(
+    'netbox_jinja2_template_cache_hits',
+    'Number of compiled Jinja2 templates retrieved from the template cache'
 )
+template_cache_misses = Counter(
+    'netbox_jinja2_template_cache_misses',
+    'Number of Jinja2 templates compiled due to a template cache miss'
+)
+
+# Pooled Jinja2 environments, keyed by their parameters and filters
+_environments = {}
 
 
 class DataFileLoader(BaseLoader):
@@ -44,14 +71,178 @@ class DataFileLoader(BaseLoader):
         self._template_cache.update(templates)
 
 
+class TemplateCache:
+    """
+    A thread-safe, process-wide LRU cache of compiled Jinja2 Templates. The maximum number of templates retained is
+    determined by JINJA2_TEMPLATE_CACHE_SIZE.
+    """
+    def __init__(self):
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._templates)
+
+    def get(self, key, compile_template):
+        """
+        Return the Template cached under the given key, or call compile_template() to compile it (and cache the
+        result) if no such Template exists.
+
+        Args:
+            key: A hashable key which uniquely identifies the template source and its environment
+            compile_template: A callable which returns the compiled Template
+        """
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+        if template is not None:
+            template_cache_hits.inc()
+            return template
+
+        template_cache_misses.inc()
+        template = compile_template()
+        if maxsize := settings.JINJA2_TEMPLATE_CACHE_SIZE:
+            with self._lock:
+                self._templates[key] = template
+                while len(self._templates) > maxsize:
+                    self._templates.popitem(last=False)
+
+        return template
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+
+template_cache = TemplateCache()
+
+
 #
 # Utility functions
 #
 
-def render_jinja2(template_code, context):
+def get_environment_key(params=None):
+    """
+    Return a hashable key identifying a Jinja2 environment having the given parameters and the configured filters.
+    """
+    filters = get_config().JINJA2_FILTERS
+    return json.dumps(params or {}, sort_keys=True), tuple(sorted(filters.items()))
+
+
+def get_environment(params=None):
+    """
+    Return a SandboxedEnvironment (which cannot load other templates) having the given parameters and the configured
+    JINJA2_FILTERS. Environments are pooled, such that all templates rendered with the same parameters and filters
+    share a single environment.
+    """
+    key = get_environment_key(params)
+    try:
+        return _environments[key]
+    except KeyError:
+        environment = SandboxedEnvironment(loader=BaseLoader(), **(params or {}))
+        environment.filters.update(get_config().JINJA2_FILTERS)
+        return _environments.setdefault(key, environment)
+
+
+def get_template(template_code, params=None):
+    """
+    Return the compiled Jinja2 Template for the given source code, compiling it within a pooled environment (see
+    get_environment()) only if it is not already present in the template cache.
+    """
+    environment = get_environment(params)
+    return template_cache.get((environment, template_code), lambda: environment.from_string(source=template_code))
+
+
+def render_jinja2(template_code, context, stream=False):
     """
-    Render a Jinja2 template with the provided context. Return the rendered content.
+    Render a Jinja2 template with the provided context. Return the rendered content or, if stream is True, a generator
+    which yields the rendered content in chunks. (The template is compiled immediately in either case, so syntax errors
+    are raised before any content is generated.)
     """
-    environment = SandboxedEnvironment()
-    environment.filters.update(get_config().JINJA2_FILTERS)
-    return environment.from_string(source=template_code).render(**context)
+    template = get_template(template_code)
+    if stream:
+        return template.generate(**context)
+    return template.render(**context)
+
+
+def _resolve_relation(model, attrs, consumed=False):
+    """
+    Resolve a chain of attributes accessed on an instance of the given model to the path of the related objects it
+    traverses. Returns a two-tuple of the path and a boolean indicating whether the final relation must be prefetched
+    (as opposed to selected).
+
+    A many-to-many or one-to-many relation is prefetched only if it ends the chain and `consumed` is True (i.e. all
+    of its related objects are retrieved). Otherwise, the path to the preceding relation is returned for selection.
+    """
+    path = []
+    for i, attr in enumerate(attrs):
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+        # Ignore non-relational fields and references to a foreign key's raw value (e.g. site_id)
+        if not field.is_relation or field.name != attr:
+            break
+        path.append(attr)
+        # Generic foreign keys cannot be selected
+        if field.related_model is None:
+            return '__'.join(path), True
+        # Methods like filter() and first() query the database regardless of any prefetched objects
+        if not (field.many_to_one or field.one_to_one):
+            if consumed and i == len(attrs) - 1:
+                return '__'.join(path), True
+            return '__'.join(path[:-1]), False
+        model = field.related_model
+
+    return '__'.join(path), False
+
+
+@lru_cache(maxsize=128)
+def get_template_relations(template_code, model, variable='queryset'):
+    """
+    Inspect a Jinja2 template for related objects accessed on each member of the named iterable: for example,
+    `{{ device.site.region.name }}` within `{% for device in queryset %}`. Returns a two-tuple of relation paths to be
+    passed to select_related() (foreign keys and one-to-one relations) and prefetch_related() (all others). Many-to-many
+    and one-to-many relations are included only if they are iterated or accessed through all() or count().
+
+    Args:
+        template_code: The Jinja2 template source
+        model: The model of the objects being iterated
+        variable: The name of the context variable holding the objects
+    """
+    select_related = set()
+    prefetch_related = set()
+
+    for loop in SandboxedEnvironment().parse(template_code).find_all(nodes.For):
+        if not isinstance(loop.iter, nodes.Name) or loop.iter.name != variable:
+            continue
+        if not isinstance(loop.target, nodes.Name):
+            continue
+
+        # Record the nodes from which all related objects are retrieved
+        consumed = {id(node.iter) for node in loop.find_all(nodes.For)}
+        for call in loop.find_all(nodes.Call):
+            if isinstance(call.node, nodes.Getattr) and call.node.attr in ('all', 'count'):
+                consumed.add(id(call.node.node))
+
+        for node in loop.find_all(nodes.Getattr):
+            is_consumed = id(node) in consumed
+            attrs = []
+            while isinstance(node, nodes.Getattr):
+                attrs.insert(0, node.attr)
+                node = node.node
+            if not isinstance(node, nodes.Name) or node.name != loop.target.name:
+                continue
+            path, prefetch = _resolve_relation(model, attrs, consumed=is_consumed)
+            if prefetch:
+                prefetch_related.add(path)
+            elif path:
+                select_related.add(path)
+
+    # Omit any paths which are implied by a longer path
+    select_related = {
+        path for path in select_related if not any(p.startswith(f'{path}__') for p in select_related)
+    }
+
+    return tuple(sorted(select_related)), tuple(sorted(prefetch_related))
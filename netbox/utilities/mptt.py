@@ -21,4 +21,14 @@ class TreeManager(Manager.from_queryset(TreeQuerySet), TreeManager_):
     """
     Extend django-mptt's TreeManager to incorporate RestrictedQuerySet().
     """
-    pass
+    def rebuild_trees(self, tree_ids):
+        """
+        Rebuild only the trees with the specified IDs. If any tree is found to have more than one root node, all
+        trees are rebuilt. As nodes are selected by their tree ID, this is suitable only when no nodes have been moved
+        between trees.
+        """
+        try:
+            for tree_id in sorted(tree_ids):
+                self.partial_rebuild(tree_id)
+        except RuntimeError:
+            self.rebuild()
@@ -1,6 +1,9 @@
 from django.core.paginator import Paginator, Page
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 
 from netbox.config import get_config
+from utilities.query import get_estimated_count
 
 __all__ = (
     'EnhancedPage',
@@ -32,6 +35,22 @@ class EnhancedPaginator(Paginator):
 
         super().__init__(object_list, per_page, orphans=orphans, **kwargs)
 
+        # Indicates whether the count of objects is an estimate
+        self.count_estimated = False
+
+    @cached_property
+    def count(self):
+        # Employ the estimated count of large QuerySets (if enabled). A table passes its BoundRows, which wrap the
+        # QuerySet.
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            queryset = getattr(getattr(queryset, 'data', None), 'data', None)
+        if isinstance(queryset, QuerySet) and (estimated_count := get_estimated_count(queryset)) is not None:
+            self.count_estimated = True
+            return estimated_count
+
+        return super().count
+
     def _get_page(self, *args, **kwargs):
         return EnhancedPage(*args, **kwargs)
 
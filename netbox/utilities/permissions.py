@@ -1,11 +1,18 @@
+import json
+from functools import lru_cache
+
 from django.conf import settings
 from django.apps import apps
+from django.core.exceptions import FieldError
 from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.sql import Query
 from django.utils.translation import gettext_lazy as _
 
 from users.constants import CONSTRAINT_TOKEN_USER
 
 __all__ = (
+    'compile_constraints',
     'get_permission_for_model',
     'permission_is_exempt',
     'qs_filter_from_constraints',
@@ -112,3 +119,53 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+def _is_multivalued(model, lookup):
+    """
+    Return True if the given lookup (e.g. "site__region__slug") traverses a multi-valued relationship (e.g. a
+    many-to-many or reverse foreign key relationship) of the model.
+    """
+    try:
+        path = Query(model).names_to_path(lookup.split(LOOKUP_SEP), model._meta, allow_many=True)[0]
+    except FieldError:
+        # Treat an invalid lookup conservatively; filtering on it will raise an exception regardless
+        return True
+    return any(path_info.m2m for path_info in path)
+
+
+def _compile_constraints(model, constraints, user_id):
+    attrs = qs_filter_from_constraints(constraints, {CONSTRAINT_TOKEN_USER: user_id})
+    if not attrs:
+        # Unconstrained (model-level) access
+        return attrs, False
+    multivalued = any(
+        _is_multivalued(model, lookup) for constraint in constraints for lookup in constraint
+    )
+    return attrs, multivalued
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached_constraints(model, constraints_json, user_id):
+    return _compile_constraints(model, json.loads(constraints_json), user_id)
+
+
+def compile_constraints(model, constraints, user=None):
+    """
+    Compile an iterable of ObjectPermission constraints applicable to a model into a Q object. Returns a tuple of the
+    Q object and a boolean indicating whether the constraints traverse any multi-valued relationships (in which case
+    filtering on them directly may yield duplicate results). Compiled constraints are cached in memory, keyed by their
+    content and the user ID substituted for any user tokens.
+
+    Args:
+        model: The model to which the constraints apply
+        constraints: An iterable of constraint dictionaries
+        user: The User substituted for any user tokens
+    """
+    user_id = getattr(user, 'pk', None)
+    try:
+        constraints_json = json.dumps(list(constraints), sort_keys=True)
+    except TypeError:
+        # Constraints which cannot be serialized are compiled without caching
+        return _compile_constraints(model, list(constraints), user_id)
+    return _compile_cached_constraints(model, constraints_json, user_id)
@@ -1,12 +1,118 @@
+import json
+from functools import cache
+
+from django.conf import settings
 from django.db.models import Count, OuterRef, Subquery
 from django.db.models.functions import Coalesce
 
 __all__ = (
+    'ChunkedQuerySet',
     'count_related',
     'dict_to_filter_params',
+    'get_estimated_count',
+    'get_prefetched_queryset',
 )
 
 
+class ChunkedQuerySet:
+    """
+    Wrap a QuerySet such that iterating over it retrieves objects from the database in chunks, rather than evaluating
+    and caching the entire QuerySet at once. All other attributes are proxied to the underlying QuerySet.
+    """
+    def __init__(self, queryset, chunk_size=1000):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return self.queryset.iterator(chunk_size=self.chunk_size)
+
+    def __len__(self):
+        return self.queryset.count()
+
+    def __bool__(self):
+        return self.queryset.exists()
+
+    def __getitem__(self, k):
+        return self.queryset[k]
+
+    def __getattr__(self, name):
+        return getattr(self.queryset, name)
+
+
+class PrefetchedQuerySetMixin:
+    """
+    Evaluate a QuerySet to a list of results which have been retrieved in advance, rather than querying the database.
+    Any QuerySet derived from it (e.g. by calling filter()) is evaluated normally.
+    """
+    def __init__(self, *args, results=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.results = results
+
+    def __iter__(self):
+        if self.results is None:
+            return super().__iter__()
+        return iter(self.results)
+
+    def __len__(self):
+        if self.results is None:
+            return super().__len__()
+        return len(self.results)
+
+    def __bool__(self):
+        if self.results is None:
+            return super().__bool__()
+        return bool(self.results)
+
+    def __getitem__(self, k):
+        if self.results is None:
+            return super().__getitem__(k)
+        return self.results[k]
+
+    def all(self):
+        queryset = super().all()
+        queryset.results = self.results
+        return queryset
+
+    def count(self):
+        if self.results is None:
+            return super().count()
+        return len(self.results)
+
+    def exists(self):
+        if self.results is None:
+            return super().exists()
+        return bool(self.results)
+
+    def first(self):
+        if self.results is None:
+            return super().first()
+        return self.results[0] if self.results else None
+
+    def last(self):
+        if self.results is None:
+            return super().last()
+        return self.results[-1] if self.results else None
+
+
+@cache
+def _get_prefetched_queryset_class(queryset_class):
+    return type(f'Prefetched{queryset_class.__name__}', (PrefetchedQuerySetMixin, queryset_class), {})
+
+
+def get_prefetched_queryset(queryset, results):
+    """
+    Return a copy of the given QuerySet which evaluates to the specified list of objects (retrieved in advance)
+    without querying the database. The copy retains the QuerySet's class and API: methods which derive a new QuerySet
+    (e.g. filter()) query the database as usual.
+
+    Args:
+        queryset: The QuerySet to copy
+        results: A list of the objects to which the QuerySet evaluates
+    """
+    queryset_class = _get_prefetched_queryset_class(type(queryset))
+    return queryset_class(model=queryset.model, query=queryset.query, using=queryset.db, results=list(results))
+
+
 def count_related(model, field):
     """
     Return a Subquery suitable for annotating a child object count.
@@ -54,3 +160,23 @@ def dict_to_filter_params(d, prefix=''):
         else:
             params[k] = val
     return params
+
+
+def get_estimated_count(queryset):
+    """
+    Return the number of rows which the database query planner estimates will be returned by the given QuerySet, if
+    the estimate meets or exceeds COUNT_ESTIMATE_THRESHOLD. Returns None if estimation has been disabled, or if the
+    estimate falls below the threshold (in which case an exact count should be obtained instead).
+    """
+    if not settings.COUNT_ESTIMATE_THRESHOLD or queryset.query.is_empty():
+        return None
+
+    # Obtain the planner's row estimate (derived from table statistics) for the unordered query
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    if isinstance(plan, list):
+        plan = plan[0]
+    estimate = int(plan['Plan']['Plan Rows'])
+
+    if estimate >= settings.COUNT_ESTIMATE_THRESHOLD:
+        return estimate
+    return None
@@ -1,7 +1,6 @@
 from django.db.models import Prefetch, QuerySet
 
-from users.constants import CONSTRAINT_TOKEN_USER
-from utilities.permissions import get_permission_for_model, permission_is_exempt, qs_filter_from_constraints
+from utilities.permissions import compile_constraints, get_permission_for_model, permission_is_exempt
 
 __all__ = (
     'RestrictedPrefetch',
@@ -58,13 +57,15 @@ class RestrictedQuerySet(QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
-            tokens = {
-                CONSTRAINT_TOKEN_USER: user,
-            }
-            attrs = qs_filter_from_constraints(user._object_perm_cache[permission_required], tokens)
-            # #8715: Avoid duplicates when JOIN on many-to-many fields without using DISTINCT.
-            # DISTINCT acts globally on the entire request, which may not be desirable.
-            allowed_objects = self.model.objects.filter(attrs)
-            qs = self.filter(pk__in=allowed_objects)
+            attrs, multivalued = compile_constraints(
+                self.model, user._object_perm_cache[permission_required], user
+            )
+            if multivalued:
+                # #8715: Avoid duplicates when JOIN on many-to-many fields without using DISTINCT.
+                # DISTINCT acts globally on the entire request, which may not be desirable.
+                allowed_objects = self.model.objects.filter(attrs)
+                qs = self.filter(pk__in=allowed_objects)
+            else:
+                qs = self.filter(attrs)
 
         return qs
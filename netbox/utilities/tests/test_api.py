@@ -1,3 +1,6 @@
+import json
+from unittest.mock import patch
+
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
@@ -7,6 +10,7 @@ from dcim.models import Region, Site
 from extras.choices import CustomFieldTypeChoices
 from extras.models import CustomField
 from ipam.models import VLAN
+from netbox.api.pagination import OptionalLimitOffsetPagination
 from netbox.config import get_config
 from utilities.testing import APITestCase, disable_warnings
 
@@ -180,12 +184,91 @@ class APIPaginationTestCase(APITestCase):
     def test_max_page_size_disabled(self):
         response = self.client.get(f'{self.url}?limit=0', format='json', **self.header)
 
+        # Unpaginated responses are streamed
         self.assertHttpStatus(response, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 100)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['count'], 100)
+        self.assertIsNone(data['next'])
+        self.assertIsNone(data['previous'])
+        self.assertEqual(len(data['results']), 100)
+
+    @override_settings(MAX_PAGE_SIZE=0)
+    @patch.object(OptionalLimitOffsetPagination, 'stream_chunk_size', 30)
+    def test_max_page_size_disabled_chunked(self):
+        response = self.client.get(f'{self.url}?limit=0&offset=5&brief=true', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['count'], 100)
+        self.assertEqual(
+            [site['id'] for site in data['results']],
+            list(Site.objects.values_list('pk', flat=True)[5:])
+        )
+
+    def test_count_disabled(self):
+        response = self.client.get(f'{self.url}?limit=10&offset=90&count=false', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIsNone(response.data['count'])
+        self.assertNotIn('X-Count-Estimated', response)
         self.assertIsNone(response.data['next'])
+        self.assertTrue(response.data['previous'].endswith('?count=false&limit=10&offset=80'))
+        self.assertEqual(len(response.data['results']), 10)
+
+        response = self.client.get(f'{self.url}?limit=10&offset=80&count=false', format='json', **self.header)
+        self.assertTrue(response.data['next'].endswith('?count=false&limit=10&offset=90'))
+
+    @override_settings(COUNT_ESTIMATE_THRESHOLD=1)
+    def test_count_estimated(self):
+        response = self.client.get(f'{self.url}?limit=10', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response['X-Count-Estimated'], 'true')
+        self.assertGreaterEqual(response.data['count'], 1)
+        self.assertTrue(response.data['next'].endswith('?limit=10&offset=10'))
+        self.assertEqual(len(response.data['results']), 10)
+
+    @override_settings(COUNT_ESTIMATE_THRESHOLD=1000000000)
+    def test_count_below_estimate_threshold(self):
+        response = self.client.get(f'{self.url}?limit=10', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response['X-Count-Estimated'], 'false')
+        self.assertEqual(response.data['count'], 100)
+
+    def test_keyset_pagination(self):
+        site_ids = list(Site.objects.order_by('pk').values_list('pk', flat=True))
+        response = self.client.get(f'{self.url}?start={site_ids[10]}&limit=10', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIsNone(response.data['count'])
+        self.assertTrue(response.data['next'].endswith(f'?limit=10&start={site_ids[19] + 1}'))
         self.assertIsNone(response.data['previous'])
+        self.assertEqual([site['id'] for site in response.data['results']], site_ids[10:20])
+
+    def test_keyset_pagination_last_page(self):
+        site_ids = list(Site.objects.order_by('pk').values_list('pk', flat=True))
+        response = self.client.get(f'{self.url}?start={site_ids[95]}&limit=10', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIsNone(response.data['next'])
+        self.assertEqual([site['id'] for site in response.data['results']], site_ids[95:])
+
+    @override_settings(MAX_PAGE_SIZE=0)
+    def test_keyset_pagination_disabled(self):
+        response = self.client.get(f'{self.url}?start=0&limit=0', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIsNone(response.data['count'])
+        self.assertIsNone(response.data['next'])
         self.assertEqual(len(response.data['results']), 100)
 
+    def test_keyset_pagination_invalid(self):
+        for query in ('start=foo', 'start=-1', 'start=1&offset=10', 'start=1&ordering=name'):
+            response = self.client.get(f'{self.url}?{query}', format='json', **self.header)
+            self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
 
 class APIOrderingTestCase(APITestCase):
     user_permissions = ('dcim.view_site',)
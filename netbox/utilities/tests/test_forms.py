@@ -1,9 +1,11 @@
 from django import forms
 from django.test import TestCase
 
+from dcim.models import Rack, Site
 from netbox.choices import ImportFormatChoices
 from utilities.forms.bulk_import import BulkImportForm
-from utilities.forms.forms import BulkRenameForm
+from utilities.forms.fields import CSVModelChoiceField, prefetch_csv_choices
+from utilities.forms.forms import BulkRenameForm, CSVModelForm
 from utilities.forms.utils import expand_alphanumeric_pattern, expand_ipaddress_pattern
 
 
@@ -376,6 +378,57 @@ class ImportFormTest(TestCase):
         ])
 
 
+class PrefetchCSVChoicesTest(TestCase):
+
+    class RackImportForm(CSVModelForm):
+        site = CSVModelChoiceField(
+            queryset=Site.objects.all(),
+            to_field_name='slug'
+        )
+
+        class Meta:
+            model = Rack
+            fields = ('name', 'site')
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+        ])
+
+    def test_prefetch_csv_choices(self):
+        records = [
+            {'name': 'Rack 1', 'site': 'site-1'},
+            {'name': 'Rack 2', 'site': 'site-2'},
+            {'name': 'Rack 3', 'site': 'site-3'},
+        ]
+
+        site = Site.objects.get(slug='site-1')
+
+        # Related objects for all records should be retrieved using a single query
+        with self.assertNumQueries(1):
+            with prefetch_csv_choices(self.RackImportForm(), records):
+                pass
+
+        with prefetch_csv_choices(self.RackImportForm(), records):
+            field = self.RackImportForm().fields['site']
+            with self.assertNumQueries(0):
+                self.assertEqual(field.clean('site-1'), site)
+                self.assertEqual(field.clean('site-2').slug, 'site-2')
+
+            # Values which were not prefetched fall back to querying the database
+            with self.assertNumQueries(1):
+                with self.assertRaises(forms.ValidationError):
+                    field.clean('site-3')
+
+            # A field with a modified queryset ignores the prefetched objects
+            field.queryset = Site.objects.filter(slug='site-2')
+            with self.assertNumQueries(1):
+                with self.assertRaises(forms.ValidationError):
+                    field.clean('site-1')
+
+
 class BulkRenameFormTest(TestCase):
     def test_no_strip_whitespace(self):
         # Tests to make sure Bulk Rename Form isn't stripping whitespaces
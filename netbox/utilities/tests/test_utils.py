@@ -1,7 +1,9 @@
 from django.http import QueryDict
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from dcim.models import Device
 from utilities.data import deepmerge
+from utilities.jinja2 import get_template, get_template_relations, render_jinja2, template_cache
 from utilities.query import dict_to_filter_params
 from utilities.querydict import normalize_querydict
 
@@ -130,3 +132,64 @@ class DeepMergeTest(TestCase):
             deepmerge(dict1, dict2),
             merged
         )
+
+
+class GetTemplateRelationsTest(TestCase):
+    """
+    Validate the identification of related objects referenced by a Jinja2 template.
+    """
+    def test_get_template_relations(self):
+        template_code = (
+            '{{ queryset.count() }}'
+            '{% for device in queryset %}'
+            '{{ device.name }} {{ device.site_id }} {{ device.site.name }} {{ device.site.region.name }} '
+            '{{ device.device_type.manufacturer }} {{ device.interfaces.count() }} '
+            '{% for tag in device.tags.all() %}{{ tag.name }}{% endfor %}'
+            '{% endfor %}'
+        )
+        select_related, prefetch_related = get_template_relations(template_code, Device)
+        self.assertEqual(select_related, ('device_type__manufacturer', 'site__region'))
+        self.assertEqual(prefetch_related, ('interfaces', 'tags'))
+
+    def test_get_template_relations_filtered(self):
+        template_code = (
+            '{% for device in queryset %}'
+            '{{ device.interfaces.filter(enabled=True).first() }} {{ device.tags.exclude(name="foo") }} '
+            '{{ device.site.tenant.name }} {{ device.site.asns.first() }}'
+            '{% endfor %}'
+        )
+        self.assertEqual(get_template_relations(template_code, Device), (('site__tenant',), ()))
+
+    def test_get_template_relations_other_variable(self):
+        template_code = '{% for device in devices %}{{ device.site.name }}{% endfor %}'
+        self.assertEqual(get_template_relations(template_code, Device), ((), ()))
+
+
+class TemplateCacheTest(TestCase):
+    """
+    Validate the caching of compiled Jinja2 templates.
+    """
+    def setUp(self):
+        template_cache.clear()
+
+    def test_render_cached_template(self):
+        self.assertEqual(render_jinja2('{{ foo }}', {'foo': 1}), '1')
+        self.assertEqual(render_jinja2('{{ foo }}', {'foo': 2}), '2')
+        self.assertEqual(len(template_cache), 1)
+        self.assertIs(get_template('{{ foo }}'), get_template('{{ foo }}'))
+        self.assertIsNot(get_template('{{ foo }}'), get_template('{{ foo }}', {'trim_blocks': True}))
+
+    @override_settings(JINJA2_TEMPLATE_CACHE_SIZE=2)
+    def test_evict_least_recently_used(self):
+        template1 = get_template('{{ foo }}')
+        get_template('{{ bar }}')
+        get_template('{{ foo }}')
+        get_template('{{ baz }}')
+        self.assertEqual(len(template_cache), 2)
+        self.assertIs(get_template('{{ foo }}'), template1)
+        self.assertEqual(len(template_cache), 2)
+
+    @override_settings(JINJA2_TEMPLATE_CACHE_SIZE=0)
+    def test_cache_disabled(self):
+        self.assertIsNot(get_template('{{ foo }}'), get_template('{{ foo }}'))
+        self.assertEqual(len(template_cache), 0)
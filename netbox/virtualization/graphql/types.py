@@ -5,6 +5,7 @@ import strawberry_django
 
 from extras.graphql.mixins import ConfigContextMixin, ContactsMixin
 from ipam.graphql.mixins import IPAddressesMixin, VLANGroupsMixin
+from netbox.graphql.optimizer import prefetch_generic_foreign_key
 from netbox.graphql.scalars import BigInt
 from netbox.graphql.types import OrganizationalObjectType, NetBoxObjectType
 from virtualization import models
@@ -40,7 +41,10 @@ class ClusterType(VLANGroupsMixin, NetBoxObjectType):
     virtual_machines: List[Annotated["VirtualMachineType", strawberry.lazy('virtualization.graphql.types')]]
     devices: List[Annotated["DeviceType", strawberry.lazy('dcim.graphql.types')]]
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['scope_type', 'scope_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.Cluster, 'scope')]
+    )
     def scope(self) -> Annotated[Union[
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RegionType", strawberry.lazy('dcim.graphql.types')],
@@ -4,6 +4,7 @@ import strawberry
 import strawberry_django
 
 from extras.graphql.mixins import ContactsMixin, CustomFieldsMixin, TagsMixin
+from netbox.graphql.optimizer import prefetch_generic_foreign_key
 from netbox.graphql.types import ObjectType, OrganizationalObjectType, NetBoxObjectType
 from vpn import models
 from .filters import *
@@ -131,7 +132,10 @@ class L2VPNType(ContactsMixin, NetBoxObjectType):
 class L2VPNTerminationType(NetBoxObjectType):
     l2vpn: Annotated["L2VPNType", strawberry.lazy('vpn.graphql.types')]
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['assigned_object_type', 'assigned_object_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.L2VPNTermination, 'assigned_object')]
+    )
     def assigned_object(self) -> Annotated[Union[
         Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')],
         Annotated["VLANType", strawberry.lazy('ipam.graphql.types')],
@@ -3,6 +3,7 @@ from typing import Annotated, List, Union
 import strawberry
 import strawberry_django
 
+from netbox.graphql.optimizer import prefetch_generic_foreign_key
 from netbox.graphql.types import OrganizationalObjectType, NetBoxObjectType
 from wireless import models
 from .filters import *
@@ -38,7 +39,10 @@ class WirelessLANType(NetBoxObjectType):
 
     interfaces: List[Annotated["InterfaceType", strawberry.lazy('dcim.graphql.types')]]
 
-    @strawberry_django.field
+    @strawberry_django.field(
+        only=['scope_type', 'scope_id'],
+        prefetch_related=[prefetch_generic_foreign_key(models.WirelessLAN, 'scope')]
+    )
     def scope(self) -> Annotated[Union[
         Annotated["LocationType", strawberry.lazy('dcim.graphql.types')],
         Annotated["RegionType", strawberry.lazy('dcim.graphql.types')],